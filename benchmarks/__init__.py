@@ -0,0 +1,4 @@
+"""Synthetic-data benchmarks for the model layer.
+
+Run with ``python -m benchmarks run --rows 10000``; see ``python -m benchmarks --help``.
+"""
@@ -0,0 +1,115 @@
+"""Command line for the benchmark suite: ``python -m benchmarks run --rows 100000``."""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks import harness, operations  # noqa: F401 — registers operations
+from benchmarks.generate import Sizes, prepare_database
+
+app = typer.Typer(help="Synthevix benchmark suite.", add_completion=False)
+console = Console()
+
+
+@app.command("list")
+def cmd_list():
+    """List registered operations."""
+    for name in sorted(harness.OPERATIONS):
+        console.print(f"  {name}")
+
+
+@app.command("run")
+def cmd_run(
+    rows: int = typer.Option(10_000, "--rows", "-n",
+                             help="Rows per table (brain, quests, moods, pomodoro)"),
+    brain: Optional[int] = typer.Option(None, "--brain", help="Override brain_entries row count"),
+    quests: Optional[int] = typer.Option(None, "--quests", help="Override quests row count"),
+    moods: Optional[int] = typer.Option(None, "--moods", help="Override mood_logs row count"),
+    coding_days: Optional[int] = typer.Option(None, "--coding-days",
+                                              help="Override coding_streaks days"),
+    seed: int = typer.Option(42, "--seed"),
+    only: Optional[List[str]] = typer.Option(None, "--only", "-k",
+                                             help="Substring filter on operation names"),
+    repeats: int = typer.Option(5, "--repeats", "-r"),
+    regenerate: bool = typer.Option(False, "--regenerate", help="Rebuild the cached database"),
+    save_baseline: bool = typer.Option(False, "--save-baseline",
+                                       help="Store results as the new baseline"),
+    threshold: float = typer.Option(harness.DEFAULT_THRESHOLD, "--threshold",
+                                    help="Relative slowdown flagged as a regression"),
+    json_out: Optional[Path] = typer.Option(None, "--json", help="Also write results to this file"),
+    fail_on_regression: bool = typer.Option(False, "--fail-on-regression",
+                                            help="Exit 1 if anything regressed"),
+):
+    """Generate (or reuse) a synthetic database and time every operation against it."""
+    sizes = Sizes.scaled(rows)
+    for field_name, value in (("brain", brain), ("quests", quests), ("moods", moods),
+                              ("coding_days", coding_days)):
+        if value is not None:
+            setattr(sizes, field_name, value)
+
+    start = time.perf_counter()
+    path = prepare_database(sizes, seed, regenerate)
+    console.print(f"  [dim]database {path} ready in {time.perf_counter() - start:.1f}s "
+                  f"({path.stat().st_size / 1_048_576:.1f} MB)[/dim]")
+
+    names = sorted(harness.OPERATIONS)
+    if only:
+        names = [n for n in names if any(k in n for k in only)]
+    results = harness.run(names, repeats=repeats)
+
+    label = str(rows)
+    comparisons = harness.compare(results, harness.load_baselines().get(label, {}), threshold)
+    _print(comparisons, label)
+
+    if json_out:
+        json_out.write_text(json.dumps({
+            "rows": rows, "seed": seed, "sizes": asdict(sizes),
+            "results": [asdict(r) for r in results],
+            "regressions": {c.result.name: c.flags for c in comparisons if c.regressed},
+        }, indent=2))
+    if save_baseline:
+        harness.save_baselines(label, results)
+        console.print(f"  [green]✓[/green]  Baseline for {label} rows saved to "
+                      f"{harness.BASELINES_PATH}")
+    if fail_on_regression and any(c.regressed for c in comparisons):
+        raise typer.Exit(1)
+
+
+def _delta(now: float, base: Optional[float]) -> str:
+    if not base:
+        return "[dim]—[/dim]"
+    pct = (now - base) / base * 100
+    return f"{pct:+.0f}%"
+
+
+def _print(comparisons: List[harness.Comparison], label: str) -> None:
+    table = Table(title=f"{label} rows", header_style="bold", border_style="dim")
+    table.add_column("Operation")
+    table.add_column("Median ms", justify="right")
+    table.add_column("Best ms", justify="right")
+    table.add_column("Δ time", justify="right")
+    table.add_column("Peak KB", justify="right")
+    table.add_column("Δ mem", justify="right")
+    table.add_column("")
+    for c in comparisons:
+        r, b = c.result, c.baseline
+        table.add_row(
+            r.name, f"{r.median_ms:.2f}", f"{r.best_ms:.2f}",
+            _delta(r.median_ms, b.median_ms if b else None),
+            f"{r.peak_kb:.0f}",
+            _delta(r.peak_kb, b.peak_kb if b else None),
+            f"[bold red]REGRESSION ({', '.join(c.flags)})[/bold red]" if c.regressed else "",
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,254 @@
+"""Reproducible synthetic data for benchmarks.
+
+Everything is derived from a seeded ``random.Random``, so the same sizes, seed
+and anchor always produce identical rows. Rows are spread over a multi-year
+window ending at ``anchor`` (default: now) so date-range and streak queries hit
+realistic slices.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import shutil
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from synthevix.brain import links, minhash, revisions, vectors
+from synthevix.core import database
+from synthevix.core.database import init_db, transaction
+
+# Vocabulary with a long tail so FTS queries have both common and rare terms.
+_WORDS = (
+    "python sqlite query index cache latency refactor deploy test branch commit "
+    "review design api schema migration backup journal idea meeting focus sleep "
+    "coffee run book music travel family project release bug fix feature docs "
+    "async thread process memory profile benchmark vector search graph tree "
+    "rust go typescript react linux docker kubernetes terraform postgres redis"
+).split()
+_TAGS = [f"tag{i}" for i in range(200)]
+_HOT_TAGS = ["work", "python", "ideas", "reading", "health", "til", "meeting", "todo"]
+_TYPES = ("note", "journal", "snippet", "bookmark")
+_LANGS = ("python", "rust", "go", "sql", "bash", "typescript")
+_DIFFICULTIES = ("trivial", "easy", "medium", "hard", "legendary")
+_QUEST_STATUS = ("completed",) * 6 + ("failed",) * 2 + ("active",) * 2
+# Entries with an edit history (brain_revisions), and how many edits each.
+_EDITED_EVERY = 100
+_EDITS = 12
+# About one journal entry or snippet in this many is long (word counts below),
+# so its content is compressed into brain_bodies.
+_LONG_EVERY = 50
+_LONG_WORDS = (2_000, 3_500)
+# About one entry in this many links to 1–3 earlier ones ([[id]] or [[title]]);
+# this share of the links goes to the first _HUBS entries, which collect backlinks.
+_LINK_EVERY = 4
+_HUB_SHARE = 0.3
+_HUBS = 20
+
+
+@dataclass
+class Sizes:
+    brain: int = 10_000
+    quests: int = 10_000
+    moods: int = 10_000
+    pomodoro: int = 10_000
+    coding_days: int = 3_650      # one row per day, so this is also the date span
+
+    @classmethod
+    def scaled(cls, rows: int) -> "Sizes":
+        # coding_streaks is keyed by date; cap at ~100 years of history.
+        return cls(brain=rows, quests=rows, moods=rows, pomodoro=rows,
+                   coding_days=min(rows, 36_500))
+
+
+def _ts(rng: random.Random, anchor: datetime, span_days: int) -> str:
+    return (anchor - timedelta(seconds=rng.randrange(span_days * 86_400))).strftime(
+        "%Y-%m-%d %H:%M:%S"
+    )
+
+
+def _text(rng: random.Random, lo: int, hi: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(lo, hi)))
+
+
+def _tags(rng: random.Random) -> str:
+    picked = set()
+    for _ in range(rng.choice((0, 1, 2, 2, 3, 3, 4))):
+        # ~60% of tags come from a small hot set, the rest from a long tail.
+        picked.add(rng.choice(_HOT_TAGS) if rng.random() < 0.6 else rng.choice(_TAGS))
+    return json.dumps(sorted(picked))
+
+
+def _links(rng: random.Random, titles: List[str]) -> str:
+    out = []
+    for _ in range(rng.randint(1, 3)):
+        hub = rng.random() < _HUB_SHARE
+        target = rng.randrange(min(_HUBS, len(titles)) if hub else len(titles))
+        out.append(f"[[{titles[target]}]]" if rng.random() < 0.5 else f"[[{target + 1}]]")
+    return " see " + " ".join(out)
+
+
+def _brain_rows(rng, n, anchor, span, long_rng, link_rng) -> Iterator[Tuple]:
+    # Long bodies and links come from their own generators so every other row stays as it was.
+    titles: List[str] = []
+    for _ in range(n):
+        kind = rng.choice(_TYPES)
+        created = _ts(rng, anchor, span)
+        title, content = _text(rng, 2, 8).capitalize(), _text(rng, 20, 300)
+        if kind in ("journal", "snippet") and long_rng.randrange(_LONG_EVERY) == 0:
+            content = _text(long_rng, *_LONG_WORDS)
+        if titles and link_rng.randrange(_LINK_EVERY) == 0:
+            content += _links(link_rng, titles)
+        titles.append(title)
+        yield (
+            kind,
+            title,
+            content,
+            _tags(rng),
+            rng.choice(_LANGS) if kind == "snippet" else None,
+            f"https://example.com/{rng.randrange(10**6)}" if kind == "bookmark" else None,
+            created,
+            created,
+        )
+
+
+def _edit_history(conn, rng: random.Random, n: int) -> None:
+    """Give every ``_EDITED_EVERY``-th entry ``_EDITS`` small edits, each recorded as a revision."""
+    for entry_id in range(_EDITED_EVERY, n + 1, _EDITED_EVERY):
+        words = conn.execute(
+            "SELECT content FROM brain_entries WHERE id = ?", (entry_id,)
+        ).fetchone()[0].split()
+        for _ in range(_EDITS):
+            old = " ".join(words)
+            at = rng.randrange(len(words) + 1)
+            edit = rng.random()
+            if edit < 0.4:
+                words[at:at + 1] = [rng.choice(_WORDS)]
+            elif edit < 0.8:
+                words[at:at] = _text(rng, 5, 20).split()
+            else:
+                del words[at:at + rng.randint(1, 10)]
+            revisions.record(conn, entry_id, old)
+        conn.execute(
+            "UPDATE brain_entries SET content = ? WHERE id = ?", (" ".join(words), entry_id)
+        )
+
+
+def _quest_rows(rng, n, anchor, span) -> Iterator[Tuple]:
+    for _ in range(n):
+        status = rng.choice(_QUEST_STATUS)
+        created = _ts(rng, anchor, span)
+        completed = None
+        if status != "active":
+            done = datetime.strptime(created, "%Y-%m-%d %H:%M:%S") + timedelta(
+                minutes=rng.randrange(60 * 24 * 7)
+            )
+            completed = min(done, anchor).strftime("%Y-%m-%d %H:%M:%S")
+        yield (
+            _text(rng, 3, 8).capitalize(),
+            rng.choice(_DIFFICULTIES),
+            status,
+            rng.randrange(0, 200) if status == "completed" else 0,
+            completed,
+            created,
+        )
+
+
+def _mood_rows(rng, n, anchor, span) -> Iterator[Tuple]:
+    for _ in range(n):
+        yield (
+            rng.randint(1, 6),
+            rng.randint(1, 10) if rng.random() < 0.8 else None,
+            _text(rng, 0, 12) or None,
+            _ts(rng, anchor, span),
+        )
+
+
+def _pomodoro_rows(rng, n, anchor, span, quests) -> Iterator[Tuple]:
+    for _ in range(n):
+        quest_id = rng.randint(1, quests) if quests and rng.random() < 0.5 else None
+        yield (rng.choice((15, 25, 25, 25, 50)), quest_id, _ts(rng, anchor, span))
+
+
+def _coding_rows(rng, n, anchor_day: date) -> Iterator[Tuple]:
+    for i in range(n):
+        commits = 0 if rng.random() < 0.15 else rng.randint(1, 25)
+        repos = json.dumps([f"/src/repo{rng.randrange(12)}" for _ in range(min(commits, 3))])
+        yield ((anchor_day - timedelta(days=i)).isoformat(), commits, repos)
+
+
+def populate(sizes: Sizes, seed: int = 42, anchor: Optional[datetime] = None) -> None:
+    """Fill the current ``DB_PATH`` with synthetic rows for every module."""
+    rng = random.Random(seed)
+    anchor = (anchor or datetime.now()).replace(microsecond=0)
+    span = max(sizes.coding_days, 365)
+
+    init_db()
+    with transaction() as conn:
+        conn.executemany("""
+            INSERT INTO brain_entries (type, title, content, tags, language, url,
+                                       created_at, updated_at, next_review_at)
+            VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, datetime(?7, '+1 day'))
+        """, _brain_rows(rng, sizes.brain, anchor, span,
+                       random.Random(seed + 1), random.Random(seed + 2)))
+        _edit_history(conn, rng, sizes.brain)
+        database.pack_bodies(conn)
+        vectors.rebuild(conn)
+        minhash.rebuild(conn)
+        links.rebuild(conn)
+        conn.executemany("""
+            INSERT INTO quests (title, difficulty, status, xp_earned, completed_at, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, _quest_rows(rng, sizes.quests, anchor, span))
+        conn.executemany("""
+            INSERT INTO mood_logs (mood, energy, note, logged_at) VALUES (?, ?, ?, ?)
+        """, _mood_rows(rng, sizes.moods, anchor, span))
+        conn.executemany("""
+            INSERT INTO pomodoro_sessions (duration_minutes, quest_id, completed_at)
+            VALUES (?, ?, ?)
+        """, _pomodoro_rows(rng, sizes.pomodoro, anchor, span, sizes.quests))
+        conn.executemany("""
+            INSERT OR REPLACE INTO coding_streaks (date, commits, repos) VALUES (?, ?, ?)
+        """, _coding_rows(rng, sizes.coding_days, anchor.date()))
+        conn.execute("""
+            UPDATE user_profile SET total_xp = ?, level = ?, current_streak = ?, longest_streak = ?
+            WHERE id = 1
+        """, (sizes.quests * 40, 30, 12, 40))
+    conn.execute("PRAGMA optimize")
+
+
+DATA_DIR = Path(__file__).with_name(".data")
+
+
+def use_database(directory: Path) -> Path:
+    """Point the app's storage paths at ``directory`` (as the test fixtures do)."""
+    database.close_connection()
+    database.SYNTHEVIX_DIR = directory
+    database.DB_PATH = directory / "data.db"
+    database.BACKUP_DIR = directory / "backups"
+    return database.DB_PATH
+
+
+def prepare_database(sizes: Sizes, seed: int = 42, regenerate: bool = False) -> Path:
+    """Return a populated database for ``sizes``/``seed``, generating it if needed.
+
+    Databases are cached under ``benchmarks/.data`` per day, because streak and
+    date-range queries are relative to today.
+    """
+    label = f"b{sizes.brain}-q{sizes.quests}-m{sizes.moods}-p{sizes.pomodoro}-c{sizes.coding_days}"
+    directory = DATA_DIR / f"{label}-s{seed}-{date.today():%Y%m%d}"
+    if regenerate and directory.exists():
+        shutil.rmtree(directory)
+    fresh = not (directory / "data.db").exists()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = use_database(directory)
+    if fresh:
+        for stale in DATA_DIR.glob(f"{label}-s{seed}-*"):
+            if stale != directory:
+                shutil.rmtree(stale, ignore_errors=True)
+        populate(sizes, seed)
+    else:
+        init_db()
+    return path
@@ -0,0 +1,158 @@
+"""Benchmark registry, runner and baseline comparison.
+
+Each operation is timed with ``time.perf_counter`` over several repeats (median
+and best are reported), then run once more under ``tracemalloc`` to record peak
+Python allocation. Timing and memory are measured in separate passes because
+tracemalloc slows allocation-heavy code down by several times.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+
+# A result is a regression when it is this much slower (or larger) than baseline.
+DEFAULT_THRESHOLD = 0.25
+# Ignore regressions smaller than this in absolute terms; sub-ms timings are noisy.
+MIN_DELTA_MS = 0.5
+MIN_DELTA_KB = 64.0
+
+
+@dataclass
+class Operation:
+    name: str
+    fn: Callable[[], object]
+    setup: Optional[Callable[[], None]] = None   # runs before each repeat, untimed
+    teardown: Optional[Callable[[], None]] = None
+
+
+@dataclass
+class Result:
+    name: str
+    median_ms: float
+    best_ms: float
+    peak_kb: float
+    repeats: int
+
+
+@dataclass
+class Comparison:
+    result: Result
+    baseline: Optional[Result]
+    threshold: float = DEFAULT_THRESHOLD
+    flags: List[str] = field(default_factory=list)
+
+    @property
+    def regressed(self) -> bool:
+        return bool(self.flags)
+
+
+OPERATIONS: Dict[str, Operation] = {}
+
+
+def operation(name: str, setup=None, teardown=None):
+    """Register ``fn`` as a benchmark operation."""
+    def decorator(fn):
+        OPERATIONS[name] = Operation(name, fn, setup, teardown)
+        return fn
+    return decorator
+
+
+def _once(op: Operation) -> float:
+    if op.setup:
+        op.setup()
+    try:
+        start = time.perf_counter()
+        op.fn()
+        return (time.perf_counter() - start) * 1000
+    finally:
+        if op.teardown:
+            op.teardown()
+
+
+def _peak_kb(op: Operation) -> float:
+    if op.setup:
+        op.setup()
+    tracemalloc.start()
+    try:
+        op.fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        if op.teardown:
+            op.teardown()
+    return peak / 1024
+
+
+def run_operation(op: Operation, repeats: int = 5, warmup: int = 1) -> Result:
+    for _ in range(warmup):
+        _once(op)
+    times = [_once(op) for _ in range(repeats)]
+    return Result(
+        name=op.name,
+        median_ms=round(statistics.median(times), 3),
+        best_ms=round(min(times), 3),
+        peak_kb=round(_peak_kb(op), 1),
+        repeats=repeats,
+    )
+
+
+def run(names: Optional[List[str]] = None, repeats: int = 5, warmup: int = 1) -> List[Result]:
+    selected = names or sorted(OPERATIONS)
+    unknown = [n for n in selected if n not in OPERATIONS]
+    if unknown:
+        raise KeyError(f"Unknown benchmark(s): {', '.join(unknown)}")
+    return [run_operation(OPERATIONS[n], repeats, warmup) for n in selected]
+
+
+# ── Baselines ──────────────────────────────────────────────────────────────────
+#
+# baselines.json: {"<rows>": {"<op name>": {median_ms, best_ms, peak_kb, repeats}}}
+
+def load_baselines(path: Path = BASELINES_PATH) -> Dict[str, Dict[str, Result]]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return {
+        size: {name: Result(name=name, **vals) for name, vals in ops.items()}
+        for size, ops in raw.items()
+    }
+
+
+def save_baselines(label: str, results: List[Result], path: Path = BASELINES_PATH) -> None:
+    """Merge ``results`` into the stored baselines under ``label`` (usually the row count)."""
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        raw = {}
+    section = raw.setdefault(label, {})
+    for r in results:
+        vals = asdict(r)
+        vals.pop("name")
+        section[r.name] = vals
+    path.write_text(json.dumps(raw, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def compare(results: List[Result], baselines: Dict[str, Result],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Comparison]:
+    comparisons = []
+    for r in results:
+        base = baselines.get(r.name)
+        cmp = Comparison(result=r, baseline=base, threshold=threshold)
+        if base:
+            if (r.median_ms > base.median_ms * (1 + threshold)
+                    and r.median_ms - base.median_ms >= MIN_DELTA_MS):
+                cmp.flags.append("time")
+            if (r.peak_kb > base.peak_kb * (1 + threshold)
+                    and r.peak_kb - base.peak_kb >= MIN_DELTA_KB):
+                cmp.flags.append("memory")
+        comparisons.append(cmp)
+    return comparisons
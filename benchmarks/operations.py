@@ -0,0 +1,242 @@
+"""The operations we track. Each one calls the public model API exactly as a command would."""
+
+from __future__ import annotations
+
+import shutil
+
+from benchmarks.harness import operation
+from synthevix.brain import models as brain
+from synthevix.core import database
+from synthevix.core.pagination import encode_cursor
+from synthevix.cosmos import models as cosmos
+from synthevix.forge import models as forge
+from synthevix.quest import achievements
+from synthevix.quest import models as quest
+
+
+# ── Brain ──────────────────────────────────────────────────────────────────────
+
+@operation("brain.search.common")
+def _search_common():
+    return brain.search_entries("python")
+
+
+@operation("brain.search.rare")
+def _search_rare():
+    return brain.search_entries("kubernetes terraform")
+
+
+@operation("brain.search.prefix")
+def _search_prefix():
+    return brain.search_entries("py*")
+
+
+@operation("brain.search.substring")
+def _search_substring():
+    # A rare fragment: LIKE has to read most of the table to find 20 of these.
+    return brain.search_entries("ag199", mode="substring")
+
+
+@operation("brain.search.fuzzy")
+def _search_fuzzy():
+    return brain.search_entries("kubernets", mode="fuzzy")
+
+
+@operation("brain.search.like")
+def _search_like():
+    # Reference point for the trigram index: the unindexed LIKE scan it replaces.
+    return brain._like_search(database.connection(), "ag199", 20)
+
+
+@operation("brain.list")
+def _list():
+    return brain.list_entry_summaries()
+
+
+_deep: dict = {}
+
+
+def _deep_cursor(table: str, key: str) -> None:
+    """Cursor 100 rows from the oldest end of ``table``, i.e. its last pages (untimed)."""
+    row = database.connection().execute(
+        f"SELECT * FROM {table} ORDER BY {key}, id LIMIT 1 OFFSET 100"
+    ).fetchone()
+    _deep[table] = encode_cursor(row[key], row["id"]) if row else None
+
+
+@operation("brain.list.deep", setup=lambda: _deep_cursor("brain_entries", "created_at"))
+def _list_deep():
+    return brain.list_entry_summaries(after=_deep["brain_entries"])
+
+
+@operation("brain.list.tag_hot")
+def _list_tag_hot():
+    return brain.list_entry_summaries(tag_filter="python")
+
+
+@operation("brain.list.tag_rare")
+def _list_tag_rare():
+    return brain.list_entry_summaries(tag_filter="tag137")
+
+
+@operation("brain.list.tags_all")
+def _list_tags_all():
+    return brain.list_entry_summaries(tag_filter=["python", "work"])
+
+
+@operation("brain.list.tags_any")
+def _list_tags_any():
+    return brain.list_entry_summaries(tag_filter=["tag137", "tag138"], tag_match="any")
+
+
+@operation("brain.tags")
+def _tags():
+    return brain.list_tags()
+
+
+@operation("brain.random")
+def _random():
+    return brain.random_entry()
+
+
+@operation("brain.related")
+def _related():
+    return brain.related_entries(1)
+
+
+@operation("brain.backlinks")
+def _backlinks():
+    # Entry 1 is one of the generator's link hubs.
+    return brain.backlinks(1)
+
+
+@operation("brain.graph")
+def _graph():
+    return brain.link_graph(100, depth=2)
+
+
+@operation("brain.graph.hub")
+def _graph_hub():
+    return brain.link_graph(1, depth=2)
+
+
+@operation("brain.duplicates.check")
+def _duplicates_check():
+    entry = brain.get_entry(1)
+    return brain.find_near_duplicates(entry["content"], entry["url"], exclude=1)
+
+
+@operation("brain.dedupe")
+def _dedupe():
+    return brain.duplicate_clusters()
+
+
+@operation("brain.history")
+def _history():
+    return brain.entry_history(100)
+
+
+@operation("brain.revision")
+def _revision():
+    # Revision 8 sits at the end of the longest delta chain (keyframes at 1 and 9).
+    return brain.entry_revision(100, 8)
+
+
+@operation("brain.review.due")
+def _review_due():
+    return brain.due_entries(), brain.count_due()
+
+
+@operation("brain.resurface")
+def _resurface():
+    return brain.resurface_entry()
+
+
+@operation("brain.count")
+def _count():
+    return brain.count_entries()
+
+
+@operation("brain.stats")
+def _stats():
+    return brain.brain_stats()
+
+
+def _clear_exports():
+    shutil.rmtree(database.SYNTHEVIX_DIR / "exports", ignore_errors=True)
+
+
+@operation("brain.export.md", teardown=_clear_exports)
+def _export_md():
+    return brain.export_entries("md")
+
+
+@operation("brain.export.json", teardown=_clear_exports)
+def _export_json():
+    return brain.export_entries("json")
+
+
+@operation("brain.export.jsonl", teardown=_clear_exports)
+def _export_jsonl():
+    return brain.export_entries("jsonl")
+
+
+# ── Quest ──────────────────────────────────────────────────────────────────────
+
+def _reset_achievements():
+    with database.transaction() as conn:
+        conn.execute("DELETE FROM user_achievements")
+
+
+@operation("quest.achievements.check", setup=_reset_achievements)
+def _check_and_unlock():
+    return achievements.check_and_unlock(quest.get_profile())
+
+
+@operation("quest.list")
+def _quest_list():
+    return quest.list_quest_summaries()
+
+
+@operation("quest.history")
+def _quest_history():
+    return quest.get_quest_history_summaries(last="30d")
+
+
+@operation("quest.history.deep", setup=lambda: _deep_cursor("quests", "created_at"))
+def _quest_history_deep():
+    return quest.get_quest_history_summaries(after=_deep["quests"])
+
+
+@operation("quest.pomodoro.today")
+def _pomodoro_today():
+    return quest.get_today_pomodoro_count()
+
+
+# ── Cosmos ─────────────────────────────────────────────────────────────────────
+
+@operation("cosmos.mood.stats")
+def _mood_stats():
+    return cosmos.get_mood_stats(days=30)
+
+
+@operation("cosmos.mood.today")
+def _mood_today():
+    return cosmos.get_today_mood()
+
+
+@operation("cosmos.mood.history")
+def _mood_history():
+    return cosmos.get_mood_summaries(days=30)
+
+
+# ── Forge ──────────────────────────────────────────────────────────────────────
+
+@operation("forge.streak.current")
+def _coding_streak():
+    return forge.get_current_coding_streak()
+
+
+@operation("forge.streak.heatmap")
+def _streak_data():
+    return forge.get_streak_days(days=90)
@@ -0,0 +1,100 @@
+"""Backup management commands."""
+
+from __future__ import annotations
+
+import typer
+from rich.console import Console
+from rich.progress import BarColumn, Progress, TextColumn
+from rich.table import Table
+
+from synthevix.core import backup
+from synthevix.core.config import load_config
+from synthevix.core.database import init_db
+from synthevix.core.themes import get_theme_data
+from synthevix.core.utils import format_bytes
+
+app = typer.Typer(name="backup", help="💾 Create, list, and prune database backups.")
+console = Console()
+
+
+def _theme_color() -> str:
+    return get_theme_data(load_config().theme.active)["primary"]
+
+
+def _policy() -> backup.RetentionPolicy:
+    cfg = load_config().backup
+    return backup.RetentionPolicy(keep_daily=cfg.keep_daily, keep_weekly=cfg.keep_weekly)
+
+
+@app.callback(invoke_without_command=True)
+def backup_create(ctx: typer.Context):
+    """Snapshot data.db (run without a sub-command), then apply the retention policy."""
+    if ctx.invoked_subcommand is not None:
+        return
+    init_db()
+    color = _theme_color()
+    columns = (TextColumn("  Backing up"), BarColumn())
+    with Progress(*columns, transient=True, console=console) as progress:
+        task = progress.add_task("backup", total=None)
+        record = backup.create_backup(
+            progress=lambda done, total: progress.update(task, completed=done, total=total),
+        )
+    if record is None:
+        console.print("  [dim]No database yet — nothing to back up.[/dim]")
+        return
+    removed = backup.prune_backups(_policy())
+    console.print(
+        f"  [bold {color}]✓[/bold {color}]  Backup {record.id} "
+        f"({format_bytes(record.size)} → {format_bytes(record.stored_size)}) at {record.path}"
+    )
+    if removed:
+        console.print(f"  [dim]Pruned {len(removed)} old backup(s).[/dim]")
+
+
+@app.command("list")
+def backup_list():
+    """Show all backups, newest first."""
+    records = backup.list_backups()
+    if not records:
+        console.print(
+            "  [dim]No backups yet. Run [cyan]synthevix backup[/cyan] to create one.[/dim]"
+        )
+        return
+    color = _theme_color()
+    table = Table(header_style=f"bold {color}", border_style="dim")
+    table.add_column("ID", no_wrap=True)
+    table.add_column("Created", no_wrap=True)
+    table.add_column("Reason")
+    table.add_column("Size", justify="right", no_wrap=True)
+    table.add_column("Stored", justify="right", no_wrap=True)
+    table.add_column("Object", no_wrap=True)
+    for r in records:
+        table.add_row(
+            r.id, r.created_at.replace("T", " "), r.reason, format_bytes(r.size),
+            format_bytes(r.stored_size) if r.stored_size else "—",
+            r.sha256[:8] if r.sha256 else r.path.name,
+        )
+    console.print(table)
+
+
+@app.command("prune")
+def backup_prune(
+    keep_daily: int = typer.Option(None, "--keep-daily", help="Override backup.keep_daily"),
+    keep_weekly: int = typer.Option(None, "--keep-weekly", help="Override backup.keep_weekly"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be removed"),
+):
+    """Remove backups outside the retention policy."""
+    policy = _policy()
+    if keep_daily is not None:
+        policy.keep_daily = keep_daily
+    if keep_weekly is not None:
+        policy.keep_weekly = keep_weekly
+    removed = backup.prune_backups(policy, dry_run=dry_run)
+    color = _theme_color()
+    if not removed:
+        console.print(f"  [bold {color}]✓[/bold {color}]  Nothing to prune.")
+        return
+    verb = "Would remove" if dry_run else "Removed"
+    for r in removed:
+        console.print(f"  [dim]{verb} {r.id} ({r.created_at.replace('T', ' ')})[/dim]")
+    console.print(f"  [bold {color}]✓[/bold {color}]  {verb} {len(removed)} backup(s).")
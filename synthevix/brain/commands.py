@@ -17,6 +17,8 @@ from synthevix.brain import models
 from synthevix.brain.display import print_entries_table, print_entry_detail, print_tags_table
 
 app = typer.Typer(name="brain", help="🧠  Personal knowledge base — notes, journals, snippets, bookmarks.")
+index_app = typer.Typer(help="Inspect and rebuild the full-text search index.")
+app.add_typer(index_app, name="index")
 
 console = Console()
 
@@ -33,6 +35,8 @@ def cmd_add(
     tag: Optional[str] = typer.Option(None, "--tag", "-g", help="Comma-separated tags"),
     language: Optional[str] = typer.Option(None, "--lang", help="Language for snippets (e.g. python)"),
     url: Optional[str] = typer.Option(None, "--url", help="URL for bookmarks"),
+    force: bool = typer.Option(False, "--force", "-f",
+                               help="Save without checking for near-duplicates"),
     content: Optional[str] = typer.Argument(None, help="Entry content (opens editor if omitted)"),
 ):
     """Add a new brain entry."""
@@ -56,6 +60,19 @@ def cmd_add(
         console.print("[bold yellow]Empty content, entry not saved.[/bold yellow]")
         raise typer.Exit(0)
 
+    if not force and not models.duplicate_index_built():
+        console.print("[dim]Skipped the near-duplicate check: run "
+                      "`synthevix brain index rebuild` once to enable it.[/dim]")
+    elif not force:
+        duplicates = models.find_near_duplicates(content, url)
+        if duplicates:
+            from synthevix.brain.display import print_related
+            console.print()
+            print_related(duplicates[:5], console, _theme_color(), title="Possible duplicates")
+            if not Confirm.ask("Save anyway?", default=False):
+                console.print("[dim]Cancelled.[/dim]")
+                return
+
     tags = [t.strip() for t in tag.split(",")] if tag else []
     entry_id = models.add_entry(
         type=type, content=content, title=title,
@@ -68,24 +85,110 @@ def cmd_add(
 @app.command("list")
 def cmd_list(
     type: Optional[str] = typer.Option(None, "--type", "-t", help="Filter by type"),
-    tag: Optional[str] = typer.Option(None, "--tag", "-g", help="Filter by tag"),
+    tag: Optional[str] = typer.Option(None, "--tag", "-g",
+                                      help="Filter by tags (comma-separated, all must match)"),
+    any_tag: bool = typer.Option(False, "--any", help="Match entries with any of the --tag tags"),
     last: Optional[str] = typer.Option(None, "--last", help="Show entries from last N days/weeks (e.g. 7d, 2w)"),
-    limit: int = typer.Option(50, "--limit", "-n", help="Max number of entries to show"),
+    limit: int = typer.Option(50, "--limit", "-n", help="Entries per page"),
+    after: Optional[str] = typer.Option(None, "--after",
+                                        help="Continue from a cursor printed by a previous page"),
+    page: bool = typer.Option(False, "--page", "-p", help="Page through results interactively"),
 ):
     """List brain entries with optional filters."""
-    entries = models.list_entries(type_filter=type, tag_filter=tag, last=last, limit=limit)
-    console.print()
-    print_entries_table(entries, console, _theme_color())
+    from synthevix.core.pagination import show_pages
+
+    tags = [t.strip() for t in tag.split(",") if t.strip()] if tag else None
+    color = _theme_color()
+
+    def fetch(cursor):
+        return models.list_entry_summaries_page(
+            type_filter=type, tag_filter=tags, last=last, limit=limit,
+            tag_match="any" if any_tag else "all", after=cursor,
+        )
+
+    def render(entries):
+        console.print()
+        print_entries_table(entries, console, color)
+
+    try:
+        show_pages(fetch, render, console, after=after, interactive=page)
+    except ValueError as e:
+        console.print(f"[bold red]{e}[/bold red]")
+        raise typer.Exit(1)
 
 
 @app.command("search")
 def cmd_search(
-    query: str = typer.Argument(..., help="Search query"),
+    query: str = typer.Argument(
+        ..., help='Search query: words, "phrases", pref*, -exclude, a OR b, title:word'
+    ),
+    limit: int = typer.Option(20, "--limit", "-n", help="Max number of results"),
+    substring: bool = typer.Option(
+        False, "--substring", "-s",
+        help="Match text inside words (identifiers, URLs, partial words)",
+    ),
+    fuzzy: bool = typer.Option(False, "--fuzzy", help="Tolerate typos: closest trigram matches"),
 ):
-    """Full-text search across all brain entries."""
-    entries = models.search_entries(query)
+    """Ranked full-text search across all brain entries."""
+    from synthevix.brain.display import print_search_results
+    mode = "fuzzy" if fuzzy else "substring" if substring else "words"
+    entries = models.search_entries(query, limit=limit, mode=mode)
+    if not entries and mode == "words":
+        # No whole-word hit: the term may sit inside a word (getConn, a URL path).
+        entries = models.search_entries(query, limit=limit, mode="substring")
+        if entries:
+            console.print("\n  [dim]No whole-word matches; showing substring matches.[/dim]")
+    console.print()
+    print_search_results(entries, console, _theme_color())
+
+
+@index_app.command("stats")
+def cmd_index_stats():
+    """Show how much space the search indexes take next to the entries themselves."""
+    from synthevix.brain.display import print_index_stats
+    console.print()
+    print_index_stats(models.index_stats(), console, _theme_color())
     console.print()
-    print_entries_table(entries, console, _theme_color())
+
+
+@index_app.command("rebuild")
+def cmd_index_rebuild(
+    detail: Optional[str] = typer.Option(
+        None, "--detail", help="full (phrase queries) | column (smaller); saved to config"
+    ),
+):
+    """Rebuild the word index (with brain.fts_detail), related-notes vectors and
+    duplicate signatures."""
+    from synthevix.core.config import save_config
+    from synthevix.core.database import FTS_DETAILS
+    from synthevix.core.utils import format_bytes
+
+    cfg = load_config()
+    detail = detail or cfg.brain.fts_detail
+    if detail not in FTS_DETAILS:
+        console.print(
+            f"[bold red]Invalid detail '{detail}'. Use: {', '.join(FTS_DETAILS)}.[/bold red]"
+        )
+        raise typer.Exit(1)
+
+    before = {r["name"]: r["bytes"] for r in models.index_stats()}
+    with console.status("  Rebuilding search index…"):
+        vectors = models.rebuild_related_index()
+        models.rebuild_duplicate_index()
+        models.rebuild_search_index(detail)  # last: it VACUUMs
+    # Only once the index really has the new detail.
+    if detail != cfg.brain.fts_detail:
+        cfg.brain.fts_detail = detail
+        save_config(cfg)
+    after = {r["name"]: r["bytes"] for r in models.index_stats()}
+
+    color = _theme_color()
+    console.print(
+        f"\n  [bold {color}]✓[/bold {color}]  Rebuilt brain_fts (detail={detail}): "
+        f"{format_bytes(before.get('brain_fts', 0))} → {format_bytes(after.get('brain_fts', 0))}"
+    )
+    console.print(f"  [bold {color}]✓[/bold {color}]  "
+                  f"Recomputed related-notes vectors for {vectors} entries\n")
 
 
 @app.command("view")
@@ -97,7 +200,80 @@ def cmd_view(
     if not entry:
         console.print(f"[bold red]No entry found with ID {entry_id}.[/bold red]")
         raise typer.Exit(1)
-    print_entry_detail(entry, console, _theme_color())
+    color = _theme_color()
+    print_entry_detail(entry, console, color)
+    related = models.related_entries(entry_id, limit=3)
+    if related:
+        from synthevix.brain.display import print_related
+        print_related(related, console, color)
+    backlinks = models.backlinks(entry_id)
+    if backlinks:
+        from synthevix.brain.display import print_backlinks
+        print_backlinks(backlinks, console, color)
+
+
+@app.command("graph")
+def cmd_graph(
+    entry_id: int = typer.Argument(..., help="Entry ID to start from"),
+    depth: int = typer.Option(2, "--depth", "-d", help="How many links away to follow (1–5)"),
+):
+    """Show the entries linked to and from an entry with [[id]] / [[title]] links."""
+    from synthevix.brain.display import print_link_graph
+    try:
+        nodes = models.link_graph(entry_id, depth=depth)
+    except ValueError as e:
+        console.print(f"[bold red]{e}[/bold red]")
+        raise typer.Exit(1)
+    if not nodes:
+        console.print(f"[bold red]No entry found with ID {entry_id}.[/bold red]")
+        raise typer.Exit(1)
+    console.print()
+    print_link_graph(nodes, console, _theme_color())
+    console.print()
+
+
+@app.command("related")
+def cmd_related(
+    entry_id: int = typer.Argument(..., help="Entry ID to find related entries for"),
+    limit: int = typer.Option(10, "--limit", "-n", help="Max number of results"),
+):
+    """List the entries most similar to an entry (local TF-IDF, no network)."""
+    from synthevix.brain.display import print_related
+    if not models.get_entry(entry_id):
+        console.print(f"[bold red]No entry found with ID {entry_id}.[/bold red]")
+        raise typer.Exit(1)
+    if not models.related_index_built():
+        with console.status("  Building the related-entries index (first run)…"):
+            models.rebuild_related_index()
+    console.print()
+    print_related(models.related_entries(entry_id, limit=limit), console, _theme_color())
+    console.print()
+
+
+@app.command("dedupe")
+def cmd_dedupe(
+    yes: bool = typer.Option(False, "--yes", "-y", help="Merge every group without asking"),
+):
+    """Find groups of near-duplicate entries and merge each into its oldest entry."""
+    color = _theme_color()
+    status = ("  Looking for near-duplicates…" if models.duplicate_index_built()
+              else "  Building the near-duplicate index (first run)…")
+    with console.status(status):
+        groups = models.duplicate_clusters()
+    if not groups:
+        console.print(f"\n  [bold {color}]✓[/bold {color}]  No near-duplicates found.\n")
+        return
+
+    console.print(f"\n  [dim]{len(groups)} group(s) of near-duplicates.[/dim]\n")
+    merged = 0
+    for group in groups:
+        keep, others = group[0], group[1:]
+        print_entries_table(group, console, color)
+        question = f"Merge {len(others)} into #{keep.id} (tags are kept)?"
+        if yes or Confirm.ask(question, default=False):
+            merged += models.merge_entries(keep.id, [e.id for e in others])
+        console.print()
+    console.print(f"  [bold {color}]✓[/bold {color}]  Merged {merged} duplicate entries.\n")
 
 
 @app.command("edit")
@@ -130,6 +306,61 @@ def cmd_edit(
     console.print(f"\n  [bold {color}]✓[/bold {color}]  Entry #{entry_id} updated.\n")
 
 
+@app.command("history")
+def cmd_history(
+    entry_id: int = typer.Argument(..., help="Entry ID"),
+    rev: Optional[int] = typer.Option(None, "--rev", "-r",
+                                      help="Show the content of this revision"),
+):
+    """List an entry's earlier versions, or show one of them."""
+    from rich.panel import Panel
+    from rich.text import Text
+    from synthevix.brain.display import print_history
+
+    entry = models.get_entry(entry_id)
+    if not entry:
+        console.print(f"[bold red]No entry found with ID {entry_id}.[/bold red]")
+        raise typer.Exit(1)
+    color = _theme_color()
+    if rev is None:
+        console.print()
+        print_history(entry, models.entry_history(entry_id), console, color)
+        console.print()
+        return
+
+    text = models.entry_revision(entry_id, rev)
+    if text is None:
+        console.print(f"[bold red]Entry #{entry_id} has no revision {rev}.[/bold red]")
+        raise typer.Exit(1)
+    title = f"[bold {color}]#{entry_id} · revision {rev}[/bold {color}]"
+    console.print(Panel(Text(text), title=title, border_style=color))
+
+
+@app.command("restore")
+def cmd_restore(
+    entry_id: int = typer.Argument(..., help="Entry ID"),
+    rev: int = typer.Option(..., "--rev", "-r", help="Revision to restore (see `brain history`)"),
+    force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
+):
+    """Bring back an earlier version of an entry's content (the current one is
+    kept as a revision)."""
+    if not models.get_entry(entry_id):
+        console.print(f"[bold red]No entry found with ID {entry_id}.[/bold red]")
+        raise typer.Exit(1)
+    if models.entry_revision(entry_id, rev) is None:
+        console.print(f"[bold red]Entry #{entry_id} has no revision {rev}.[/bold red]")
+        raise typer.Exit(1)
+    if not force and not Confirm.ask(f"Restore entry #{entry_id} to revision {rev}?"):
+        console.print("[dim]Cancelled.[/dim]")
+        return
+
+    models.restore_revision(entry_id, rev)
+    color = _theme_color()
+    console.print(
+        f"\n  [bold {color}]✓[/bold {color}]  Entry #{entry_id} restored to revision {rev}.\n"
+    )
+
+
 @app.command("delete")
 def cmd_delete(
     entry_id: int = typer.Argument(..., help="Entry ID to delete"),
@@ -165,20 +396,93 @@ def cmd_tags(
         print_tags_table(tags, console, _theme_color())
 
 
+@app.command("stats")
+def cmd_stats(
+    top: int = typer.Option(10, "--top", "-n", help="How many of the most used tags to show"),
+):
+    """Entry counts and content size by type, language and tag."""
+    from synthevix.brain.display import print_brain_stats
+    console.print()
+    print_brain_stats(models.brain_stats(top), console, _theme_color())
+    console.print()
+
+
 @app.command("export")
 def cmd_export(
-    format: str = typer.Option("md", "--format", "-f", help="Export format: md | json"),
+    format: str = typer.Option("md", "--format", "-f", help="Export format: md | json | jsonl"),
     type: Optional[str] = typer.Option(None, "--type", "-t", help="Filter by entry type"),
+    since: Optional[str] = typer.Option(
+        None, "--since", help="Only entries updated since a date (YYYY-MM-DD) or duration (7d)"
+    ),
+    compress: Optional[str] = typer.Option(None, "--compress", "-z",
+                                           help="Compress output: gz | xz"),
 ):
-    """Export brain entries to Markdown or JSON."""
-    if format not in ("md", "json"):
-        console.print("[bold red]Invalid format. Use 'md' or 'json'.[/bold red]")
+    """Export brain entries to Markdown, JSON or JSONL."""
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
+
+    if format not in models.EXPORT_FORMATS:
+        console.print(
+            f"[bold red]Invalid format. Use: {', '.join(models.EXPORT_FORMATS)}.[/bold red]"
+        )
+        raise typer.Exit(1)
+    if compress is not None and compress not in models.EXPORT_COMPRESSION:
+        choices = ", ".join(models.EXPORT_COMPRESSION)
+        console.print(f"[bold red]Invalid compression. Use: {choices}.[/bold red]")
         raise typer.Exit(1)
-    path = models.export_entries(format=format, type_filter=type)
+
+    with Progress(TextColumn("  Exporting"), BarColumn(), MofNCompleteColumn(),
+                  transient=True, console=console) as progress:
+        task = progress.add_task("export", total=None)
+        path = models.export_entries(
+            format=format, type_filter=type, updated_since=since, compress=compress,
+            progress=lambda done, total: progress.update(task, completed=done, total=total),
+        )
     color = _theme_color()
     console.print(f"\n[bold {color}]✓ Exported to:[/bold {color}] {path}")
 
 
+@app.command("import")
+def cmd_import(
+    source: str = typer.Argument(
+        ..., help="Folder of .md files, a single .md file, or a .jsonl[.gz|.xz] file"
+    ),
+    batch: int = typer.Option(1000, "--batch", help="Rows per executemany batch"),
+    live_index: bool = typer.Option(
+        False, "--live-index",
+        help="Keep the search/tag triggers firing per row instead of indexing once at the end",
+    ),
+):
+    """Bulk-import entries from Markdown (with front-matter) or JSONL."""
+    from pathlib import Path
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from synthevix.brain.importer import ImportReport, read_source
+
+    path = Path(source).expanduser()
+    if not path.exists():
+        console.print(f"[bold red]No such file or folder: {path}[/bold red]")
+        raise typer.Exit(1)
+
+    report = ImportReport()
+    with Progress(SpinnerColumn(), TextColumn("  Importing… {task.completed} entries"),
+                  transient=True, console=console) as progress:
+        task = progress.add_task("import", total=None)
+        count = models.import_entries(
+            read_source(path, report), batch_size=batch, defer_indexes=not live_index,
+            progress=lambda done: progress.update(task, completed=done),
+        )
+
+    color = _theme_color()
+    console.print(f"\n  [bold {color}]✓[/bold {color}]  Imported {count} entries from {path}")
+    if report.skipped:
+        console.print(f"  [yellow]Skipped {len(report.skipped)}:[/yellow]")
+        for where, reason in report.skipped[:10]:
+            console.print(f"    [dim]{where}: {reason}[/dim]")
+        if len(report.skipped) > 10:
+            console.print(f"    [dim]… and {len(report.skipped) - 10} more[/dim]")
+    console.print()
+
+
 @app.command("random")
 def cmd_random():
     """Surface a random past entry for review."""
@@ -187,3 +491,34 @@ def cmd_random():
         console.print("[dim]No entries yet. Add some with `synthevix brain add`.[/dim]")
         return
     print_entry_detail(entry, console, _theme_color())
+
+
+@app.command("review")
+def cmd_review(
+    limit: int = typer.Option(10, "--limit", "-n", help="Max entries to review this session"),
+):
+    """Spaced-repetition review of entries that are due."""
+    color = _theme_color()
+    due = models.due_entries(limit)
+    if not due:
+        console.print(f"\n  [bold {color}]✓[/bold {color}]  Nothing due for review.\n")
+        return
+
+    total = models.count_due()
+    console.print(f"\n  [dim]{total} due — reviewing {len(due)}.[/dim]\n")
+    grades = {"g": "good", "e": "easy", "a": "again"}
+    reviewed = 0
+    for entry in due:
+        print_entry_detail(entry, console, color)
+        choice = Prompt.ask("  [g]ood · [e]asy · [a]gain · [s]kip · [q]uit",
+                            choices=["g", "e", "a", "s", "q"], default="g", show_choices=False)
+        if choice == "q":
+            break
+        if choice == "s":
+            continue
+        next_review = models.review_entry(entry["id"], grades[choice])
+        if next_review is None:  # deleted since the queue was read
+            continue
+        console.print(f"  [dim]Next review: {next_review[:10]}[/dim]\n")
+        reviewed += 1
+    console.print(f"  [bold {color}]✓[/bold {color}]  Reviewed {reviewed} of {total} due.\n")
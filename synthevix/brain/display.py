@@ -2,21 +2,31 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 from rich.syntax import Syntax
 from rich.text import Text
 
-from synthevix.core.utils import format_date, format_relative, parse_tags, truncate_text
+from synthevix.core.utils import (
+    format_bytes,
+    format_date,
+    format_relative,
+    parse_tags,
+    truncate_text,
+)
+
+if TYPE_CHECKING:
+    from synthevix.brain.models import EntrySummary
 
 ENTRY_TITLE_WIDTH = 42
 TAG_CELL_WIDTH = 24
 
 
-def print_entries_table(entries: List[dict], console: Console, theme_color: str) -> None:
+def print_entries_table(entries: List[EntrySummary], console: Console, theme_color: str) -> None:
     """Display a list of brain entries as a Rich table."""
     if not entries:
         console.print(Panel("[dim]No entries found.[/dim]", border_style=theme_color))
@@ -48,18 +58,18 @@ def print_entries_table(entries: List[dict], console: Console, theme_color: str)
     }
 
     for e in entries:
-        t = e.get("type", "note")
+        t = e.type
         color = type_colors.get(t, "white")
         icon = type_icons.get(t, "•")
         label = f"[{color}]{icon}  {t}[/{color}]"
 
-        preview = e.get("title") or truncate_text(e.get("content", ""), ENTRY_TITLE_WIDTH)
-        tags_list = parse_tags(e.get("tags", "[]"))
+        preview = e.title or truncate_text(e.preview, ENTRY_TITLE_WIDTH)
+        tags_list = parse_tags(e.tags)
         tags_str = ", ".join(f"#{tag}" for tag in tags_list) if tags_list else "—"
-        date_str = format_relative(e.get("created_at"))
+        date_str = format_relative(e.created_at)
 
         table.add_row(
-            str(e["id"]),
+            str(e.id),
             label,
             truncate_text(preview, ENTRY_TITLE_WIDTH),
             truncate_text(tags_str, TAG_CELL_WIDTH),
@@ -69,6 +79,46 @@ def print_entries_table(entries: List[dict], console: Console, theme_color: str)
     console.print(table)
 
 
+def _highlighted(marked: str, style: str) -> Text:
+    """Rich Text from a highlight()/snippet() string, styling the marked matches."""
+    from synthevix.brain.fts import HIGHLIGHT_END, HIGHLIGHT_START
+
+    text = Text(no_wrap=False)
+    for i, part in enumerate(marked.replace("\n", " ").split(HIGHLIGHT_START)):
+        hit, _, rest = part.partition(HIGHLIGHT_END) if i else ("", "", part)
+        text.append(hit, style=style)
+        text.append(rest)
+    return text
+
+
+def print_search_results(entries: List[dict], console: Console, theme_color: str) -> None:
+    """Display ranked search hits with highlighted titles and content snippets."""
+    if not entries:
+        console.print(Panel("[dim]No entries found.[/dim]", border_style=theme_color))
+        return
+
+    table = Table(show_header=True, header_style=f"bold {theme_color}", border_style="dim")
+    table.add_column("ID", style="bold", width=4, justify="right")
+    table.add_column("Title", width=28, justify="left")
+    table.add_column("Match", width=ENTRY_TITLE_WIDTH + 8, justify="left")
+    table.add_column("Tags", width=TAG_CELL_WIDTH, justify="left")
+
+    hit = f"bold {theme_color}"
+    for e in entries:
+        title = e.get("title_hl") or e.get("title") or e.get("type", "note").capitalize()
+        snippet = e.get("snippet") or truncate_text(e.get("content", ""), ENTRY_TITLE_WIDTH + 8)
+        tags_list = parse_tags(e.get("tags", "[]"))
+        tags_str = ", ".join(f"#{tag}" for tag in tags_list) if tags_list else "—"
+        table.add_row(
+            str(e["id"]),
+            _highlighted(title, hit),
+            _highlighted(snippet, hit),
+            Text(truncate_text(tags_str, TAG_CELL_WIDTH)),
+        )
+
+    console.print(table)
+
+
 def print_entry_detail(entry: dict, console: Console, theme_color: str) -> None:
     """Display a single brain entry in a detailed panel."""
     t = entry.get("type", "note")
@@ -113,6 +163,90 @@ def print_entry_detail(entry: dict, console: Console, theme_color: str) -> None:
         ))
 
 
+def print_related(entries: List[dict], console: Console, theme_color: str,
+                  title: str = "Related") -> None:
+    """Display entries similar to another one, with their similarity."""
+    if not entries:
+        console.print("[dim]No related entries yet.[/dim]")
+        return
+
+    table = Table(header_style=f"bold {theme_color}", border_style="dim", title=title,
+                  title_style=f"bold {theme_color}")
+    table.add_column("ID", style="dim", width=5)
+    table.add_column("Type", width=10)
+    table.add_column("Title", style="bold")
+    table.add_column("Match", justify="right")
+
+    for e in entries:
+        label = _label(e.get("title"), e.get("content"))
+        table.add_row(str(e["id"]), e["type"], label, f"{e['similarity']:.0%}")
+
+    console.print(table)
+
+
+def _label(title: Optional[str], preview: Optional[str]) -> str:
+    return escape(title or truncate_text((preview or "").replace("\n", " "), 50))
+
+
+def print_backlinks(entries: List[EntrySummary], console: Console, theme_color: str,
+                    limit: int = 10) -> None:
+    """List the entries linking to one, newest first."""
+    if not entries:
+        return
+    console.print(
+        f"  [bold {theme_color}]Linked from[/bold {theme_color}] [dim]({len(entries)})[/dim]"
+    )
+    for e in entries[:limit]:
+        console.print(f"  [dim]← #{e.id}[/dim]  {_label(e.title, e.preview)}", highlight=False)
+    if len(entries) > limit:
+        console.print(f"  [dim]… and {len(entries) - limit} more[/dim]")
+
+
+def print_link_graph(nodes: List[dict], console: Console, theme_color: str) -> None:
+    """Display an entry's link neighbourhood as a tree: → links to, ← linked from."""
+    from rich.tree import Tree
+
+    def label(n: dict) -> str:
+        arrow = "" if n["depth"] == 0 else ("→ " if n["outgoing"] else "← ")
+        return f"[dim]{arrow}#{n['id']}[/dim]  {_label(n['title'], n['preview'])}"
+
+    root = nodes[0]
+    tree = Tree(f"[bold {theme_color}]{label(root)}[/bold {theme_color}]")
+    branches = {root["id"]: tree}
+    for n in nodes[1:]:
+        branches[n["id"]] = branches[n["parent"]].add(label(n))
+    console.print(tree, highlight=False)
+    if len(nodes) == 1:
+        console.print("[dim]No links to or from this entry yet.[/dim]")
+
+
+def print_history(entry: dict, history: List[dict], console: Console, theme_color: str) -> None:
+    """Display an entry's earlier revisions and what storing them costs next to full copies."""
+    if not history:
+        console.print(f"[dim]Entry #{entry['id']} has not been edited yet.[/dim]")
+        return
+
+    table = Table(header_style=f"bold {theme_color}", border_style="dim",
+                  title=f"History of #{entry['id']}", title_style=f"bold {theme_color}")
+    table.add_column("Rev", style="bold", justify="right")
+    table.add_column("Written")
+    table.add_column("Size", justify="right")
+    table.add_column("Stored", justify="right")
+    table.add_column("As", style="dim")
+
+    for r in history:
+        table.add_row(str(r["rev"]), format_date(r["created_at"]), format_bytes(r["size"]),
+                      format_bytes(r["stored"]), "keyframe" if r["keyframe"] else "delta")
+    size = len((entry.get("content") or "").encode())
+    table.add_row("now", format_date(entry.get("updated_at")), format_bytes(size), "—", "current",
+                  style="dim")
+    console.print(table)
+
+    stored, full = sum(r["stored"] for r in history), sum(r["size"] for r in history)
+    console.print(f"  [dim]{len(history)} revisions in {format_bytes(stored)} "
+                  f"(full copies: {format_bytes(full)})[/dim]")
+
+
 def print_tags_table(tags: List[dict], console: Console, theme_color: str) -> None:
     """Display all tags with counts."""
     if not tags:
@@ -129,6 +263,47 @@ def print_tags_table(tags: List[dict], console: Console, theme_color: str) -> No
     console.print(table)
 
 
+def print_index_stats(stats: List[dict], console: Console, theme_color: str) -> None:
+    """Display the size of each search index next to the content it covers."""
+    table = Table(header_style=f"bold {theme_color}", border_style="dim")
+    table.add_column("Table", style="cyan")
+    table.add_column("Size", justify="right", style="bold")
+    table.add_column("× content", justify="right")
+    table.add_column("Detail")
+    table.add_column("Prefix")
+
+    for row in stats:
+        ratio = f"{row['ratio']:.2f}" if "ratio" in row else "—"
+        table.add_row(row["name"], format_bytes(row["bytes"]), ratio,
+                      row.get("detail", "—"), row.get("prefix") or "—")
+
+    console.print(table)
+
+
+def print_brain_stats(stats: dict, console: Console, theme_color: str) -> None:
+    """Display entry counts and content size overall, per type, per language and
+    for the top tags."""
+    console.print(
+        f"  [bold {theme_color}]{stats['entries']:,}[/bold {theme_color}] entries · "
+        f"[bold]{format_bytes(stats['bytes'])}[/bold] of content · "
+        f"[bold]{stats['tags']:,}[/bold] tags\n"
+    )
+    for heading, rows in (("Type", stats["types"]), ("Language", stats["languages"])):
+        if not rows:
+            continue
+        table = Table(header_style=f"bold {theme_color}", border_style="dim")
+        table.add_column(heading, style="cyan")
+        table.add_column("Entries", justify="right", style="bold")
+        table.add_column("Content", justify="right")
+        for row in rows:
+            table.add_row(row["name"], f"{row['count']:,}", format_bytes(row["bytes"]))
+        console.print(table)
+    if stats["top_tags"]:
+        console.print(Text("  Top tags: ", style="dim") + Text("  ".join(
+            f"#{t['tag']} ({t['count']:,})" for t in stats["top_tags"]
+        ), style="cyan"))
+
+
 def print_tag_cloud(tags: List[dict], console: Console, theme_color: str) -> None:
     """Display tags as a randomized size cloud based on count."""
     if not tags:
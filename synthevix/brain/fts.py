@@ -0,0 +1,128 @@
+"""Brain module — translate user search input into safe FTS5 query syntax.
+
+Word searches go to ``brain_fts``; substring and fuzzy searches go to the
+``brain_trigram`` index (see ``to_substring_query`` / ``to_fuzzy_query``).
+
+Every term is emitted as a quoted FTS5 string, so quotes, hyphens, colons and
+other punctuation can never produce a syntax error. A small, forgiving syntax
+is understood on top of plain words:
+
+    "exact phrase"    phrase match
+    pyth*             prefix match
+    -word             exclude entries containing word
+    a OR b            either term (plain juxtaposition means AND)
+    title:word        restrict to a column (title, content, tags)
+
+An index built with ``detail=column`` can't answer phrase queries, so for it
+(``phrases=False``) a multi-word phrase degrades to all of its words.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import List, Optional
+
+COLUMNS = ("title", "content", "tags")
+
+# Markers wrapped around matches by highlight()/snippet(); display code swaps
+# them for markup after escaping the text, so entry content can't inject any.
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+
+_TOKEN = re.compile(
+    r'(?P<neg>-)?(?:(?P<col>\w+):)?(?:"(?P<phrase>[^"]*)"?(?P<pstar>\*)?|(?P<word>[^\s"]+))'
+)
+
+
+def _quote(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _words_term(body: str, prefix: bool) -> str:
+    """``body`` as ANDed words instead of a phrase; a prefix applies to the last word."""
+    words = re.findall(r"\w+", body)
+    terms = [_quote(w) for w in words]
+    if prefix:
+        terms[-1] += " *"
+    return terms[0] if len(terms) == 1 else "(" + " AND ".join(terms) + ")"
+
+
+def to_fts_query(text: str, phrases: bool = True) -> Optional[str]:
+    """Return an FTS5 MATCH expression for ``text``, or None if it has no searchable terms."""
+    groups: List[List[str]] = []
+    excluded: List[str] = []
+    join_or = negate_next = False
+
+    for m in _TOKEN.finditer(text):
+        word, phrase, col = m.group("word"), m.group("phrase"), m.group("col")
+        if word in ("OR", "AND", "NOT") and not m.group("neg") and not col:
+            join_or = word == "OR" and bool(groups)
+            negate_next = word == "NOT"
+            continue
+
+        if col and col.lower() not in COLUMNS:
+            # Not a column filter ("http://x", "c:drive"): search the whole token.
+            word = f"{col}:{word}" if word is not None else word
+            phrase = f"{col} {phrase}" if phrase is not None else phrase
+            col = None
+
+        prefix = bool(m.group("pstar"))
+        body = phrase if phrase is not None else word
+        if word is not None and word.endswith("*"):
+            body, prefix = word.rstrip("*"), True
+        if not re.search(r"\w", body or ""):
+            continue
+
+        term = _quote(body) + (" *" if prefix else "") if phrases else _words_term(body, prefix)
+        if col:
+            term = f"{col.lower()} : {term}"
+
+        if m.group("neg") or negate_next:
+            excluded.append(term)
+        elif join_or:
+            groups[-1].append(term)
+        else:
+            groups.append([term])
+        join_or = negate_next = False
+
+    if not groups:
+        return None  # FTS5 has no "everything except"; a lone -word matches nothing
+    expr = " AND ".join(g[0] if len(g) == 1 else "(" + " OR ".join(g) + ")" for g in groups)
+    if excluded:
+        expr = f"({expr})" + "".join(f" NOT {t}" for t in excluded)
+    return expr
+
+
+# ── Trigram (substring / fuzzy) queries ────────────────────────────────────────
+
+_SUBSTRING_TOKEN = re.compile(r'"([^"]*)"?|(\S+)')
+
+
+def trigrams(text: str) -> List[str]:
+    """Distinct lower-cased 3-character windows of each word in ``text``."""
+    seen: dict = {}
+    for word in text.lower().split():
+        for i in range(len(word) - 2):
+            seen.setdefault(word[i:i + 3], None)
+    return list(seen)
+
+
+def to_substring_query(text: str) -> Optional[str]:
+    """brain_trigram MATCH expression requiring every term as a substring.
+
+    Terms shorter than three characters can't use the trigram index and are
+    dropped; None means nothing indexable is left.
+    """
+    terms = [(m.group(1) if m.group(1) is not None else m.group(2))
+             for m in _SUBSTRING_TOKEN.finditer(text)]
+    terms = [t for t in terms if len(t) >= 3]
+    return " AND ".join(_quote(t) for t in terms) or None
+
+
+def to_fuzzy_query(text: str) -> Optional[str]:
+    """brain_trigram MATCH expression for entries sharing any trigram with ``text``.
+
+    bm25 then ranks entries sharing more (and rarer) trigrams first, so a
+    misspelt word still finds its closest matches.
+    """
+    return " OR ".join(_quote(t) for t in trigrams(text)) or None
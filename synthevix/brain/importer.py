@@ -0,0 +1,181 @@
+"""Brain module — readers for bulk import (Markdown folders and JSONL files).
+
+Readers yield entry dicts lazily, so ``models.import_entries`` can batch them
+straight into the database without holding a whole export in memory.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from synthevix.brain.models import ENTRY_TYPES
+from synthevix.core.utils import parse_tags
+
+_FIELDS = ("type", "title", "content", "tags", "language", "url", "created_at", "updated_at")
+# Front-matter keys other tools commonly use for the same thing.
+_ALIASES = {"date": "created_at", "created": "created_at", "updated": "updated_at",
+            "lang": "language", "kind": "type"}
+
+
+@dataclass
+class ImportReport:
+    """Records skipped while reading, as (source, reason) pairs."""
+
+    skipped: List[Tuple[str, str]] = field(default_factory=list)
+
+
+def _clean(raw: dict, source: str, report: ImportReport) -> Optional[dict]:
+    entry = {_ALIASES.get(k, k): v for k, v in raw.items()}
+    entry = {k: entry[k] for k in _FIELDS if entry.get(k) not in (None, "")}
+    if not isinstance(entry.get("content", ""), str):
+        report.skipped.append((source, "content is not text"))
+        return None
+    if not isinstance(entry.get("tags", []), (str, list)):
+        report.skipped.append((source, "tags are not a list or text"))
+        return None
+    if not entry.get("content", "").strip():
+        report.skipped.append((source, "empty content"))
+        return None
+    entry.setdefault("type", "note")
+    if entry["type"] not in ENTRY_TYPES:
+        report.skipped.append((source, f"unknown type '{entry['type']}'"))
+        return None
+    tags = entry.get("tags") or []
+    if isinstance(tags, str):
+        tags = parse_tags(tags) if tags.startswith("[") else tags.split(",")
+    entry["tags"] = [str(t).strip() for t in tags if str(t).strip()]
+    for key in ("created_at", "updated_at"):
+        if key not in entry:
+            continue
+        stamp = _timestamp(entry[key])
+        if stamp is None:
+            report.skipped.append((source, f"invalid {key} '{entry[key]}'"))
+            return None
+        entry[key] = stamp
+    return entry
+
+
+def _timestamp(value) -> Optional[str]:
+    """``value`` as SQLite's CURRENT_TIMESTAMP writes it (UTC, ``YYYY-MM-DD HH:MM:SS``), or None.
+
+    Accepts ISO 8601 dates and times, with ``T`` or a space and an optional
+    ``Z``/offset; times without one are taken as they are.
+    """
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _front_matter(text: str) -> Tuple[dict, str]:
+    """Split simple ``---`` delimited ``key: value`` front-matter from the body.
+
+    Supports inline lists (``tags: [a, b]``) and block lists (``- a``); this is
+    the subset note-taking tools emit, not full YAML.
+    """
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return {}, text
+    try:
+        end = next(i for i in range(1, len(lines)) if lines[i].strip() in ("---", "..."))
+    except StopIteration:
+        return {}, text
+
+    meta: dict = {}
+    key = None
+    for line in lines[1:end]:
+        stripped = line.strip()
+        if key and stripped.startswith("- ") and isinstance(meta.setdefault(key, []), list):
+            meta[key].append(stripped[2:].strip().strip("'\""))
+            continue
+        if ":" not in line:
+            continue
+        key, value = (part.strip() for part in line.split(":", 1))
+        key = key.lower()
+        if value.startswith("[") and value.endswith("]"):
+            meta[key] = [v.strip().strip("'\"") for v in value[1:-1].split(",") if v.strip()]
+        elif value:
+            meta[key] = value.strip("'\"")
+    return meta, "\n".join(lines[end + 1:]).strip()
+
+
+def _read_markdown(path: Path, report: ImportReport) -> Optional[dict]:
+    """One entry from a Markdown file; title falls back to the first ``# heading``,
+    then the name."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        report.skipped.append((str(path), str(e)))
+        return None
+    meta, body = _front_matter(text)
+    if "title" not in meta:
+        first = body.split("\n", 1)
+        if first[0].startswith("# "):
+            meta["title"] = first[0][2:].strip()
+            body = first[1].strip() if len(first) > 1 else ""
+        else:
+            meta["title"] = path.stem
+    meta["content"] = body
+    return _clean(meta, str(path), report)
+
+
+def read_markdown_dir(root: Path, report: Optional[ImportReport] = None) -> Iterator[dict]:
+    """Yield one entry per ``*.md`` file under ``root`` (recursively, in path order)."""
+    report = report if report is not None else ImportReport()
+    for path in sorted(Path(root).rglob("*.md")):
+        entry = _read_markdown(path, report)
+        if entry:
+            yield entry
+
+
+def read_jsonl(path: Path, report: Optional[ImportReport] = None) -> Iterator[dict]:
+    """Yield one entry per JSON object line (the ``brain export --format jsonl`` layout).
+
+    ``.gz`` and ``.xz`` files are decompressed on the fly.
+    """
+    report = report if report is not None else ImportReport()
+    suffix = Path(path).suffix.lower()
+    opener: Callable[..., Any]
+    if suffix == ".gz":
+        import gzip
+        opener = gzip.open
+    elif suffix == ".xz":
+        import lzma
+        opener = lzma.open
+    else:
+        opener = open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            source = f"{path}:{lineno}"
+            try:
+                raw = json.loads(line)
+            except ValueError as e:
+                report.skipped.append((source, f"invalid JSON: {e}"))
+                continue
+            if not isinstance(raw, dict):
+                report.skipped.append((source, "not a JSON object"))
+                continue
+            entry = _clean(raw, source, report)
+            if entry:
+                yield entry
+
+
+def read_source(path: Path, report: Optional[ImportReport] = None) -> Iterator[dict]:
+    """Dispatch on ``path``: a directory of Markdown, a single ``.md`` file, or JSONL."""
+    path = Path(path)
+    report = report if report is not None else ImportReport()
+    if path.is_dir():
+        return read_markdown_dir(path, report)
+    if path.suffix.lower() == ".md":
+        entry = _read_markdown(path, report)
+        return iter([entry] if entry else [])
+    return read_jsonl(path, report)
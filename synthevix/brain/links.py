@@ -0,0 +1,150 @@
+"""Brain module — wiki links between entries and the backlink index.
+
+``[[123]]`` in an entry's content links to entry #123 and ``[[Some title]]``
+to the entry with that title (ignoring case; the oldest one if several share
+it). Every link is a row of ``brain_links`` — source, target and, for title
+links, the title — kept current as entries are added, edited and deleted, so
+backlinks and the link graph are index lookups instead of content scans.
+
+A title link to an entry that does not exist yet is kept without a target and
+picks one up when an entry gets that title. Renaming or deleting an entry moves
+the title links pointing at it to the next entry with that title, if any.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+
+MAX_DEPTH = 5
+_BATCH = 1000
+
+_LINK = re.compile(r"\[\[([^\[\]\n]+)\]\]")
+_ID = re.compile(r"[0-9]+")
+
+
+def parse(text: str) -> Tuple[Set[int], List[str]]:
+    """Entry ids and titles linked from ``text``, each once."""
+    ids: Set[int] = set()
+    titles: dict = {}
+    for m in _LINK.finditer(text or ""):
+        target = m.group(1).strip()
+        if _ID.fullmatch(target):
+            ids.add(int(target))
+        elif target:
+            titles.setdefault(target.lower(), target)
+    return ids, list(titles.values())
+
+
+def _existing(conn: sqlite3.Connection, ids: Sequence[int]) -> Set[int]:
+    found: Set[int] = set()
+    for i in range(0, len(ids), 500):
+        chunk = ids[i:i + 500]
+        found.update(r[0] for r in conn.execute(
+            f"SELECT id FROM brain_entries WHERE id IN ({','.join('?' * len(chunk))})", chunk
+        ))
+    return found
+
+
+def _titled(conn: sqlite3.Connection, title: str):
+    return conn.execute(
+        "SELECT MIN(id) FROM brain_entries WHERE title = ? COLLATE NOCASE", (title,)
+    ).fetchone()[0]
+
+
+def index_entries(conn: sqlite3.Connection, entries: Iterable[dict]) -> int:
+    """Replace the links from each entry (``id`` and ``content``) with the ones its
+    content has now."""
+    parsed = [(e["id"], *parse(e["content"])) for e in entries]
+    if not parsed:
+        return 0
+    conn.executemany("DELETE FROM brain_links WHERE src_id = ?", [(src,) for src, _, _ in parsed])
+    existing = _existing(conn, sorted({i for _, ids, _ in parsed for i in ids}))
+    rows: List[Tuple[int, Optional[int], Optional[str]]] = [
+        (src, i, None) for src, ids, _ in parsed for i in sorted(ids & existing) if i != src
+    ]
+    rows += [(src, _titled(conn, t), t) for src, _, titles in parsed for t in titles]
+    conn.executemany("INSERT INTO brain_links (src_id, dst_id, title) VALUES (?, ?, ?)", rows)
+    return len(rows)
+
+
+def retitled(conn: sqlite3.Connection, entry_id: int, title: str | None) -> None:
+    """Point title links at ``entry_id`` after it was given ``title`` (or lost its old one)."""
+    conn.execute("""
+        UPDATE brain_links
+        SET dst_id = (SELECT MIN(e.id) FROM brain_entries e WHERE brain_links.title = e.title)
+        WHERE dst_id = ? AND title IS NOT NULL
+    """, (entry_id,))
+    if title:
+        conn.execute("""
+            UPDATE brain_links SET dst_id = ?1 WHERE title = ?2 AND (dst_id IS NULL OR dst_id > ?1)
+        """, (entry_id, title))
+
+
+def remove_entries(conn: sqlite3.Connection, entry_ids: Sequence[int]) -> None:
+    """Drop links from and to deleted entries; title links move to the next entry with the title."""
+    params = [(i,) for i in entry_ids]
+    conn.executemany("DELETE FROM brain_links WHERE src_id = ?", params)
+    conn.executemany("DELETE FROM brain_links WHERE dst_id = ? AND title IS NULL", params)
+    for entry_id in entry_ids:
+        retitled(conn, entry_id, None)
+
+
+def index_new_entries(conn: sqlite3.Connection, after_id: int) -> int:
+    """Add the links of entries whose id is above ``after_id`` and point waiting
+    title links at them."""
+    count = 0
+    while batch := [dict(r) for r in conn.execute(
+        "SELECT id, content FROM brain_text WHERE id > ? ORDER BY id LIMIT ?", (after_id, _BATCH)
+    )]:
+        count += index_entries(conn, [e for e in batch if "[[" in e["content"]])
+        after_id = batch[-1]["id"]
+    conn.execute("""
+        UPDATE brain_links
+        SET dst_id = (SELECT MIN(e.id) FROM brain_entries e WHERE brain_links.title = e.title)
+        WHERE dst_id IS NULL
+    """)
+    return count
+
+
+def rebuild(conn: sqlite3.Connection) -> int:
+    """Re-parse every entry's links; returns the number of links."""
+    conn.execute("DELETE FROM brain_links")
+    return index_new_entries(conn, 0)
+
+
+def backlinks(conn: sqlite3.Connection, entry_id: int) -> List[int]:
+    """Ids of the entries linking to ``entry_id``."""
+    return [r[0] for r in conn.execute(
+        "SELECT DISTINCT src_id FROM brain_links WHERE dst_id = ?1 AND src_id != ?1", (entry_id,)
+    )]
+
+
+def neighbourhood(conn: sqlite3.Connection, entry_id: int, depth: int) -> List[tuple]:
+    """Entries within ``depth`` links of ``entry_id`` in either direction, nearest first.
+
+    Each is (id, depth, parent, outgoing): ``parent`` is an entry one step
+    closer that links to it or from it, and ``outgoing`` whether that link
+    leads from ``parent`` to it. The walk itself keeps only (id, depth), so an
+    entry reached many ways is expanded once per depth, not once per path.
+    """
+    return conn.execute("""
+        WITH RECURSIVE walk(id, depth) AS (
+            SELECT ?1, 0
+            UNION
+            SELECT l.dst_id, w.depth + 1 FROM walk w JOIN brain_links l ON l.src_id = w.id
+            WHERE w.depth < ?2 AND l.dst_id IS NOT NULL
+            UNION
+            SELECT l.src_id, w.depth + 1 FROM walk w JOIN brain_links l ON l.dst_id = w.id
+            WHERE w.depth < ?2
+        ),
+        nearest(id, depth) AS (SELECT id, MIN(depth) FROM walk GROUP BY id)
+        SELECT n.id, n.depth, MIN(p.id) AS parent, l.dst_id = n.id AS outgoing
+        FROM nearest n
+        LEFT JOIN brain_links l ON n.depth > 0 AND (l.dst_id = n.id OR l.src_id = n.id)
+        LEFT JOIN nearest p
+          ON p.depth = n.depth - 1 AND p.id = IIF(l.dst_id = n.id, l.src_id, l.dst_id)
+        WHERE n.depth = 0 OR p.id IS NOT NULL
+        GROUP BY n.id ORDER BY n.depth, parent, n.id
+    """, (entry_id, depth)).fetchall()
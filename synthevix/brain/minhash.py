@@ -0,0 +1,214 @@
+"""Brain module — near-duplicate detection with MinHash signatures and LSH banding.
+
+An entry's content (plus its URL) is cut into overlapping 3-word shingles.
+One-permutation MinHash hashes each shingle once, sends it to one of
+``PERMUTATIONS`` bins and keeps each bin's minimum; empty bins borrow from the
+next filled one (rotation densification), so every signature is comparable.
+The share of equal bins between two signatures estimates their Jaccard
+similarity.
+
+Signatures live in ``brain_minhash``. ``brain_lsh`` indexes ``BANDS`` bucket
+keys per entry, each hashing ``ROWS`` consecutive bins. Entries that are
+similar enough almost always share a bucket, so a lookup is ``BANDS`` primary
+key seeks regardless of how big the brain is, and clustering is one pass over
+the buckets.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+import zlib
+from array import array
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+PERMUTATIONS = 64
+BANDS, ROWS = 16, 4                # BANDS × ROWS == PERMUTATIONS; ~50% similarity to share a bucket
+DUPLICATE_THRESHOLD = 0.7          # estimated Jaccard similarity reported as a near-duplicate
+SHINGLE_WORDS = 3
+_BATCH = 1000
+_ROTATION = 0x9E3779B9             # offset per bin a densified value travelled
+_MASK = 0xFFFFFFFF
+
+# brain_minhash row marking the index as built (its signature is empty).
+_BUILT = 0
+
+_TOKEN = re.compile(r"\w+")
+
+
+def entry_text(entry: dict) -> str:
+    return f"{entry.get('content') or ''} {entry.get('url') or ''}"
+
+
+def shingles(text: str) -> set:
+    tokens = _TOKEN.findall(text.lower())
+    if len(tokens) <= SHINGLE_WORDS:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i:i + SHINGLE_WORDS]) for i in range(len(tokens) - SHINGLE_WORDS + 1)}
+
+
+def signature(text: str) -> array:
+    """One-permutation MinHash of ``text``: ``PERMUTATIONS`` 32-bit values."""
+    bins: List[Optional[int]] = [None] * PERMUTATIONS
+    for shingle in shingles(text):
+        h = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "little")
+        slot, value = h % PERMUTATIONS, (h // PERMUTATIONS) & _MASK
+        current = bins[slot]
+        if current is None or value < current:
+            bins[slot] = value
+    if all(b is None for b in bins):
+        return array("I", [_MASK] * PERMUTATIONS)
+    filled = list(bins)
+    for i in range(PERMUTATIONS):
+        distance = 1
+        while filled[i] is None:
+            source = bins[(i + distance) % PERMUTATIONS]
+            if source is not None:
+                filled[i] = (source + distance * _ROTATION) & _MASK
+            distance += 1
+    return array("I", filled)
+
+
+def similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of the texts behind two signatures."""
+    return sum(x == y for x, y in zip(a, b)) / PERMUTATIONS
+
+
+def buckets(sig: array) -> List[Tuple[int, int]]:
+    """(band, bucket key) pairs for ``sig``."""
+    return [
+        (band, zlib.crc32(sig[band * ROWS:(band + 1) * ROWS].tobytes())) for band in range(BANDS)
+    ]
+
+
+# ── Index maintenance ─────────────────────────────────────────────────────────
+
+def is_built(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM brain_minhash WHERE entry_id = ?", (_BUILT,)
+    ).fetchone() is not None
+
+
+def remove_entries(conn: sqlite3.Connection, entry_ids: Sequence[int]) -> None:
+    for entry_id in entry_ids:
+        row = conn.execute(
+            "SELECT signature FROM brain_minhash WHERE entry_id = ?", (entry_id,)
+        ).fetchone()
+        if row is None:
+            continue
+        conn.executemany("DELETE FROM brain_lsh WHERE band = ? AND bucket = ? AND entry_id = ?",
+                         [(band, key, entry_id) for band, key in buckets(array("I", row[0]))])
+        conn.execute("DELETE FROM brain_minhash WHERE entry_id = ?", (entry_id,))
+
+
+def index_entries(conn: sqlite3.Connection, entries: Iterable[dict]) -> int:
+    """(Re)index entries (dicts with id, content, url); a no-op until the index is built.
+
+    Entries without a single word are left out: all their signatures are equal,
+    so they would all be reported as duplicates of each other.
+    """
+    if not is_built(conn):
+        return 0
+    entries = list(entries)
+    remove_entries(conn, [e["id"] for e in entries])
+    texts = [(e["id"], entry_text(e)) for e in entries]
+    sigs = [(i, signature(text)) for i, text in texts if shingles(text)]
+    conn.executemany("INSERT INTO brain_minhash (entry_id, signature) VALUES (?, ?)",
+                     [(i, sig.tobytes()) for i, sig in sigs])
+    conn.executemany("INSERT OR IGNORE INTO brain_lsh (band, bucket, entry_id) VALUES (?, ?, ?)",
+                     [(band, key, i) for i, sig in sigs for band, key in buckets(sig)])
+    return len(sigs)
+
+
+def rebuild(conn: sqlite3.Connection) -> int:
+    """Index every entry from scratch; returns how many were indexed."""
+    conn.execute("DELETE FROM brain_lsh")
+    conn.execute("DELETE FROM brain_minhash")
+    conn.execute("INSERT INTO brain_minhash (entry_id, signature) VALUES (?, x'')", (_BUILT,))
+    done, last = 0, 0
+    while batch := [dict(r) for r in conn.execute(
+        "SELECT id, content, url FROM brain_text WHERE id > ? ORDER BY id LIMIT ?", (last, _BATCH)
+    )]:
+        done += index_entries(conn, batch)
+        last = batch[-1]["id"]
+    return done
+
+
+def ensure_built(conn: sqlite3.Connection) -> None:
+    """Backfill the index the first time it is needed on an existing database."""
+    if not is_built(conn):
+        rebuild(conn)
+
+
+# ── Lookup ────────────────────────────────────────────────────────────────────
+
+def _signatures(conn: sqlite3.Connection, ids: Iterable[int]) -> Dict[int, array]:
+    found: Dict[int, array] = {}
+    wanted = list(ids)
+    for i in range(0, len(wanted), 500):
+        chunk = wanted[i:i + 500]
+        marks = ", ".join("?" for _ in chunk)
+        for entry_id, blob in conn.execute(
+            f"SELECT entry_id, signature FROM brain_minhash WHERE entry_id IN ({marks})", chunk
+        ):
+            found[entry_id] = array("I", blob)
+    return found
+
+
+def near_duplicates(conn: sqlite3.Connection, text: str, exclude: Optional[int] = None,
+                    threshold: float = DUPLICATE_THRESHOLD) -> List[Tuple[int, float]]:
+    """(entry id, similarity) of indexed entries near-duplicating ``text``, most similar first.
+
+    Empty until the index is built: backfilling a whole brain is not something
+    to do in passing (``brain index rebuild`` and ``clusters`` do it).
+    """
+    if not is_built(conn) or not shingles(text):
+        return []
+    sig = signature(text)
+    candidates: Set[int] = set()
+    for band, key in buckets(sig):
+        candidates.update(r[0] for r in conn.execute(
+            "SELECT entry_id FROM brain_lsh WHERE band = ? AND bucket = ?", (band, key)
+        ))
+    if exclude is not None:
+        candidates.discard(exclude)
+    scored = [(i, similarity(sig, other)) for i, other in _signatures(conn, candidates).items()]
+    return sorted((s for s in scored if s[1] >= threshold), key=lambda s: (-s[1], s[0]))
+
+
+def clusters(conn: sqlite3.Connection, threshold: float = DUPLICATE_THRESHOLD) -> List[List[int]]:
+    """Groups of near-duplicate entry ids (each sorted, oldest first), in one pass over the buckets.
+
+    Every pair sharing a bucket is compared (buckets hold a handful of
+    entries), except pairs already known to be in the same group.
+    """
+    ensure_built(conn)
+    parent: Dict[int, int] = {}
+
+    def find(x: int) -> int:
+        while parent.setdefault(x, x) != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    shared = conn.execute("""
+        SELECT group_concat(entry_id) FROM brain_lsh
+        GROUP BY band, bucket HAVING COUNT(*) > 1
+    """).fetchall()
+    members = [sorted(int(i) for i in ids.split(",")) for (ids,) in shared]
+    sigs = _signatures(conn, {i for bucket in members for i in bucket})
+    compared: Set[Tuple[int, int]] = set()
+    for bucket in members:
+        for a, b in combinations(bucket, 2):
+            if (a, b) in compared or find(a) == find(b):
+                continue
+            compared.add((a, b))
+            if a in sigs and b in sigs and similarity(sigs[a], sigs[b]) >= threshold:
+                parent[find(b)] = find(a)
+
+    groups: Dict[int, List[int]] = {}
+    for x in list(parent):
+        groups.setdefault(find(x), []).append(x)
+    return sorted((sorted(g) for g in groups.values() if len(g) > 1), key=lambda g: g[0])
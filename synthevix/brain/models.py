@@ -3,12 +3,26 @@
 from __future__ import annotations
 
 import json
+import random
+import sqlite3
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from pathlib import Path
-from typing import List, Optional
-
-from synthevix.core.database import get_connection
-from synthevix.core.utils import parse_tags, serialize_tags, today_str, parse_duration
+from itertools import islice
+from typing import Any, Callable, Iterable, List, Optional
+
+from synthevix.brain import links, minhash, revisions, vectors
+from synthevix.core.database import (
+    connection,
+    fts_options,
+    index_brain_stats,
+    index_entry_tags,
+    rebuild_brain_fts,
+    store_body,
+    suspend_triggers,
+    transaction,
+)
+from synthevix.core.pagination import Page, fetch_page, iter_rows
+from synthevix.core.utils import parse_duration, parse_tags, serialize_tags, today_str
 
 
 def add_entry(
@@ -21,165 +35,911 @@ def add_entry(
     mood_id: Optional[int] = None,
 ) -> int:
     """Insert a new brain entry and return its ID."""
-    conn = get_connection()
-    with conn:
-        cur = conn.execute("""
-            INSERT INTO brain_entries (type, title, content, tags, language, url, mood_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (type, title, content, serialize_tags(tags or []), language, url, mood_id))
-    conn.close()
+    with transaction() as conn:
+        stored, body_id = store_body(conn, content)
+        cur = conn.execute(f"""
+            INSERT INTO brain_entries (type, title, content, body_id, tags, language, url, mood_id,
+                                       next_review_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now', '+{REVIEW_INTERVALS[0]} days'))
+        """, (type, title, stored, body_id, serialize_tags(tags or []), language, url, mood_id))
+        entry: dict = {"id": cur.lastrowid, "title": title, "content": content,
+                       "tags": serialize_tags(tags or []), "url": url}
+        vectors.index_entry(conn, entry)
+        minhash.index_entries(conn, [entry])
+        links.index_entries(conn, [entry])
+        if title:
+            links.retitled(conn, entry["id"], title)
     return cur.lastrowid
 
 
-def list_entries(
+ENTRY_TYPES = ("note", "journal", "snippet", "bookmark")
+
+# FTS tables over brain_entries and their indexed columns, in table order.
+FTS_COLUMNS = {
+    "brain_fts": ("title", "content", "tags"),
+    "brain_trigram": ("title", "content", "tags", "url"),
+}
+# Per-row index maintenance that import_entries() replaces with set-based
+# statements: FTS insert trigger -> the FTS table it feeds.
+_FTS_INSERT_TRIGGERS = {
+    "after_brain_insert": "brain_fts",
+    "after_brain_insert_trigram": "brain_trigram",
+}
+_INSERT_TRIGGERS = (*_FTS_INSERT_TRIGGERS, "after_brain_insert_tags", "after_brain_insert_stats")
+
+
+def import_entries(
+    entries: Iterable[dict],
+    batch_size: int = 1000,
+    defer_indexes: bool = True,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Bulk-insert entry dicts (as produced by ``brain.importer``) and return the count.
+
+    Everything runs in one transaction with ``executemany`` batches. With
+    ``defer_indexes`` the FTS and tag triggers are suspended and both indexes
+    are filled afterwards in one statement each (or an FTS 'rebuild' when the
+    import dominates the table), instead of once per row.
+    """
+    # Old imported entries are due for review straight away.
+    insert = f"""
+        INSERT INTO brain_entries (type, title, content, body_id, tags, language, url,
+                                   created_at, updated_at, next_review_at)
+        VALUES (?1, ?2, ?3, ?9, ?4, ?5, ?6,
+                COALESCE(?7, CURRENT_TIMESTAMP), COALESCE(?8, CURRENT_TIMESTAMP),
+                datetime(COALESCE(?7, 'now'), '+{REVIEW_INTERVALS[0]} days'))
+    """
+    done = 0
+    with transaction() as conn:
+        rows = (
+            (e.get("type") or "note", e.get("title"), content, serialize_tags(e.get("tags") or []),
+             e.get("language"), e.get("url"), e.get("created_at"),
+             e.get("updated_at") or e.get("created_at"), body_id)
+            for e in entries
+            for content, body_id in [store_body(conn, e["content"])]
+        )
+        before = conn.execute("SELECT COALESCE(MAX(id), 0) FROM brain_entries").fetchone()[0]
+        with suspend_triggers(conn, *(_INSERT_TRIGGERS if defer_indexes else ())) as suspended:
+            while batch := list(islice(rows, batch_size)):
+                conn.executemany(insert, batch)
+                done += len(batch)
+                if progress:
+                    progress(done)
+        if done and suspended:
+            _index_new_entries(conn, before, done, suspended)
+        if done:
+            _index_similarity(conn, before)
+            links.index_new_entries(conn, before)
+    return done
+
+
+def _index_new_entries(conn, after_id: int, added: int, suspended: List[str]) -> None:
+    """Catch entry_tags, brain_stats and the FTS tables up with entries whose id
+    is above ``after_id``."""
+    if "after_brain_insert_tags" in suspended:
+        index_entry_tags(conn, after_id)
+    if "after_brain_insert_stats" in suspended:
+        index_brain_stats(conn, after_id)
+    for trigger, table in _FTS_INSERT_TRIGGERS.items():
+        if trigger not in suspended:
+            continue
+        if added >= after_id:
+            conn.execute(f"INSERT INTO {table}({table}) VALUES('rebuild')")
+        else:
+            cols = FTS_COLUMNS[table]
+            values = ", ".join(f"COALESCE({c},'')" for c in cols)
+            conn.execute(f"""
+                INSERT INTO {table}(rowid, {', '.join(cols)})
+                SELECT id, {values} FROM brain_text WHERE id > ?
+            """, (after_id,))
+        conn.execute(f"INSERT INTO {table}({table}) VALUES('optimize')")
+
+
+def _index_similarity(conn, after_id: int) -> None:
+    """Add entries whose id is above ``after_id`` to the related-notes and duplicate indexes."""
+    indexes = [m for m in (vectors, minhash) if m.is_built(conn)]
+    while indexes and (batch := [dict(r) for r in conn.execute(
+        "SELECT id, title, content, tags, url FROM brain_text WHERE id > ? ORDER BY id LIMIT 1000",
+        (after_id,),
+    )]):
+        for index in indexes:
+            index.index_entries(conn, batch)
+        after_id = batch[-1]["id"]
+
+
+def related_index_built() -> bool:
+    """Whether the related-notes index covers the brain (see ``rebuild_related_index``)."""
+    return vectors.is_built(connection())
+
+
+def related_entries(entry_id: int, limit: int = 5) -> List[dict]:
+    """Entries most similar to ``entry_id`` by TF-IDF cosine, each with a ``similarity``.
+
+    Always empty while ``related_index_built()`` is false.
+    """
+    conn = connection()
+    row = conn.execute("SELECT id, title, content, tags FROM brain_text WHERE id = ?",
+                       (entry_id,)).fetchone()
+    if row is None:
+        return []
+    scored = vectors.related(conn, dict(row), limit)
+    if not scored:
+        return []
+    marks = ", ".join("?" for _ in scored)
+    found = {r["id"]: dict(r) for r in conn.execute(
+        f"SELECT id, type, title, content, tags, created_at FROM brain_entries "
+        f"WHERE id IN ({marks})",
+        [i for i, _ in scored],
+    )}
+    return [{**found[i], "similarity": sim} for i, sim in scored if i in found]
+
+
+def rebuild_related_index() -> int:
+    """Recompute every related-notes vector with current document frequencies."""
+    with transaction() as conn:
+        return vectors.rebuild(conn)
+
+
+def rebuild_duplicate_index() -> int:
+    """Recompute every entry's MinHash signature and LSH buckets."""
+    with transaction() as conn:
+        return minhash.rebuild(conn)
+
+
+def duplicate_index_built() -> bool:
+    """Whether the near-duplicate index covers the brain (see ``rebuild_duplicate_index``)."""
+    return minhash.is_built(connection())
+
+
+def find_near_duplicates(
+    content: str, url: Optional[str] = None, exclude: Optional[int] = None,
+) -> List[dict]:
+    """Entries whose content (and URL) nearly match, each with a ``similarity``; most similar first.
+
+    Always empty while ``duplicate_index_built()`` is false.
+    """
+    conn = connection()
+    text = minhash.entry_text({"content": content, "url": url})
+    scored = minhash.near_duplicates(conn, text, exclude)
+    if not scored:
+        return []
+    marks = ", ".join("?" for _ in scored)
+    found = {r["id"]: dict(r) for r in conn.execute(
+        f"SELECT id, type, title, content, tags, created_at FROM brain_entries "
+        f"WHERE id IN ({marks})",
+        [i for i, _ in scored],
+    )}
+    return [{**found[i], "similarity": sim} for i, sim in scored if i in found]
+
+
+def _summaries_by_id(conn, ids: List[int]) -> dict:
+    found: dict = {}
+    for i in range(0, len(ids), 500):
+        chunk = ids[i:i + 500]
+        marks = ", ".join("?" for _ in chunk)
+        found.update((r["id"], _summary(r)) for r in conn.execute(
+            f"SELECT {_SUMMARY_COLUMNS} FROM brain_entries WHERE id IN ({marks})", chunk
+        ))
+    return found
+
+
+def duplicate_clusters() -> List[List[EntrySummary]]:
+    """Groups of near-duplicate entries, oldest first within each group."""
+    with transaction() as conn:
+        groups = minhash.clusters(conn)
+        found = _summaries_by_id(conn, [i for g in groups for i in g])
+    return [[found[i] for i in g if i in found] for g in groups]
+
+
+def backlinks(entry_id: int) -> List[EntrySummary]:
+    """Entries whose content links to ``entry_id`` (``[[id]]`` or ``[[title]]``), newest first."""
+    conn = connection()
+    found = _summaries_by_id(conn, links.backlinks(conn, entry_id))
+    return sorted(found.values(), key=lambda e: (e.created_at, e.id), reverse=True)
+
+
+def link_graph(entry_id: int, depth: int = 2) -> List[dict]:
+    """Entries within ``depth`` links of ``entry_id`` (either direction), nearest first.
+
+    Each has the EntrySummary fields plus ``depth``, ``parent`` (the entry one
+    step closer it was reached from) and ``outgoing`` (whether ``parent``
+    links to it, rather than it to ``parent``). Empty if the entry does not exist.
+    """
+    if not 1 <= depth <= links.MAX_DEPTH:
+        raise ValueError(f"Depth must be between 1 and {links.MAX_DEPTH}")
+    conn = connection()
+    rows = links.neighbourhood(conn, entry_id, depth)
+    found = _summaries_by_id(conn, [r[0] for r in rows])
+    if entry_id not in found:
+        return []
+    return [
+        {"id": i, "type": e.type, "title": e.title, "preview": e.preview,
+         "depth": d, "parent": parent, "outgoing": bool(outgoing)}
+        for i, d, parent, outgoing in rows
+        if (e := found.get(i))
+    ]
+
+
+def merge_entries(keep_id: int, other_ids: List[int]) -> int:
+    """Fold ``other_ids`` into ``keep_id`` (their tags are added to it), delete
+    them and return the count."""
+    with transaction() as conn:
+        keep = conn.execute("SELECT tags FROM brain_entries WHERE id = ?", (keep_id,)).fetchone()
+        if keep is None:
+            raise ValueError(f"Entry #{keep_id} not found")
+        tags = parse_tags(keep["tags"])
+        merged = 0
+        for other_id in other_ids:
+            if other_id == keep_id:
+                continue
+            row = conn.execute(
+                "SELECT tags FROM brain_entries WHERE id = ?", (other_id,)
+            ).fetchone()
+            if row is None:
+                continue
+            tags += [t for t in parse_tags(row["tags"]) if t not in tags]
+            merged += delete_entry(other_id)
+        if tags != parse_tags(keep["tags"]):
+            update_entry(keep_id, tags=serialize_tags(tags))
+    return merged
+
+
+# A tag filter matching at least limit × this many entries is "hot": walking
+# idx_brain_created newest-first and probing entry_tags per row finds a page
+# sooner than collecting and sorting every match.
+_HOT_TAG_FACTOR = 40
+
+
+def _tag_clause(conn, tags: List[str], match: str, limit: int) -> tuple:
+    """SQL fragment restricting brain_entries to entries carrying ``tags``.
+
+    ``match="all"`` requires every tag, ``match="any"`` at least one. The
+    rarest group of tags drives the lookup through idx_entry_tags_tag unless
+    even that is hot, in which case every condition becomes a per-row probe.
+    """
+    groups = [[t] for t in tags] if match == "all" else [list(tags)]
+    cap = limit * _HOT_TAG_FACTOR
+
+    def matches(group: List[str]) -> int:
+        marks = ", ".join("?" for _ in group)
+        return conn.execute(
+            f"SELECT COUNT(*) FROM (SELECT 1 FROM entry_tags WHERE tag IN ({marks}) LIMIT ?)",
+            [*group, cap],
+        ).fetchone()[0]
+
+    counted = sorted((matches(g), g) for g in groups)
+    clause, params = "", []
+    for i, (count, group) in enumerate(counted):
+        marks = ", ".join("?" for _ in group)
+        if i == 0 and count < cap:
+            clause += f" AND id IN (SELECT entry_id FROM entry_tags WHERE tag IN ({marks}))"
+        else:
+            clause += (f" AND EXISTS (SELECT 1 FROM entry_tags t"
+                       f" WHERE t.entry_id = brain_entries.id AND t.tag IN ({marks}))")
+        params.extend(group)
+    return clause, params
+
+
+def _since_iso(since: str) -> str:
+    """Accept an ISO date/datetime or a duration like '7d' and return an ISO timestamp."""
+    try:
+        return datetime.fromisoformat(since).isoformat()
+    except ValueError:
+        return (datetime.now() - timedelta(days=parse_duration(since))).isoformat()
+
+
+def _entry_filters(
+    conn,
     type_filter: Optional[str] = None,
-    tag_filter: Optional[str] = None,
+    tag_filter: Optional[str | List[str]] = None,
     last: Optional[str] = None,
     limit: int = 50,
-) -> List[dict]:
-    """Return a list of entries, optionally filtered."""
-    conn = get_connection()
-    query = "SELECT * FROM brain_entries WHERE 1=1"
+    tag_match: str = "all",
+    updated_since: Optional[str] = None,
+) -> tuple:
+    """WHERE clause (starting ``WHERE 1=1``) and params shared by listing, counting and export."""
+    query = " WHERE 1=1"
     params: list = []
 
     if type_filter:
         query += " AND type = ?"
         params.append(type_filter)
 
+    if tag_filter:
+        tags = [tag_filter] if isinstance(tag_filter, str) else list(dict.fromkeys(tag_filter))
+        clause, tag_params = _tag_clause(conn, tags, tag_match, limit)
+        query += clause
+        params.extend(tag_params)
+
     if last:
         days = parse_duration(last)
         since = (datetime.now() - timedelta(days=days)).isoformat()
         query += " AND created_at >= ?"
         params.append(since)
 
-    query += " ORDER BY created_at DESC LIMIT ?"
-    params.append(limit)
+    if updated_since:
+        # updated_at holds both CURRENT_TIMESTAMP and isoformat() values; datetime() unifies them.
+        query += " AND datetime(updated_at) >= datetime(?)"
+        params.append(_since_iso(updated_since))
 
-    rows = conn.execute(query, params).fetchall()
-    conn.close()
-    entries = [dict(r) for r in rows]
+    return query, params
 
-    # Filter by tag in Python (tags stored as JSON)
-    if tag_filter:
-        entries = [e for e in entries if tag_filter in parse_tags(e.get("tags", "[]"))]
 
-    return entries
+# What listings and search results carry, with the full content. Listings read
+# brain_entries plus body_id, which _with_bodies() swaps for the content of
+# large entries (see core.database.store_body); search reads brain_text.
+LIST_COLUMNS = "id, type, title, content, tags, language, url, created_at, updated_at"
+_LIST_SELECT = f"{LIST_COLUMNS}, body_id"
+
+
+def list_entries_page(
+    type_filter: Optional[str] = None,
+    tag_filter: Optional[str | List[str]] = None,
+    last: Optional[str] = None,
+    limit: int = 50,
+    tag_match: str = "all",
+    after: Optional[str] = None,
+    updated_since: Optional[str] = None,
+    columns: str = _LIST_SELECT,
+) -> Page:
+    """Return one page of entries, newest first, continuing from cursor ``after``.
+
+    ``tag_filter`` is a tag or list of tags; ``tag_match`` is "all" (AND) or "any" (OR).
+    ``updated_since`` is an ISO date or a duration such as '7d'. ``columns``
+    must include id and created_at (the cursor), and body_id for full content.
+    """
+    conn = connection()
+    where, params = _entry_filters(
+        conn, type_filter, tag_filter, last, limit, tag_match, updated_since
+    )
+    page = fetch_page(
+        conn, f"SELECT {columns} FROM brain_entries" + where, params, "created_at", after, limit
+    )
+    _with_bodies(conn, page.items)
+    return page
 
 
-def search_entries(query: str, limit: int = 20) -> List[dict]:
-    """Full-text search. Uses FTS5 if available, falls back to LIKE."""
-    conn = get_connection()
+@dataclass(slots=True)
+class EntrySummary:
+    """An entry as listings show it; ``preview`` is the start of its content
+    (get_entry() has it all)."""
+
+    id: int
+    type: str
+    title: Optional[str]
+    preview: str
+    tags: str
+    created_at: str
+
+
+SUMMARY_PREVIEW_CHARS = 80
+_SUMMARY_COLUMNS = (
+    f"id, type, title, substr(content, 1, {SUMMARY_PREVIEW_CHARS}) AS preview, tags, created_at"
+)
+
+
+def _summary(row) -> EntrySummary:
+    return EntrySummary(*row)
+
+
+def list_entry_summaries_page(
+    type_filter: Optional[str] = None,
+    tag_filter: Optional[str | List[str]] = None,
+    last: Optional[str] = None,
+    limit: int = 50,
+    tag_match: str = "all",
+    after: Optional[str] = None,
+) -> Page:
+    """``list_entries_page`` with only the columns listings show, as EntrySummary items."""
+    conn = connection()
+    where, params = _entry_filters(conn, type_filter, tag_filter, last, limit, tag_match)
+    return fetch_page(conn, f"SELECT {_SUMMARY_COLUMNS} FROM brain_entries" + where, params,
+                      "created_at", after, limit, _summary)
+
+
+def list_entry_summaries(
+    type_filter: Optional[str] = None,
+    tag_filter: Optional[str | List[str]] = None,
+    last: Optional[str] = None,
+    limit: int = 50,
+    tag_match: str = "all",
+    after: Optional[str] = None,
+) -> List[EntrySummary]:
+    """Summaries of entries, optionally filtered (see ``list_entries_page``)."""
+    return list_entry_summaries_page(type_filter, tag_filter, last, limit, tag_match, after).items
+
+
+def list_entries(
+    type_filter: Optional[str] = None,
+    tag_filter: Optional[str | List[str]] = None,
+    last: Optional[str] = None,
+    limit: int = 50,
+    tag_match: str = "all",
+    after: Optional[str] = None,
+) -> List[dict]:
+    """Return a list of entries, optionally filtered (see ``list_entries_page``)."""
+    return list_entries_page(type_filter, tag_filter, last, limit, tag_match, after).items
+
+
+# bm25() weights per column: a hit in the title, a tag or a bookmark URL says
+# more about an entry than one buried in its body.
+BM25_WEIGHTS = {"title": 10.0, "content": 1.0, "tags": 5.0, "url": 5.0}
+SNIPPET_TOKENS = 16
+
+
+SEARCH_MODES = ("words", "substring", "fuzzy")
+# Share of the query's trigrams a fuzzy hit must contain, and how many bm25
+# candidates are scored against that threshold per requested result.
+FUZZY_MIN_OVERLAP = 0.5
+_FUZZY_CANDIDATES = 5
+
+
+def search_entries(query: str, limit: int = 20, mode: str = "words") -> List[dict]:
+    """Ranked full-text search.
+
+    ``mode`` is "words" (brain_fts), "substring" (every term appears inside
+    the text, via brain_trigram) or "fuzzy" (closest trigram matches, for
+    typos). ``query`` is user input (see ``brain.fts``), never raw MATCH
+    syntax. Each result also carries ``title_hl`` and ``snippet`` with matches
+    wrapped in ``fts.HIGHLIGHT_START``/``HIGHLIGHT_END``, and its bm25
+    ``score`` (lower is better). LIKE is used only when the index is missing
+    or a substring term is under three characters.
+    """
+    from synthevix.brain import fts
+
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"Unknown search mode '{mode}'. Use: {', '.join(SEARCH_MODES)}")
+    conn = connection()
+    if mode == "words":
+        options = fts_options(conn) or {"detail": "full"}
+        match = fts.to_fts_query(query, options["detail"] == "full")
+        table, fetch = "brain_fts", limit
+    elif mode == "substring":
+        table, match, fetch = "brain_trigram", fts.to_substring_query(query), limit
+    else:
+        table, match, fetch = "brain_trigram", fts.to_fuzzy_query(query), limit * _FUZZY_CANDIDATES
+
+    if match is None:
+        if mode == "substring" and query.strip():
+            return _like_search(conn, query.strip(), limit)
+        return []
+
+    weights = ", ".join(str(BM25_WEIGHTS[c]) for c in FTS_COLUMNS[table])
     try:
-        rows = conn.execute("""
-            SELECT b.* FROM brain_entries b
-            JOIN brain_fts f ON b.id = f.rowid
-            WHERE brain_fts MATCH ?
-            ORDER BY rank
-            LIMIT ?
-        """, (query, limit)).fetchall()
-    except Exception:
-        # FTS5 unavailable or brain_fts table doesn't exist yet
-        pattern = f"%{query}%"
-        rows = conn.execute("""
-            SELECT * FROM brain_entries
-            WHERE title LIKE ? OR content LIKE ? OR tags LIKE ?
-            ORDER BY created_at DESC LIMIT ?
-        """, (pattern, pattern, pattern, limit)).fetchall()
-    conn.close()
+        hits = conn.execute(f"""
+            SELECT rowid,
+                   highlight({table}, 0, :start, :end) AS title_hl,
+                   snippet({table}, 1, :start, :end, '…', :tokens) AS snippet,
+                   bm25({table}, {weights}) AS score
+            FROM {table}
+            WHERE {table} MATCH :match
+            ORDER BY score
+            LIMIT :limit
+        """, {"start": fts.HIGHLIGHT_START, "end": fts.HIGHLIGHT_END, "tokens": SNIPPET_TOKENS,
+              "match": match, "limit": fetch}).fetchall()
+    except sqlite3.OperationalError as e:
+        if "no such table" not in str(e) and "no such module" not in str(e):
+            raise
+        # SQLite without FTS5 (or, for brain_trigram, without the trigram tokenizer).
+        return _like_search(conn, query, limit)
+
+    # Only the top hits are looked up, with their whole text.
+    found = {}
+    if hits:
+        marks = ", ".join("?" for _ in hits)
+        found = {r["id"]: dict(r) for r in conn.execute(
+            f"SELECT {LIST_COLUMNS} FROM brain_text WHERE id IN ({marks})",
+            [h["rowid"] for h in hits],
+        )}
+    entries = [
+        {**found[h["rowid"]], "title_hl": h["title_hl"], "snippet": h["snippet"],
+         "score": h["score"]}
+        for h in hits if h["rowid"] in found
+    ]
+    if mode == "fuzzy":
+        wanted = fts.trigrams(query)
+        entries = [e for e in entries if _trigram_overlap(e, wanted) >= FUZZY_MIN_OVERLAP][:limit]
+    return entries
+
+
+def _trigram_overlap(entry: dict, wanted: List[str]) -> float:
+    text = " ".join(str(entry.get(k) or "") for k in FTS_COLUMNS["brain_trigram"]).lower()
+    return sum(t in text for t in wanted) / len(wanted)
+
+
+def _like_search(conn, query: str, limit: int) -> List[dict]:
+    """Unindexed LIKE scan over title, content, tags and url — the last resort."""
+    pattern = f"%{query}%"
+    rows = conn.execute(f"""
+        SELECT {LIST_COLUMNS} FROM brain_text
+        WHERE title LIKE :p OR content LIKE :p OR tags LIKE :p OR url LIKE :p
+        ORDER BY created_at DESC LIMIT :limit
+    """, {"p": pattern, "limit": limit}).fetchall()
     return [dict(r) for r in rows]
 
 
+def rebuild_search_index(detail: str = "full", vacuum: bool = True) -> None:
+    """Rebuild brain_fts with ``detail`` ("full" or "column") and the prefix indexes.
+
+    ``vacuum`` then returns the freed pages to the filesystem; otherwise they
+    stay in data.db (and in every backup of it) until reused.
+    """
+    with transaction() as conn:
+        rebuild_brain_fts(conn, detail)
+    if vacuum:
+        connection().execute("VACUUM")
+
+
+def _table_bytes(conn, names: List[str]) -> int:
+    """Bytes of pages owned by ``names``; payload lengths where dbstat isn't compiled in."""
+    total = 0
+    for name in names:
+        try:
+            total += conn.execute(
+                "SELECT COALESCE(SUM(pgsize), 0) FROM dbstat WHERE name = ? AND aggregate = TRUE",
+                (name,),
+            ).fetchone()[0]
+        except sqlite3.OperationalError:
+            cols = [r[1] for r in conn.execute(f"PRAGMA table_info({name})")]
+            lengths = " + ".join(f"COALESCE(length({c}), 0)" for c in cols)
+            total += conn.execute(
+                f"SELECT COALESCE(SUM({lengths}), 0) FROM {name}"
+            ).fetchone()[0]
+    return total
+
+
+def index_stats() -> List[dict]:
+    """On-disk size of brain_entries, the compressed bodies and each FTS index over it.
+
+    Each row has ``name`` and ``bytes``; FTS rows also carry their ``detail``
+    and ``prefix`` options and ``ratio`` (index bytes per content byte), and
+    brain_bodies its ``ratio`` to the text it holds.
+    """
+    conn = connection()
+    content = _table_bytes(conn, ["brain_entries"])
+    stats = [{"name": "brain_entries", "bytes": content}]
+    raw = conn.execute("SELECT COALESCE(SUM(size), 0) FROM brain_bodies").fetchone()[0]
+    if raw:
+        size = _table_bytes(conn, ["brain_bodies"])
+        stats.append({"name": "brain_bodies", "bytes": size, "ratio": size / raw})
+        content += size
+    for table in FTS_COLUMNS:
+        options = fts_options(conn, table)
+        if options is None:
+            continue
+        shadow = [r[0] for r in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE ? ESCAPE '\\'",
+            (table.replace("_", "\\_") + "\\_%",),
+        )]
+        size = _table_bytes(conn, shadow)
+        ratio = size / content if content else 0.0
+        stats.append({"name": table, "bytes": size, **options, "ratio": ratio})
+    return stats
+
+
 def get_entry(entry_id: int) -> Optional[dict]:
-    """Fetch a single entry by ID."""
-    conn = get_connection()
-    row = conn.execute("SELECT * FROM brain_entries WHERE id = ?", (entry_id,)).fetchone()
-    conn.close()
+    """Fetch a single entry by ID, with its full content."""
+    row = connection().execute("SELECT * FROM brain_text WHERE id = ?", (entry_id,)).fetchone()
     return dict(row) if row else None
 
 
 def update_entry(entry_id: int, **fields) -> bool:
-    """Update specified fields on an entry. Returns True if a row was updated."""
+    """Update specified fields on an entry. Returns True if a row was updated.
+
+    Content that changes is kept as a revision (see ``entry_history``).
+    """
     if not fields:
         return False
     fields["updated_at"] = datetime.now().isoformat()
-    set_clause = ", ".join(f"{k} = ?" for k in fields)
-    values = list(fields.values()) + [entry_id]
-    conn = get_connection()
-    with conn:
+    old_body = None
+    with transaction() as conn:
+        columns = dict(fields)
+        if "content" in fields:
+            old = conn.execute("""
+                SELECT t.content, e.body_id, e.updated_at
+                FROM brain_text t JOIN brain_entries e ON e.id = t.id WHERE t.id = ?
+            """, (entry_id,)).fetchone()
+            if old is None:  # before store_body, which would leave the new body orphaned
+                return False
+            if old["content"] != fields["content"]:
+                revisions.record(conn, entry_id, old["content"], old["updated_at"])
+            old_body = old["body_id"]
+            columns["content"], columns["body_id"] = store_body(conn, fields["content"])
+        set_clause = ", ".join(f"{k} = ?" for k in columns)
         cur = conn.execute(
-            f"UPDATE brain_entries SET {set_clause} WHERE id = ?", values
+            f"UPDATE brain_entries SET {set_clause} WHERE id = ?", [*columns.values(), entry_id]
         )
-    conn.close()
+        if old_body:
+            conn.execute("DELETE FROM brain_bodies WHERE id = ?", (old_body,))
+        if cur.rowcount and "content" in fields:
+            links.index_entries(conn, [{"id": entry_id, "content": fields["content"]}])
+        if cur.rowcount and "title" in fields:
+            links.retitled(conn, entry_id, fields["title"])
+        if cur.rowcount and fields.keys() & {"title", "content", "tags", "url"}:
+            row = dict(conn.execute(
+                "SELECT id, title, content, tags, url FROM brain_text WHERE id = ?", (entry_id,)
+            ).fetchone())
+            if fields.keys() & {"title", "content", "tags"}:
+                vectors.index_entry(conn, row)
+            if fields.keys() & {"content", "url"}:
+                minhash.index_entries(conn, [row])
     return cur.rowcount > 0
 
 
+def entry_history(entry_id: int) -> List[dict]:
+    """Earlier versions of an entry's content, oldest first (without their text).
+
+    Each has ``rev``, ``created_at`` (when that version was written), ``size``
+    (bytes of text) and ``stored`` (bytes it takes in the database).
+    """
+    return revisions.history(connection(), entry_id)
+
+
+def entry_revision(entry_id: int, rev: int) -> Optional[str]:
+    """Content of revision ``rev`` of an entry, or None if it has no such revision."""
+    return revisions.revision(connection(), entry_id, rev)
+
+
+def restore_revision(entry_id: int, rev: int) -> None:
+    """Make revision ``rev`` the entry's content again; the content it replaces
+    becomes a revision too."""
+    with transaction() as conn:
+        text = revisions.revision(conn, entry_id, rev)
+        if text is None:
+            raise ValueError(f"Entry #{entry_id} has no revision {rev}")
+        update_entry(entry_id, content=text)
+
+
 def delete_entry(entry_id: int) -> bool:
     """Delete an entry by ID. Returns True if deleted."""
-    conn = get_connection()
-    with conn:
+    with transaction() as conn:
+        vectors.remove_entries(conn, [entry_id])
+        minhash.remove_entries(conn, [entry_id])
+        revisions.remove_entries(conn, [entry_id])
+        body = conn.execute(
+            "SELECT body_id FROM brain_entries WHERE id = ?", (entry_id,)
+        ).fetchone()
         cur = conn.execute("DELETE FROM brain_entries WHERE id = ?", (entry_id,))
-    conn.close()
+        if body and body[0]:
+            conn.execute("DELETE FROM brain_bodies WHERE id = ?", (body[0],))
+        if cur.rowcount:
+            links.remove_entries(conn, [entry_id])
     return cur.rowcount > 0
 
 
-def list_tags() -> List[dict]:
-    """Return all unique tags with their entry counts."""
-    conn = get_connection()
-    rows = conn.execute("SELECT tags FROM brain_entries").fetchall()
-    conn.close()
+def list_tags(limit: Optional[int] = None) -> List[dict]:
+    """Return unique tags with their entry counts, most used first (all of them
+    unless ``limit``)."""
+    rows = connection().execute("""
+        SELECT key AS tag, count FROM brain_stats WHERE kind = 'tag'
+        ORDER BY count DESC, key LIMIT ?
+    """, (-1 if limit is None else limit,)).fetchall()
+    return [dict(r) for r in rows]
 
-    tag_counts: dict = {}
-    for row in rows:
-        for tag in parse_tags(row["tags"]):
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
 
-    return sorted(
-        [{"tag": t, "count": c} for t, c in tag_counts.items()],
-        key=lambda x: x["count"],
-        reverse=True,
-    )
+EXPORT_FORMATS = ("md", "json", "jsonl")
+EXPORT_COMPRESSION = ("gz", "xz")
+_EXPORT_CHUNK = 500
+
+
+def _write_markdown(f, entries) -> None:
+    f.write(f"# Synthevix Brain Export\n*{datetime.now().strftime('%Y-%m-%d %H:%M')}*\n\n---\n\n")
+    for e in entries:
+        f.write(f"## [{e['id']}] {e.get('title') or e['type'].capitalize()}\n")
+        f.write(f"*Type: {e['type']} | Created: {e['created_at']}*\n\n")
+        if e.get("url"):
+            f.write(f"**URL:** {e['url']}\n\n")
+        f.write(f"{e['content']}\n\n---\n\n")
+
+
+def _write_json(f, entries) -> None:
+    # Same layout as json.dump(list, indent=2), one element at a time.
+    sep = "[\n"
+    for e in entries:
+        f.write(sep)
+        f.write("  " + json.dumps(e, indent=2, default=str).replace("\n", "\n  "))
+        sep = ",\n"
+    f.write("\n]" if sep != "[\n" else "[]")
 
 
-def export_entries(format: str = "md", type_filter: Optional[str] = None) -> str:
-    """Export entries to Markdown or JSON and return the file path."""
+def _write_jsonl(f, entries) -> None:
+    for e in entries:
+        f.write(json.dumps(e, default=str))
+        f.write("\n")
+
+
+_WRITERS = {"md": _write_markdown, "json": _write_json, "jsonl": _write_jsonl}
+
+
+def _with_bodies(conn, entries: List[dict]) -> List[dict]:
+    """Swap previews in ``entries`` (rows with a body_id) for their full content,
+    dropping body_id."""
+    ids = [e["body_id"] for e in entries if e.get("body_id")]
+    bodies = {}
+    if ids:
+        marks = ", ".join("?" for _ in ids)
+        bodies = dict(conn.execute(
+            f"SELECT id, brain_unpack(data) FROM brain_bodies WHERE id IN ({marks})", ids
+        ))
+    for e in entries:
+        body_id = e.pop("body_id", None)
+        if body_id in bodies:
+            e["content"] = bodies[body_id]
+    return entries
+
+
+def export_entries(
+    format: str = "md",
+    type_filter: Optional[str] = None,
+    updated_since: Optional[str] = None,
+    compress: Optional[str] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> str:
+    """Stream entries to a Markdown, JSON or JSONL file and return its path.
+
+    Rows are read in keyset pages of ``_EXPORT_CHUNK`` and written as they
+    arrive, so memory stays flat however large the brain is. ``compress`` is
+    None, "gz" or "xz"; ``progress`` is called with (entries_written, total).
+    """
     from synthevix.core.database import SYNTHEVIX_DIR
-    entries = list_entries(type_filter=type_filter, limit=10000)
+    if format not in _WRITERS:
+        raise ValueError(f"Unknown export format '{format}'. Use: {', '.join(EXPORT_FORMATS)}")
+    if compress is not None and compress not in EXPORT_COMPRESSION:
+        raise ValueError(f"Unknown compression '{compress}'. Use: {', '.join(EXPORT_COMPRESSION)}")
+
+    conn = connection()
+    total = 0
+    if progress:
+        where, params = _entry_filters(conn, type_filter, updated_since=updated_since)
+        total = conn.execute("SELECT COUNT(*) FROM brain_entries" + where, params).fetchone()[0]
+
+    def page(after: Optional[str]) -> Page:
+        return list_entries_page(type_filter=type_filter, limit=_EXPORT_CHUNK, after=after,
+                                 updated_since=updated_since, columns="*")
+
+    def entries():
+        done = 0
+        rows = iter_rows(page)
+        for e in rows:
+            yield e
+            done += 1
+            if progress and (done % _EXPORT_CHUNK == 0 or done == total):
+                progress(done, total)
 
     export_dir = SYNTHEVIX_DIR / "exports"
     export_dir.mkdir(exist_ok=True)
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    if format == "json":
-        path = export_dir / f"brain_export_{ts}.json"
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(entries, f, indent=2, default=str)
+    path = export_dir / (f"brain_export_{ts}.{format}" + (f".{compress}" if compress else ""))
+    opener: Callable[..., Any]
+    if compress == "gz":
+        import gzip
+        opener = gzip.open
+    elif compress == "xz":
+        import lzma
+        opener = lzma.open
     else:
-        path = export_dir / f"brain_export_{ts}.md"
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(f"# Synthevix Brain Export\n*{datetime.now().strftime('%Y-%m-%d %H:%M')}*\n\n---\n\n")
-            for e in entries:
-                f.write(f"## [{e['id']}] {e.get('title') or e['type'].capitalize()}\n")
-                f.write(f"*Type: {e['type']} | Created: {e['created_at']}*\n\n")
-                if e.get("url"):
-                    f.write(f"**URL:** {e['url']}\n\n")
-                f.write(f"{e['content']}\n\n---\n\n")
+        opener = open
+
+    with opener(path, "wt", encoding="utf-8") as f:
+        _WRITERS[format](f, entries())
 
     return str(path)
 
 
+# Exact-id probes before random_entry() settles for the entry after a gap.
+_RANDOM_PROBES = 8
+
+
 def random_entry() -> Optional[dict]:
-    """Return a random brain entry."""
-    conn = get_connection()
+    """Return a random brain entry.
+
+    Picks ids uniformly between the smallest and largest and looks each up by
+    rowid, so the cost doesn't grow with the table. If every probe lands in a
+    gap left by deletions, the next entry after a random id is taken instead.
+    """
+    conn = connection()
+    low, high = conn.execute(
+        "SELECT (SELECT MIN(id) FROM brain_entries), (SELECT MAX(id) FROM brain_entries)"
+    ).fetchone()
+    if low is None:
+        return None
+    for _ in range(_RANDOM_PROBES):
+        row = conn.execute(
+            "SELECT * FROM brain_text WHERE id = ?", (random.randint(low, high),)
+        ).fetchone()
+        if row:
+            return dict(row)
     row = conn.execute(
-        "SELECT * FROM brain_entries ORDER BY RANDOM() LIMIT 1"
+        "SELECT * FROM brain_text WHERE id >= ? ORDER BY id LIMIT 1", (random.randint(low, high),)
     ).fetchone()
-    conn.close()
-    return dict(row) if row else None
+    return dict(row)
+
+
+# Days until the next review after each successful one (a Leitner-style ladder).
+REVIEW_INTERVALS = (1, 3, 7, 14, 30, 60, 120, 240)
+# How far up the ladder a review grade moves an entry; "again" starts it over.
+REVIEW_GRADES = {"again": None, "good": 1, "easy": 2}
+
+
+def due_entries(limit: int = 10) -> List[dict]:
+    """Entries whose review is due, longest-overdue first (a seek on idx_brain_next_review)."""
+    rows = connection().execute("""
+        SELECT * FROM brain_text WHERE next_review_at <= datetime('now')
+        ORDER BY next_review_at LIMIT ?
+    """, (limit,)).fetchall()
+    return [dict(r) for r in rows]
+
+
+def count_due() -> int:
+    """Number of entries due for review."""
+    return connection().execute(
+        "SELECT COUNT(*) FROM brain_entries WHERE next_review_at <= datetime('now')"
+    ).fetchone()[0]
+
+
+def resurface_entry() -> Optional[dict]:
+    """The most overdue entry, or a random one when nothing is due (welcome screen)."""
+    due = due_entries(1)
+    return due[0] if due else random_entry()
+
+
+def review_entry(entry_id: int, grade: str = "good") -> Optional[str]:
+    """Record a review and schedule the next one; returns its time, or None if no such entry.
+
+    ``grade`` is one of REVIEW_GRADES: "good" and "easy" climb one or two
+    steps of REVIEW_INTERVALS, "again" drops back to the first.
+    """
+    if grade not in REVIEW_GRADES:
+        raise ValueError(f"Unknown grade '{grade}'. Use: {', '.join(REVIEW_GRADES)}")
+    with transaction() as conn:
+        row = conn.execute(
+            "SELECT review_step FROM brain_entries WHERE id = ?", (entry_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        climb = REVIEW_GRADES[grade]
+        step = 0 if climb is None else min((row[0] or 0) + climb, len(REVIEW_INTERVALS) - 1)
+        conn.execute("""
+            UPDATE brain_entries SET review_step = ?, next_review_at = datetime('now', ?)
+            WHERE id = ?
+        """, (step, f"+{REVIEW_INTERVALS[step]} days", entry_id))
+        next_at: str = conn.execute(
+            "SELECT next_review_at FROM brain_entries WHERE id = ?", (entry_id,)
+        ).fetchone()[0]
+        return next_at
 
 
 def count_entries() -> int:
     """Return total number of brain entries."""
-    conn = get_connection()
-    count = conn.execute("SELECT COUNT(*) FROM brain_entries").fetchone()[0]
-    conn.close()
-    return count
+    row = connection().execute(
+        "SELECT count FROM brain_stats WHERE kind = 'total' AND key = ''"
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def brain_stats(top_tags: int = 10) -> dict:
+    """Entry and content-byte totals, per type and per language, plus the
+    ``top_tags`` most used tags.
+
+    Everything comes from brain_stats, which triggers keep current, so this
+    costs the same however large the brain is.
+    """
+    stats: dict = {
+        "entries": 0, "bytes": 0, "tags": 0, "types": [], "languages": [], "top_tags": [],
+    }
+    conn = connection()
+    for r in conn.execute("""
+        SELECT kind, key, count, bytes FROM brain_stats WHERE kind IN ('total', 'type', 'language')
+        ORDER BY kind, count DESC, key
+    """):
+        if r["kind"] == "total":
+            stats["entries"], stats["bytes"] = r["count"], r["bytes"]
+        else:
+            stats[f"{r['kind']}s"].append(
+                {"name": r["key"], "count": r["count"], "bytes": r["bytes"]}
+            )
+    stats["tags"] = conn.execute(
+        "SELECT COUNT(*) FROM brain_stats WHERE kind = 'tag'"
+    ).fetchone()[0]
+    stats["top_tags"] = list_tags(top_tags)
+    return stats
@@ -0,0 +1,102 @@
+"""Brain module — revision history: earlier versions of an entry's content, delta-compressed.
+
+Changing an entry's content appends the text it replaces to
+``brain_revisions`` as that entry's next revision (1, 2, …); the live text
+stays in brain_entries, so entries that are never edited cost nothing.
+
+Revision 1 and every ``KEYFRAME_EVERY``-th one after it is a keyframe: the
+whole text, zlib-compressed. The others are deltas against the revision before
+them — ranges of its words to copy plus inserted text, JSON-encoded and
+zlib-compressed. A delta that would come out bigger than a keyframe is stored
+as a keyframe instead. Reading any revision therefore decompresses one keyframe
+and applies at most ``KEYFRAME_EVERY - 1`` deltas.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import zlib
+from difflib import SequenceMatcher
+from typing import List, Optional, Sequence
+
+KEYFRAME_EVERY = 8
+
+# Words with the whitespace before them; joining the tokens gives the text back.
+_TOKEN = re.compile(r"\s*\S+|\s+")
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN.findall(text)
+
+
+def encode_delta(base: str, text: str) -> bytes:
+    """``text`` as [start, end) copies of ``base``'s tokens and inserted strings."""
+    a, b = _tokens(base), _tokens(text)
+    ops: list = []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, a, b, autojunk=False).get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append("".join(b[j1:j2]))
+    return zlib.compress(json.dumps(ops, separators=(",", ":")).encode(), 9)
+
+
+def apply_delta(base: str, delta: bytes) -> str:
+    a = _tokens(base)
+    return "".join(
+        "".join(a[op[0]:op[1]]) if isinstance(op, list) else op
+        for op in json.loads(zlib.decompress(delta))
+    )
+
+
+def record(conn: sqlite3.Connection, entry_id: int, text: str,
+           written_at: Optional[str] = None) -> int:
+    """Append ``text`` (a version being replaced) as the entry's next revision;
+    returns its number."""
+    last = conn.execute(
+        "SELECT MAX(rev) FROM brain_revisions WHERE entry_id = ?", (entry_id,)
+    ).fetchone()[0]
+    rev = (last or 0) + 1
+    data, keyframe = zlib.compress(text.encode(), 9), True
+    base = revision(conn, entry_id, last) if (rev - 1) % KEYFRAME_EVERY else None
+    if base is not None:
+        delta = encode_delta(base, text)
+        if len(delta) < len(data):
+            data, keyframe = delta, False
+    conn.execute("""
+        INSERT INTO brain_revisions (entry_id, rev, keyframe, data, size, created_at)
+        VALUES (?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))
+    """, (entry_id, rev, keyframe, data, len(text.encode()), written_at))
+    return rev
+
+
+def revision(conn: sqlite3.Connection, entry_id: int, rev: int) -> Optional[str]:
+    """Text of revision ``rev`` of the entry, or None if there is no such revision."""
+    rows = conn.execute("""
+        SELECT rev, data FROM brain_revisions
+        WHERE entry_id = ?1 AND rev <= ?2 AND rev >= (
+            SELECT MAX(rev) FROM brain_revisions WHERE entry_id = ?1 AND rev <= ?2 AND keyframe
+        )
+        ORDER BY rev
+    """, (entry_id, rev)).fetchall()
+    if not rows or rows[-1][0] != rev:
+        return None
+    text = zlib.decompress(rows[0][1]).decode()
+    for _, delta in rows[1:]:
+        text = apply_delta(text, delta)
+    return text
+
+
+def history(conn: sqlite3.Connection, entry_id: int) -> List[dict]:
+    """Revisions of the entry, oldest first: rev, created_at, size (text bytes),
+    stored (bytes), keyframe."""
+    return [dict(r) for r in conn.execute("""
+        SELECT rev, created_at, size, length(data) AS stored, keyframe FROM brain_revisions
+        WHERE entry_id = ? ORDER BY rev
+    """, (entry_id,))]
+
+
+def remove_entries(conn: sqlite3.Connection, entry_ids: Sequence[int]) -> None:
+    conn.executemany("DELETE FROM brain_revisions WHERE entry_id = ?", [(i,) for i in entry_ids])
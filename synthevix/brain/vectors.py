@@ -0,0 +1,258 @@
+"""Brain module — related-notes index: sparse TF-IDF vectors stored in SQLite.
+
+Each entry's words are hashed to 31-bit term ids. The ``MAX_TERMS`` most
+frequent are kept and weighted by (1 + log tf) · idf, then stored in
+``brain_vectors`` as two packed ``array`` blobs (term ids and float32
+weights) next to the vector's norm. ``brain_df`` holds document frequencies,
+so indexing or removing an entry touches only its own row and the df of its
+own terms. Weights use idf as of when the entry was indexed; ``rebuild``
+refreshes them all.
+
+Similarity search takes candidates from brain_fts (the entry's heaviest terms,
+OR'ed) and reranks them by cosine with one batched sparse dot product — via
+NumPy when it is installed, plain ``array`` otherwise.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import sqlite3
+import zlib
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from synthevix.core.utils import parse_tags
+
+MAX_TERMS = 128          # terms kept per entry (by frequency)
+QUERY_TERMS = 8          # heaviest terms sent to brain_fts for candidates
+CANDIDATES = 200         # candidates reranked per search
+MIN_SIMILARITY = 0.05
+_BATCH = 1000
+
+# brain_df row whose df is the number of indexed entries; term ids start at 1.
+_DOC_COUNT = 0
+
+# Letters then letters/digits: exactly one brain_fts token, so it can be quoted as-is.
+_WORD = re.compile(r"[^\W\d_][^\W_]+")
+_STOP = frozenset("""
+    about after also and are been but can could did does for from had has have her his how into
+    its just like more most not now off our out over she should some such than that the their
+    them then there these they this those too very was were what when where which while who why
+    will with would you your
+""".split())
+
+Vector = Tuple[array, array, float]   # (term ids, weights, norm)
+
+
+def words(text: str) -> Counter:
+    """Lower-cased word counts of ``text``, without stop words."""
+    return Counter(w for w in _WORD.findall(text.lower()) if w not in _STOP)
+
+
+def term_id(word: str) -> int:
+    return zlib.crc32(word.encode()) % 0x7FFFFFFF + 1
+
+
+def entry_text(entry: dict) -> str:
+    return " ".join((entry.get("title") or "", entry.get("content") or "",
+                     " ".join(parse_tags(entry.get("tags") or "[]"))))
+
+
+def _top_terms(text: str) -> Dict[int, Tuple[str, int]]:
+    """term id -> (word, count) for the ``MAX_TERMS`` most frequent words."""
+    return {term_id(w): (w, n) for w, n in words(text).most_common(MAX_TERMS)}
+
+
+def _chunks(items: Sequence, size: int = 500) -> Iterable[Sequence]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _df(conn: sqlite3.Connection, ids: Iterable[int]) -> Dict[int, int]:
+    found: Dict[int, int] = {}
+    for chunk in _chunks(list(ids)):
+        marks = ", ".join("?" for _ in chunk)
+        found.update(conn.execute(
+            f"SELECT term, df FROM brain_df WHERE term IN ({marks})", chunk
+        ).fetchall())
+    return found
+
+
+def is_built(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM brain_df WHERE term = ?", (_DOC_COUNT,)
+    ).fetchone() is not None
+
+
+def _weigh(conn: sqlite3.Connection, top: Dict[int, Tuple[str, int]]) -> Vector:
+    n = conn.execute("SELECT df FROM brain_df WHERE term = ?", (_DOC_COUNT,)).fetchone()
+    n = n[0] if n else 0
+    df = _df(conn, top)
+    ids = array("I", sorted(top))
+    weights = array("f", ((1 + math.log(top[t][1])) * (math.log((n + 1) / (df.get(t, 0) + 1)) + 1)
+                          for t in ids))
+    return ids, weights, math.sqrt(sum(w * w for w in weights))
+
+
+def index_entries(conn: sqlite3.Connection, entries: Iterable[dict]) -> int:
+    """(Re)index entries (dicts with id, title, content, tags); returns the count.
+
+    A no-op until the index is built, so a partial index never passes for a
+    complete one (``rebuild`` backfills it).
+    """
+    if not is_built(conn):
+        return 0
+    done = 0
+    entries = list(entries)
+    for chunk in _chunks(entries, _BATCH):
+        remove_entries(conn, [e["id"] for e in chunk])
+        tops = [_top_terms(entry_text(e)) for e in chunk]
+        # Count the whole chunk into df first so its entries see each other.
+        delta = Counter(t for top in tops for t in top)
+        conn.executemany("""
+            INSERT INTO brain_df (term, df) VALUES (?, ?)
+            ON CONFLICT(term) DO UPDATE SET df = df + excluded.df
+        """, [*delta.items(), (_DOC_COUNT, len(chunk))])
+        rows = []
+        for entry, top in zip(chunk, tops):
+            ids, weights, norm = _weigh(conn, top)
+            rows.append((entry["id"], ids.tobytes(), weights.tobytes(), norm))
+        conn.executemany(
+            "INSERT INTO brain_vectors (entry_id, terms, weights, norm) VALUES (?, ?, ?, ?)", rows
+        )
+        done += len(chunk)
+    return done
+
+
+def index_entry(conn: sqlite3.Connection, entry: dict) -> None:
+    index_entries(conn, [entry])
+
+
+def remove_entries(conn: sqlite3.Connection, entry_ids: Sequence[int]) -> None:
+    """Drop the vectors of ``entry_ids`` and their contribution to brain_df."""
+    for chunk in _chunks(list(entry_ids)):
+        marks = ", ".join("?" for _ in chunk)
+        rows = conn.execute(
+            f"SELECT terms FROM brain_vectors WHERE entry_id IN ({marks})", chunk
+        ).fetchall()
+        if not rows:
+            continue
+        delta: Counter[int] = Counter()
+        for (blob,) in rows:
+            delta.update(array("I", blob))
+        delta[_DOC_COUNT] = len(rows)
+        conn.executemany(
+            "UPDATE brain_df SET df = df - ? WHERE term = ?", [(n, t) for t, n in delta.items()]
+        )
+        del delta[_DOC_COUNT]
+        conn.executemany("DELETE FROM brain_df WHERE term = ? AND df <= 0", [(t,) for t in delta])
+        conn.execute(f"DELETE FROM brain_vectors WHERE entry_id IN ({marks})", chunk)
+
+
+def rebuild(conn: sqlite3.Connection) -> int:
+    """Index every entry from scratch; returns how many were indexed."""
+    conn.execute("DELETE FROM brain_vectors")
+    conn.execute("DELETE FROM brain_df")
+    conn.execute("INSERT INTO brain_df (term, df) VALUES (?, 0)", (_DOC_COUNT,))
+    done, last = 0, 0
+    while True:
+        batch = [dict(r) for r in conn.execute(
+            "SELECT id, title, content, tags FROM brain_text WHERE id > ? ORDER BY id LIMIT ?",
+            (last, _BATCH),
+        )]
+        if not batch:
+            return done
+        done += index_entries(conn, batch)
+        last = batch[-1]["id"]
+
+
+# ── Similarity ────────────────────────────────────────────────────────────────
+
+def _dots(query: Dict[int, float], rows: List[tuple]) -> List[float]:
+    """Sparse dot products of ``query`` with each row's (terms, weights) blobs, batched."""
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is None:
+        return [
+            sum(query.get(t, 0.0) * w for t, w in zip(array("I", terms), array("f", weights)))
+            for terms, weights in rows
+        ]
+
+    q_ids = np.fromiter(sorted(query), dtype=np.uint32, count=len(query))
+    q_weights = np.array([query[int(t)] for t in q_ids], dtype=np.float64)
+    ids = np.frombuffer(b"".join(r[0] for r in rows), dtype=np.uint32)
+    weights = np.frombuffer(b"".join(r[1] for r in rows), dtype=np.float32)
+    owner = np.repeat(np.arange(len(rows)), [len(r[0]) // 4 for r in rows])
+    pos = np.minimum(np.searchsorted(q_ids, ids), len(q_ids) - 1)
+    contrib = np.where(q_ids[pos] == ids, weights * q_weights[pos], 0.0)
+    dots: List[float] = np.bincount(owner, weights=contrib, minlength=len(rows)).tolist()
+    return dots
+
+
+def _candidates(conn: sqlite3.Connection, entry_id: int,
+                query_words: List[str]) -> Optional[List[int]]:
+    """Ids of entries sharing the query's heaviest words, best bm25 first (None without FTS)."""
+    match = " OR ".join(f'"{w}"' for w in query_words)
+    try:
+        rows = conn.execute("""
+            SELECT rowid FROM brain_fts WHERE brain_fts MATCH ? AND rowid != ?
+            ORDER BY rank LIMIT ?
+        """, (match, entry_id, CANDIDATES)).fetchall()
+    except sqlite3.OperationalError:
+        return None
+    return [r[0] for r in rows]
+
+
+def _vectors(conn: sqlite3.Connection, ids: Optional[List[int]],
+             entry_id: int) -> Iterable[List[tuple]]:
+    """Batches of (entry_id, terms, weights, norm); every vector when ``ids`` is None."""
+    if ids is not None:
+        for chunk in _chunks(ids):
+            marks = ", ".join("?" for _ in chunk)
+            yield conn.execute(
+                f"SELECT entry_id, terms, weights, norm FROM brain_vectors "
+                f"WHERE entry_id IN ({marks})",
+                chunk,
+            ).fetchall()
+        return
+    last = 0
+    while batch := conn.execute("""
+        SELECT entry_id, terms, weights, norm FROM brain_vectors
+        WHERE entry_id > ? ORDER BY entry_id LIMIT ?
+    """, (last, _BATCH)).fetchall():
+        last = batch[-1][0]
+        yield [r for r in batch if r[0] != entry_id]
+
+
+def related(conn: sqlite3.Connection, entry: dict, limit: int = 5) -> List[Tuple[int, float]]:
+    """(entry id, cosine similarity) of the entries most like ``entry``, best first.
+
+    Empty until the index is built; on an existing brain that takes a pass
+    over every entry, which only ``rebuild`` makes.
+    """
+    if not is_built(conn):
+        return []
+    top = _top_terms(entry_text(entry))
+    if not top:
+        return []
+    ids, weights, norm = _weigh(conn, top)
+    if not norm:
+        return []
+    query = dict(zip(ids, weights))
+    heaviest = sorted(query, key=lambda t: query[t], reverse=True)[:QUERY_TERMS]
+    candidates = _candidates(conn, entry["id"], [top[t][0] for t in heaviest])
+
+    scored: List[Tuple[int, float]] = []
+    for batch in _vectors(conn, candidates, entry["id"]):
+        if not batch:
+            continue
+        dots = _dots(query, [(r[1], r[2]) for r in batch])
+        scored += [(r[0], dot / (norm * r[3])) for r, dot in zip(batch, dots) if r[3]]
+    scored = [s for s in scored if s[1] >= MIN_SIMILARITY]
+    scored.sort(key=lambda s: s[1], reverse=True)
+    return scored[:limit]
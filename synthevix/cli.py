@@ -0,0 +1,80 @@
+"""Synthevix — console entry point.
+
+Forge aliases are resolved here before anything else is imported: an alias
+run looks up one row and execs its target without loading Typer, Click or
+any sub-command. Everything else falls through to the Typer app in
+``synthevix.main``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import List
+
+# Anything else in argv[1] is looked up as a Forge alias. Kept in step with
+# the commands registered in synthevix.main (tests check both agree).
+TOP_LEVEL_COMMANDS = {
+    "brain", "quest", "cosmos", "forge", "config", "backup",
+    "stats", "dashboard", "tui", "import",
+}
+
+_SHELL_CHARS = set("|&;<>()$`\\*?[]{}~#\n")
+
+
+def _exec_alias(command: str, extra_args: List[str]) -> None:
+    """Replace this process with the alias target; never returns."""
+    import shlex
+
+    full_cmd = " ".join([command, *(shlex.quote(a) for a in extra_args)])
+    if sys.stderr.isatty():
+        sys.stderr.write(f"\033[2m  ⚡ Executing alias: {full_cmd}\033[0m\n")
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    # Plain commands are exec'd directly; pipes, globs, env assignments and
+    # shell builtins still need /bin/sh.
+    argv = shlex.split(full_cmd) if not _SHELL_CHARS & set(command) else []
+    if argv and "=" not in argv[0]:
+        try:
+            os.execvp(argv[0], argv)
+        except FileNotFoundError:
+            pass  # e.g. `cd`; let the shell resolve it
+    os.execv("/bin/sh", ["sh", "-c", full_cmd])
+
+
+def main():
+    """Custom entry point to intercept custom aliases before Typer runs."""
+    prof = None
+    if sys.argv[1:2] and sys.argv[1].startswith("--profile") or os.environ.get("SYNTHEVIX_PROFILE"):
+        from synthevix.core import profiler
+        args = sys.argv[1:]
+        output = profiler.from_argv(args)
+        sys.argv[1:] = args
+        if output is not None:
+            from synthevix.main import LazyGroup
+            prof = profiler.enable(output or None, group_cls=LazyGroup)
+    if os.environ.get("SYNTHEVIX_DEBUG_SQL", "") not in ("", "0"):
+        from synthevix.core import queryplan
+        queryplan.enable()
+
+    if len(sys.argv) > 1:
+        potential_alias = sys.argv[1]
+
+        # Don't intercept known top-level commands or flags
+        if not potential_alias.startswith("-") and potential_alias not in TOP_LEVEL_COMMANDS:
+            try:
+                from synthevix.forge.models import resolve_alias
+                command = resolve_alias(potential_alias)
+            except Exception:
+                command = None  # Fall through to Typer's "no such command"
+            if command:
+                _exec_alias(command, sys.argv[2:])
+
+    # Run the main Typer app
+    from synthevix.main import app
+    try:
+        app()
+    finally:
+        if prof is not None:
+            prof.report()
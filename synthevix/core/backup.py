@@ -0,0 +1,234 @@
+"""Online, content-addressed database backups with a retention policy.
+
+Snapshots are taken with SQLite's online backup API (so pages still sitting in
+the ``-wal`` file are included), hashed, and stored gzip-compressed under
+``backups/objects/<sha256>.db.gz``. ``backups/index.json`` records every backup;
+identical snapshots share one object, so backing up an unchanged database costs
+an index line instead of a new multi-MB file.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from synthevix.core import database
+
+PAGES_PER_STEP = 256
+_LEGACY_PREFIX = "data_"
+
+ProgressFn = Callable[[int, int], None]   # (pages_done, pages_total)
+
+
+@dataclass
+class BackupRecord:
+    id: str
+    created_at: str
+    sha256: str
+    size: int           # uncompressed snapshot bytes
+    stored_size: int    # compressed object bytes (0 for legacy copies)
+    reason: str = "manual"
+    legacy_path: str = ""
+
+    @property
+    def path(self) -> Path:
+        if self.legacy_path:
+            return Path(self.legacy_path)
+        return _objects_dir() / f"{self.sha256}.db.gz"
+
+
+@dataclass
+class RetentionPolicy:
+    keep_daily: int = 7     # newest backup of each of the last N days with backups
+    keep_weekly: int = 4    # newest backup of each of the last M ISO weeks
+
+
+def _objects_dir() -> Path:
+    return database.BACKUP_DIR / "objects"
+
+
+def _index_path() -> Path:
+    return database.BACKUP_DIR / "index.json"
+
+
+def _load_index() -> List[BackupRecord]:
+    try:
+        with open(_index_path(), encoding="utf-8") as f:
+            return [BackupRecord(**r) for r in json.load(f)]
+    except (OSError, ValueError, TypeError):
+        return []
+
+
+def _save_index(records: List[BackupRecord]) -> None:
+    path = _index_path()
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump([asdict(r) for r in records], f, indent=2)
+    os.replace(tmp, path)
+
+
+def _legacy_records() -> List[BackupRecord]:
+    """Plain ``data_YYYYMMDD_HHMMSS.db`` copies made by older versions."""
+    records = []
+    for p in sorted(database.BACKUP_DIR.glob(f"{_LEGACY_PREFIX}*.db")):
+        try:
+            ts = datetime.strptime(p.stem[len(_LEGACY_PREFIX):], "%Y%m%d_%H%M%S")
+        except ValueError:
+            continue
+        records.append(BackupRecord(
+            id=p.stem, created_at=ts.isoformat(timespec="seconds"), sha256="",
+            size=p.stat().st_size, stored_size=0, reason="legacy", legacy_path=str(p),
+        ))
+    return records
+
+
+def _snapshot(dest: Path, progress: Optional[ProgressFn]) -> None:
+    """Copy the live database into ``dest`` page by page."""
+    src = database.get_connection()   # private reader: sees the last committed state
+    dst = sqlite3.connect(str(dest))
+    try:
+        def _step(status: int, remaining: int, total: int) -> None:
+            if progress:
+                progress(total - remaining, total)
+        src.backup(dst, pages=PAGES_PER_STEP, progress=_step)
+    finally:
+        dst.close()
+        src.close()
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def create_backup(reason: str = "manual",
+                  progress: Optional[ProgressFn] = None) -> Optional[BackupRecord]:
+    """Snapshot the database into the store. Returns None if there is no database yet."""
+    database._ensure_dirs()
+    if not database.DB_PATH.exists():
+        return None
+    objects = _objects_dir()
+    objects.mkdir(exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(suffix=".db", dir=database.BACKUP_DIR)
+    os.close(fd)
+    tmp = Path(tmp_name)
+    try:
+        _snapshot(tmp, progress)
+        digest = _sha256(tmp)
+        size = tmp.stat().st_size
+        obj = objects / f"{digest}.db.gz"
+        if not obj.exists():
+            part = obj.with_suffix(".gz.part")
+            with open(tmp, "rb") as src, gzip.open(part, "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+            os.replace(part, obj)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+    now = datetime.now()
+    record = BackupRecord(
+        id=now.strftime("%Y%m%d_%H%M%S_%f"),
+        created_at=now.isoformat(timespec="seconds"),
+        sha256=digest,
+        size=size,
+        stored_size=obj.stat().st_size,
+        reason=reason,
+    )
+    records = _load_index()
+    records.append(record)
+    _save_index(records)
+    return record
+
+
+def list_backups() -> List[BackupRecord]:
+    """All known backups (store + legacy copies), newest first."""
+    records = _load_index() + _legacy_records()
+    return sorted(records, key=lambda r: r.created_at, reverse=True)
+
+
+def _retained(records: List[BackupRecord], policy: RetentionPolicy) -> set:
+    keep = {records[0].id} if records else set()
+    days: dict = {}
+    weeks: dict = {}
+    for r in records:  # newest first, so the first hit per bucket is the newest
+        ts = datetime.fromisoformat(r.created_at)
+        days.setdefault(ts.date(), r.id)
+        weeks.setdefault(ts.isocalendar()[:2], r.id)
+    keep.update(list(days.values())[:policy.keep_daily])
+    keep.update(list(weeks.values())[:policy.keep_weekly])
+    return keep
+
+
+def prune_backups(policy: Optional[RetentionPolicy] = None,
+                  dry_run: bool = False) -> List[BackupRecord]:
+    """Apply the retention policy and delete unreferenced objects. Returns removed records."""
+    policy = policy or RetentionPolicy()
+    records = list_backups()
+    keep = _retained(records, policy)
+    removed = [r for r in records if r.id not in keep]
+    if dry_run or not removed:
+        return removed
+
+    _save_index([r for r in _load_index() if r.id in keep])
+    for r in removed:
+        if r.legacy_path:
+            Path(r.legacy_path).unlink(missing_ok=True)
+
+    referenced = {r.sha256 for r in _load_index()}
+    for obj in _objects_dir().glob("*.db.gz"):
+        if obj.name[:-len(".db.gz")] not in referenced:
+            obj.unlink()
+    return removed
+
+
+def find_backup(ref: str) -> Optional[BackupRecord]:
+    """Look up a backup by id or sha256 prefix."""
+    for r in list_backups():
+        if r.id.startswith(ref) or (r.sha256 and r.sha256.startswith(ref)):
+            return r
+    return None
+
+
+def restore_backup(src: Path, progress: Optional[ProgressFn] = None) -> None:
+    """Replace the live database contents with ``src`` (.db or .db.gz).
+
+    Uses the backup API in reverse so other open connections and the WAL file
+    stay consistent, then brings the schema up to date.
+    """
+    tmp: Optional[Path] = None
+    if src.suffix == ".gz":
+        fd, tmp_name = tempfile.mkstemp(suffix=".db", dir=database.BACKUP_DIR)
+        os.close(fd)
+        tmp = Path(tmp_name)
+        with gzip.open(src, "rb") as f, open(tmp, "wb") as out:
+            shutil.copyfileobj(f, out, 1 << 20)
+        src = tmp
+    try:
+        source = sqlite3.connect(str(src))
+        target = database.get_connection()
+        try:
+            def _step(status: int, remaining: int, total: int) -> None:
+                if progress:
+                    progress(total - remaining, total)
+            source.backup(target, pages=PAGES_PER_STEP, progress=_step)
+        finally:
+            target.close()
+            source.close()
+    finally:
+        if tmp:
+            tmp.unlink(missing_ok=True)
+    database.close_connection()
+    database.init_db(force=True)
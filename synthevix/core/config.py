@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import marshal
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
-
-import toml
+from typing import List, Tuple
 
 SYNTHEVIX_DIR = Path.home() / ".synthevix"
 CONFIG_PATH = SYNTHEVIX_DIR / "config.toml"
 
+# Bump when the snapshot layout changes so stale files are ignored.
+_SNAPSHOT_FORMAT = 1
+
 _DEFAULTS: dict = {
     "general": {
         "username": "Commander",
@@ -39,6 +42,13 @@ _DEFAULTS: dict = {
         "streak_reset_hour": 4,
         "xp_multiplier": 1.0,
     },
+    "backup": {
+        "keep_daily": 7,
+        "keep_weekly": 4,
+    },
+    "brain": {
+        "fts_detail": "full",
+    },
 }
 
 
@@ -79,6 +89,17 @@ class QuestConfig:
     xp_multiplier: float = 1.0
 
 
+@dataclass
+class BackupConfig:
+    keep_daily: int = 7
+    keep_weekly: int = 4
+
+
+@dataclass
+class BrainConfig:
+    fts_detail: str = "full"      # "column": smaller index, no phrase queries
+
+
 @dataclass
 class Config:
     general: GeneralConfig = field(default_factory=GeneralConfig)
@@ -86,6 +107,8 @@ class Config:
     cosmos: CosmosConfig = field(default_factory=CosmosConfig)
     forge: ForgeConfig = field(default_factory=ForgeConfig)
     quest: QuestConfig = field(default_factory=QuestConfig)
+    backup: BackupConfig = field(default_factory=BackupConfig)
+    brain: BrainConfig = field(default_factory=BrainConfig)
 
 
 def _deep_merge(base: dict, override: dict) -> dict:
@@ -99,18 +122,75 @@ def _deep_merge(base: dict, override: dict) -> dict:
     return result
 
 
-def load_config() -> Config:
-    """Load config from disk, filling in any missing keys with defaults."""
-    SYNTHEVIX_DIR.mkdir(parents=True, exist_ok=True)
-    if not CONFIG_PATH.exists():
-        save_raw(_DEFAULTS)
+# ── Cache ──────────────────────────────────────────────────────────────────────
+#
+# Parsing TOML is the slowest part of startup, and commands call load_config()
+# many times per run. The parsed file is cached in-process and in a marshal
+# snapshot next to config.toml, both keyed on (path, mtime_ns, size) so an
+# edit from $EDITOR is picked up on the next call.
+
+_memo: dict = {}
+
 
+def _stat_key() -> Tuple[str, int, int]:
+    st = os.stat(CONFIG_PATH)
+    return (str(CONFIG_PATH), st.st_mtime_ns, st.st_size)
+
+
+def _snapshot_path() -> Path:
+    return CONFIG_PATH.with_name(CONFIG_PATH.name + ".cache")
+
+
+def _read_raw(key: Tuple[str, int, int]) -> dict:
+    """Return the parsed config file, from the snapshot when it is current."""
+    snapshot = _snapshot_path()
+    raw: dict
+    try:
+        with open(snapshot, "rb") as f:
+            fmt, cached_key, raw = marshal.load(f)
+        if fmt == _SNAPSHOT_FORMAT and tuple(cached_key) == key:
+            return raw
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    import toml
     try:
         raw = toml.load(str(CONFIG_PATH))
     except Exception:
         raw = {}
 
-    merged = _deep_merge(_DEFAULTS, raw)
+    tmp = snapshot.with_name(f"{snapshot.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            marshal.dump((_SNAPSHOT_FORMAT, key, raw), f)
+        os.replace(tmp, snapshot)
+    except (OSError, ValueError):  # ValueError: TOML dates aren't marshallable
+        tmp.unlink(missing_ok=True)
+    return raw
+
+
+def invalidate_config_cache() -> None:
+    """Drop cached config so the next load_config() re-reads config.toml."""
+    _memo.clear()
+    _snapshot_path().unlink(missing_ok=True)
+
+
+def load_config() -> Config:
+    """Load config from disk, filling in any missing keys with defaults."""
+    try:
+        key = _stat_key()
+    except FileNotFoundError:
+        save_raw(_DEFAULTS)
+        key = _stat_key()
+
+    if _memo.get("key") == key:
+        merged = marshal.loads(_memo["blob"])  # fresh copy: callers mutate Config
+    else:
+        merged = _deep_merge(_DEFAULTS, _read_raw(key))
+        try:
+            _memo.update(key=key, blob=marshal.dumps(merged))
+        except ValueError:
+            _memo.clear()
 
     return Config(
         general=GeneralConfig(**merged["general"]),
@@ -118,14 +198,18 @@ def load_config() -> Config:
         cosmos=CosmosConfig(**merged["cosmos"]),
         forge=ForgeConfig(**merged["forge"]),
         quest=QuestConfig(**merged["quest"]),
+        backup=BackupConfig(**merged["backup"]),
+        brain=BrainConfig(**merged["brain"]),
     )
 
 
 def save_raw(data: dict) -> None:
     """Write a raw dict as the config file."""
+    import toml
     SYNTHEVIX_DIR.mkdir(parents=True, exist_ok=True)
     with open(CONFIG_PATH, "w") as f:
         toml.dump(data, f)
+    invalidate_config_cache()
 
 
 def save_config(cfg: Config) -> None:
@@ -137,6 +221,8 @@ def save_config(cfg: Config) -> None:
         "cosmos": dataclasses.asdict(cfg.cosmos),
         "forge": dataclasses.asdict(cfg.forge),
         "quest": dataclasses.asdict(cfg.quest),
+        "backup": dataclasses.asdict(cfg.backup),
+        "brain": dataclasses.asdict(cfg.brain),
     }
     save_raw(raw)
 
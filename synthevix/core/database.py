@@ -2,52 +2,219 @@
 
 from __future__ import annotations
 
-import shutil
+import atexit
+import os
+import re
 import sqlite3
-from datetime import datetime
+import sys
+import threading
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, fields, replace
 from pathlib import Path
+from typing import ContextManager, Iterator, List, Optional
 
 SYNTHEVIX_DIR = Path.home() / ".synthevix"
 DB_PATH = SYNTHEVIX_DIR / "data.db"
 BACKUP_DIR = SYNTHEVIX_DIR / "backups"
 
-_SCHEMA_VERSION = 3
+_SCHEMA_VERSION = 15
+
+_dirs_ready: set = set()
 
 
 def _ensure_dirs() -> None:
+    key = (SYNTHEVIX_DIR, BACKUP_DIR)
+    if key in _dirs_ready:
+        return
     SYNTHEVIX_DIR.mkdir(parents=True, exist_ok=True)
     BACKUP_DIR.mkdir(parents=True, exist_ok=True)
     (SYNTHEVIX_DIR / "themes").mkdir(exist_ok=True)
     (SYNTHEVIX_DIR / "templates").mkdir(exist_ok=True)
     (SYNTHEVIX_DIR / "exports").mkdir(exist_ok=True)
+    _dirs_ready.add(key)
 
 
-def get_connection() -> sqlite3.Connection:
-    """Return a SQLite connection with row_factory set."""
+# ── Connection management ──────────────────────────────────────────────────────
+
+@dataclass
+class PragmaProfile:
+    """Per-connection tuning applied once when a connection is opened."""
+
+    foreign_keys: str = "ON"
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"      # safe with WAL, avoids an fsync per commit
+    temp_store: str = "MEMORY"
+    cache_size: int = -16000         # negative = KiB, i.e. ~16 MiB of page cache
+    mmap_size: int = 64 * 1024 * 1024
+    busy_timeout: int = 5000         # ms to wait on a locked database
+
+    def statements(self) -> List[str]:
+        return [f"PRAGMA {f.name} = {getattr(self, f.name)}" for f in fields(self)]
+
+
+# Swapped by core.profiler to time every statement; plain connections otherwise.
+_connection_factory = sqlite3.Connection
+
+
+def _connect(path: Path, profile: PragmaProfile) -> sqlite3.Connection:
     _ensure_dirs()
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = sqlite3.connect(str(path), factory=_connection_factory)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    conn.execute("PRAGMA journal_mode = WAL")
+    # The brain_text view and the brain FTS triggers decompress stored bodies.
+    conn.create_function("brain_unpack", 1, _unpack_sql, deterministic=True)
+    for stmt in profile.statements():
+        conn.execute(stmt)
     return conn
 
 
-def backup_db() -> Path:
-    """Create a timestamped backup of the database file."""
-    _ensure_dirs()
-    if DB_PATH.exists():
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        dest = BACKUP_DIR / f"data_{ts}.db"
-        shutil.copy2(DB_PATH, dest)
-        return dest
-    return DB_PATH
+class ConnectionManager:
+    """Keep one configured connection per thread and hand it out on demand.
+
+    The connection is reopened transparently if ``DB_PATH`` changes (tests
+    redirect it) or the process forks.
+    """
+
+    def __init__(self, profile: PragmaProfile | None = None) -> None:
+        self.profile = profile or PragmaProfile()
+        self._local = threading.local()
+
+    def connection(self) -> sqlite3.Connection:
+        local = self._local
+        conn: Optional[sqlite3.Connection] = getattr(local, "conn", None)
+        if conn is not None and local.path == DB_PATH and local.pid == os.getpid():
+            return conn
+        if conn is not None and local.pid == os.getpid():
+            conn.close()
+        conn = local.conn = _connect(DB_PATH, self.profile)
+        local.path = DB_PATH
+        local.pid = os.getpid()
+        local.depth = 0
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Commit on success, roll back on error. Nested blocks join the outer one."""
+        conn = self.connection()
+        local = self._local
+        if local.depth:
+            local.depth += 1
+            try:
+                yield conn
+            finally:
+                local.depth -= 1
+            return
+        local.depth = 1
+        try:
+            with conn:
+                yield conn
+        finally:
+            local.depth = 0
 
+    def configure(self, **overrides) -> None:
+        """Change pragma settings; the current thread's connection is reopened."""
+        self.profile = replace(self.profile, **overrides)
+        self.close()
 
-def init_db() -> None:
-    """Create all tables if they don't exist and seed static data."""
-    _ensure_dirs()
-    conn = get_connection()
-    with conn:
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            conn.close()
+        self._local.conn = None
+
+
+_manager = ConnectionManager()
+atexit.register(_manager.close)
+
+
+def connection() -> sqlite3.Connection:
+    """Return this thread's shared connection. Do not close it."""
+    return _manager.connection()
+
+
+def transaction() -> ContextManager[sqlite3.Connection]:
+    """Context manager yielding the shared connection inside a transaction."""
+    return _manager.transaction()
+
+
+def configure_pragmas(**overrides) -> None:
+    """Tune the pragma profile used by shared connections (e.g. cache_size=-64000)."""
+    _manager.configure(**overrides)
+
+
+def close_connection() -> None:
+    """Close this thread's shared connection (it reopens on next use)."""
+    _manager.close()
+
+
+def begin(conn: sqlite3.Connection) -> None:
+    """Open a transaction on ``conn`` unless one is already open.
+
+    sqlite3 only begins one implicitly before INSERT/UPDATE/DELETE, so DDL
+    that runs first would otherwise commit on its own and survive a rollback.
+    """
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+
+
+@contextmanager
+def suspend_triggers(conn: sqlite3.Connection, *names: str) -> Iterator[List[str]]:
+    """Drop the named triggers for the duration of the block, then recreate them.
+
+    Use inside ``transaction()``: the drops join its transaction, so if the
+    block fails, rolling it back brings the triggers back as they were.
+    Yields the names that actually existed.
+    """
+    marks = ", ".join("?" for _ in names)
+    saved = conn.execute(
+        f"SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name IN ({marks})", names
+    ).fetchall()
+    if saved:
+        begin(conn)
+    for name, _ in saved:
+        conn.execute(f"DROP TRIGGER {name}")
+    try:
+        yield [name for name, _ in saved]
+    finally:
+        for _, sql in saved:
+            conn.execute(sql)
+
+
+def get_connection() -> sqlite3.Connection:
+    """Return a new, independently owned connection with row_factory set.
+
+    Model code should use ``connection()``/``transaction()`` instead; this is
+    for callers that need a private connection they close themselves.
+    """
+    return _connect(DB_PATH, _manager.profile)
+
+
+def backup_db(reason: str = "manual") -> Path:
+    """Snapshot the database into the backup store and return the object path."""
+    from synthevix.core.backup import create_backup
+
+    record = create_backup(reason)
+    return record.path if record else DB_PATH
+
+
+_schema_ready: set = set()
+
+
+def init_db(force: bool = False) -> None:
+    """Create all tables if they don't exist and seed static data.
+
+    When the schema is already current this costs one ``PRAGMA user_version``
+    read (nothing at all after the first call in a process) and never takes
+    the write lock. ``force`` re-runs the DDL regardless, e.g. after a restore.
+    """
+    if not force:
+        if DB_PATH in _schema_ready:
+            return
+        if connection().execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+            _schema_ready.add(DB_PATH)
+            return
+
+    with transaction() as conn:
         # ── Brain ─────────────────────────────────────────────────────────
         conn.execute("""
             CREATE TABLE IF NOT EXISTS brain_entries (
@@ -180,7 +347,10 @@ def init_db() -> None:
 
         _run_migrations(conn)
 
-    conn.close()
+        # Fast-path marker checked above; schema_version keeps the history.
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    _schema_ready.add(DB_PATH)
 
 
 _ACHIEVEMENTS = [
@@ -203,14 +373,372 @@ def _seed_achievements(conn: sqlite3.Connection) -> None:
     """, _ACHIEVEMENTS)
 
 
+def _tags_json(col: str) -> str:
+    """SQL expression yielding ``col`` if it is a JSON array, else '[]' (json_each-safe)."""
+    return f"CASE WHEN json_valid({col}) AND json_type({col}) = 'array' THEN {col} ELSE '[]' END"
+
+
+def _create_tag_index(conn: sqlite3.Connection) -> None:
+    """Normalized (entry_id, tag) rows mirroring brain_entries.tags, kept in sync by triggers."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS entry_tags (
+            entry_id INTEGER NOT NULL,
+            tag      TEXT    NOT NULL,
+            PRIMARY KEY (entry_id, tag)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_entry_tags_tag ON entry_tags(tag, entry_id)")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS after_brain_insert_tags
+        AFTER INSERT ON brain_entries BEGIN
+          INSERT OR IGNORE INTO entry_tags (entry_id, tag)
+            SELECT new.id, value FROM json_each({_tags_json('new.tags')}) WHERE type = 'text';
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS after_brain_update_tags
+        AFTER UPDATE OF tags ON brain_entries BEGIN
+          DELETE FROM entry_tags WHERE entry_id = old.id;
+          INSERT OR IGNORE INTO entry_tags (entry_id, tag)
+            SELECT new.id, value FROM json_each({_tags_json('new.tags')}) WHERE type = 'text';
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS after_brain_delete_tags
+        AFTER DELETE ON brain_entries BEGIN
+          DELETE FROM entry_tags WHERE entry_id = old.id;
+        END
+    """)
+
+
+def index_entry_tags(conn: sqlite3.Connection, after_id: int = 0) -> None:
+    """Fill entry_tags for brain entries with id above ``after_id`` in one statement."""
+    conn.execute(f"""
+        INSERT OR IGNORE INTO entry_tags (entry_id, tag)
+        SELECT b.id, j.value FROM brain_entries b, json_each({_tags_json('b.tags')}) j
+        WHERE b.id > ? AND j.type = 'text'
+    """, (after_id,))
+
+
+# ── Brain bodies ───────────────────────────────────────────────────────────────
+
+# Content longer than BODY_INLINE_LIMIT bytes is stored zlib-compressed in
+# brain_bodies; brain_entries.content then holds only its first PREVIEW_CHARS
+# characters, so listing and searching never read the whole body. The
+# brain_text view (and the FTS tables reading through it) has the full text.
+BODY_INLINE_LIMIT = 4096
+PREVIEW_CHARS = 240
+_BODY_COMPRESSION = 6
+
+
+def pack_body(text: str) -> Optional[bytes]:
+    """``text`` zlib-compressed, or None if it is short enough (or compresses too
+    poorly) to store inline."""
+    raw = text.encode()
+    if len(raw) <= BODY_INLINE_LIMIT:
+        return None
+    data = zlib.compress(raw, _BODY_COMPRESSION)
+    return data if len(data) < len(raw) * 0.9 else None
+
+
+def unpack_body(data: bytes) -> str:
+    return zlib.decompress(data).decode()
+
+
+def _unpack_sql(data: Optional[bytes]) -> Optional[str]:
+    return None if data is None else unpack_body(data)
+
+
+def store_body(conn: sqlite3.Connection, text: str) -> tuple:
+    """(content, body_id) to write to brain_entries for ``text``.
+
+    Large text is inserted into brain_bodies and replaced by a preview;
+    anything else is kept inline with a None body id. Callers delete the body
+    an entry pointed at before only after the entry has moved off it, so the
+    FTS triggers can still read the old text.
+    """
+    data = pack_body(text)
+    if data is None:
+        return text, None
+    cur = conn.execute(
+        "INSERT INTO brain_bodies (size, data) VALUES (?, ?)", (len(text.encode()), data)
+    )
+    return text[:PREVIEW_CHARS], cur.lastrowid
+
+
+def _full_text(ref: str) -> str:
+    """SQL for the whole content of entry ``ref`` (``new``, ``old`` or a table alias)."""
+    return (f"COALESCE((SELECT brain_unpack(data) FROM brain_bodies WHERE id = {ref}.body_id), "
+            f"{ref}.content, '')")
+
+
+def _full_size(ref: str) -> str:
+    """SQL for the content bytes of entry ``ref``, stored inline or not."""
+    return (f"COALESCE((SELECT size FROM brain_bodies WHERE id = {ref}.body_id), "
+            f"length(CAST({ref}.content AS BLOB)))")
+
+
+def _create_body_store(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS brain_bodies (
+            id   INTEGER PRIMARY KEY,
+            size INTEGER NOT NULL,
+            data BLOB    NOT NULL
+        )
+    """)
+    try:
+        conn.execute("ALTER TABLE brain_entries ADD COLUMN body_id INTEGER")
+    except sqlite3.OperationalError:
+        pass  # already exists
+    conn.execute("""
+        CREATE VIEW IF NOT EXISTS brain_text AS
+        SELECT e.id, e.type, e.title, COALESCE(brain_unpack(b.data), e.content) AS content,
+               e.tags, e.language, e.url, e.mood_id, e.created_at, e.updated_at,
+               e.next_review_at, e.review_step
+        FROM brain_entries e LEFT JOIN brain_bodies b ON b.id = e.body_id
+    """)
+
+
+def pack_bodies(conn: sqlite3.Connection) -> tuple:
+    """Move the content of large inline entries into brain_bodies.
+
+    Returns (entries packed, bytes before, bytes after), counting the
+    preview left in brain_entries as part of what is stored.
+    """
+    ids = [r[0] for r in conn.execute(
+        "SELECT id FROM brain_entries WHERE body_id IS NULL AND length(CAST(content AS BLOB)) > ?",
+        (BODY_INLINE_LIMIT,),
+    )]
+    packed = before = after = 0
+    for entry_id in ids:
+        text = conn.execute(
+            "SELECT content FROM brain_entries WHERE id = ?", (entry_id,)
+        ).fetchone()[0]
+        content, body_id = store_body(conn, text)
+        if body_id is None:
+            continue
+        conn.execute(
+            "UPDATE brain_entries SET content = ?, body_id = ? WHERE id = ?",
+            (content, body_id, entry_id),
+        )
+        packed += 1
+        before += len(text.encode())
+        after += len(content.encode()) + conn.execute(
+            "SELECT length(data) FROM brain_bodies WHERE id = ?", (body_id,)
+        ).fetchone()[0]
+    return packed, before, after
+
+
+# ── Brain statistics ───────────────────────────────────────────────────────────
+
+def _stats_rows(ref: str, source: str = "", where: str = "true", bodies: bool = True) -> str:
+    """(kind, key, id, bytes) rows brain entries contribute to brain_stats.
+
+    ``ref`` is the entry: ``new``/``old`` inside a trigger, or the alias of
+    ``source`` (e.g. ``brain_entries b``) filtered by ``where`` to read many.
+    ``bodies`` counts content stored in brain_bodies (schema version 14 on).
+    """
+    size = _full_size(ref) if bodies else f"length(CAST({ref}.content AS BLOB))"
+    src = f" FROM {source}" if source else ""
+    tags = f"{src}, json_each({_tags_json(ref + '.tags')}) t" if source else \
+        f" FROM json_each({_tags_json(ref + '.tags')}) t"
+    return f"""
+        SELECT 'total' AS kind, '' AS key, {ref}.id AS id, {size} AS bytes{src} WHERE {where}
+        UNION ALL SELECT 'type', {ref}.type, {ref}.id, {size}{src} WHERE {where}
+        UNION ALL SELECT 'language', {ref}.language, {ref}.id, {size}{src}
+                  WHERE {where} AND {ref}.language IS NOT NULL
+        UNION ALL SELECT DISTINCT 'tag', t.value, {ref}.id, {size}{tags}
+                  WHERE {where} AND t.type = 'text'
+    """
+
+
+def _add_stats(rows: str, sign: int = 1) -> str:
+    # WHERE true keeps the parser from reading ON CONFLICT as a join constraint.
+    return f"""
+        INSERT INTO brain_stats (kind, key, count, bytes)
+        SELECT kind, key, {sign} * COUNT(*), {sign} * SUM(bytes) FROM ({rows})
+        WHERE true GROUP BY kind, key
+        ON CONFLICT(kind, key) DO UPDATE
+        SET count = count + excluded.count, bytes = bytes + excluded.bytes
+    """
+
+
+def _drop_empty_stats(rows: str) -> str:
+    return f"""
+        DELETE FROM brain_stats WHERE count <= 0 AND kind != 'total'
+          AND (kind, key) IN (SELECT kind, key FROM ({rows}))
+    """
+
+
+def _create_brain_stats(conn: sqlite3.Connection, bodies: bool = True) -> None:
+    """Entry counts and content bytes per kind ('total', 'type', 'language',
+    'tag'), kept by triggers."""
+    new, old = _stats_rows("new", bodies=bodies), _stats_rows("old", bodies=bodies)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS brain_stats (
+            kind  TEXT    NOT NULL,
+            key   TEXT    NOT NULL,
+            count INTEGER NOT NULL,
+            bytes INTEGER NOT NULL,
+            PRIMARY KEY (kind, key)
+        ) WITHOUT ROWID
+    """)
+    # Most-used tags first without sorting them all.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_brain_stats_count ON brain_stats(kind, count DESC, key)"
+    )
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS after_brain_insert_stats
+        AFTER INSERT ON brain_entries BEGIN
+          {_add_stats(new)};
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS after_brain_update_stats
+        AFTER UPDATE OF type, language, content, tags{', body_id' if bodies else ''}
+        ON brain_entries BEGIN
+          {_add_stats(old, -1)};
+          {_add_stats(new)};
+          {_drop_empty_stats(old)};
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS after_brain_delete_stats
+        AFTER DELETE ON brain_entries BEGIN
+          {_add_stats(old, -1)};
+          {_drop_empty_stats(old)};
+        END
+    """)
+
+
+def index_brain_stats(conn: sqlite3.Connection, after_id: int = 0, bodies: bool = True) -> None:
+    """Add brain entries with id above ``after_id`` to brain_stats in one statement."""
+    rows = _stats_rows("b", "brain_entries b", "b.id > :after", bodies)
+    conn.execute(_add_stats(rows), {"after": after_id})
+
+
+# ── Brain FTS storage ──────────────────────────────────────────────────────────
+
+# detail=column drops token positions from brain_fts, which makes it much smaller
+# on disk but rules out phrase queries; prefix indexes turn 2–3 character
+# completions (``py*``) into a single lookup.
+FTS_DETAILS = ("full", "column")
+FTS_PREFIX = "2 3"
+_FTS_OPTION = re.compile(r"\b(detail|prefix)\s*=\s*(?:'([^']*)'|\"([^\"]*)\"|(\w+))", re.I)
+
+
+def fts_options(conn: sqlite3.Connection, table: str = "brain_fts") -> Optional[dict]:
+    """``detail`` and ``prefix`` options ``table`` was built with, or None if it
+    doesn't exist."""
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    if row is None:
+        return None
+    options = {"detail": "full", "prefix": ""}
+    for m in _FTS_OPTION.finditer(row[0]):
+        options[m.group(1).lower()] = next(v for v in m.groups()[1:] if v is not None).lower()
+    return options
+
+
+def rebuild_brain_fts(conn: sqlite3.Connection, detail: str = "full", prefix: str = FTS_PREFIX,
+                      content: str = "brain_text") -> None:
+    """Recreate brain_fts with the given storage options and reindex every entry.
+
+    The sync triggers name the table rather than hold a reference to it, so
+    they keep working across the drop and recreate. ``content`` is the table
+    or view it reads entries from.
+    """
+    if detail not in FTS_DETAILS:
+        raise ValueError(f"Unknown FTS detail '{detail}'. Use: {', '.join(FTS_DETAILS)}")
+    options = "" if detail == "full" else f", detail={detail}"
+    if prefix:
+        options += f", prefix='{prefix}'"
+    begin(conn)  # so a failed rebuild rolls back to the old index instead of none
+    conn.execute("DROP TABLE IF EXISTS brain_fts")
+    conn.execute(f"""
+        CREATE VIRTUAL TABLE brain_fts
+        USING fts5(title, content, tags, content="{content}", content_rowid="id"{options})
+    """)
+    conn.execute("INSERT INTO brain_fts(brain_fts) VALUES('rebuild')")
+    conn.execute("INSERT INTO brain_fts(brain_fts) VALUES('optimize')")
+
+
+# FTS tables over brain_entries: the suffix of their sync triggers and their columns.
+_FTS_TABLES = {
+    "brain_fts": ("", ("title", "content", "tags")),
+    "brain_trigram": ("_trigram", ("title", "content", "tags", "url")),
+}
+
+
+def _create_fts_triggers(conn: sqlite3.Connection) -> None:
+    """(Re)create the triggers keeping each existing FTS table in step with
+    brain_entries.
+
+    They index the full text, so an entry's old body must still exist when
+    it is updated or deleted (see ``store_body``).
+    """
+    for table, (suffix, columns) in _FTS_TABLES.items():
+        if fts_options(conn, table) is None:
+            continue
+        cols = ", ".join(columns)
+
+        def values(ref: str) -> str:
+            return ", ".join(
+                _full_text(ref) if c == "content" else f"COALESCE({ref}.{c},'')"
+                for c in columns
+            )
+
+        delete = (f"INSERT INTO {table}({table}, rowid, {cols}) "
+                  f"VALUES ('delete', old.id, {values('old')});")
+        insert = f"INSERT INTO {table}(rowid, {cols}) VALUES (new.id, {values('new')});"
+        for event in ("insert", "update", "delete"):
+            conn.execute(f"DROP TRIGGER IF EXISTS after_brain_{event}{suffix}")
+        conn.execute(f"""
+            CREATE TRIGGER after_brain_insert{suffix} AFTER INSERT ON brain_entries
+            BEGIN {insert} END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER after_brain_update{suffix}
+            AFTER UPDATE OF {cols}, body_id ON brain_entries
+            BEGIN {delete} {insert} END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER after_brain_delete{suffix} AFTER DELETE ON brain_entries
+            BEGIN {delete} END
+        """)
+
+
+def _narrow_update_trigger(conn: sqlite3.Connection, name: str, columns: tuple) -> None:
+    """Recreate an ``AFTER UPDATE`` trigger so it fires only when ``columns`` change."""
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (name,)
+    ).fetchone()
+    if row is None or "AFTER UPDATE ON" not in row[0]:
+        return
+    conn.execute(f"DROP TRIGGER {name}")
+    conn.execute(row[0].replace("AFTER UPDATE ON", f"AFTER UPDATE OF {', '.join(columns)} ON", 1))
+
+
+_USER_TABLES = ("brain_entries", "quests", "mood_logs", "forge_aliases", "user_achievements")
+
+
+def _has_user_data(conn: sqlite3.Connection) -> bool:
+    return any(
+        conn.execute(f"SELECT EXISTS (SELECT 1 FROM {t})").fetchone()[0] for t in _USER_TABLES
+    )
+
+
 def _run_migrations(conn: sqlite3.Connection) -> None:
     """Apply schema upgrades in version order."""
     row = conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version").fetchone()
     version = row[0] if row else 0
 
-    if version < 2:
-        backup_db()
+    # One snapshot covers the whole upgrade; a fresh database has nothing to lose.
+    if version < _SCHEMA_VERSION and _has_user_data(conn):
+        backup_db("migration")
 
+    if version < 2:
         # Add recurrence column (idempotent)
         try:
             conn.execute("ALTER TABLE quests ADD COLUMN repeat TEXT DEFAULT 'none'")
@@ -253,7 +781,6 @@ def _run_migrations(conn: sqlite3.Connection) -> None:
         conn.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (2)")
 
     if version < 3:
-        backup_db()
         conn.execute("""
             CREATE TABLE IF NOT EXISTS pomodoro_sessions (
                 id               INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -263,3 +790,228 @@ def _run_migrations(conn: sqlite3.Connection) -> None:
             )
         """)
         conn.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (3)")
+
+    if version < 4:
+        # Indexes for the date-range and status/recency queries the models run
+        # (see core.queryplan; tests/test_queryplan.py keeps them scan-free).
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_quests_created ON quests(created_at)")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_quests_status_created ON quests(status, created_at)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_quests_status_completed ON quests(status, completed_at)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_mood_logged ON mood_logs(logged_at)")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_pomodoro_completed ON pomodoro_sessions(completed_at)"
+        )
+        # Deleting a quest checks this foreign key; without it that's a full scan.
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_pomodoro_quest ON pomodoro_sessions(quest_id)")
+        conn.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (4)")
+
+    if version < 5:
+        _create_tag_index(conn)
+        index_entry_tags(conn)
+        conn.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (5)")
+
+    if version < 6:
+        # Keyset pages (core.pagination) walk these newest-first without a sort.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_brain_type_created ON brain_entries(type, created_at)"
+        )
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_quests_history ON quests(created_at)
+            WHERE status IN ('completed', 'failed')
+        """)
+        conn.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (6)")
+
+    if version < 7:
+        # Substring / fuzzy search over brain_fts's columns plus bookmark URLs.
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS brain_trigram
+                USING fts5(title, content, tags, url, content="brain_entries",
+                           content_rowid="id", tokenize="trigram")
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS after_brain_insert_trigram
+                AFTER INSERT ON brain_entries BEGIN
+                  INSERT INTO brain_trigram(rowid, title, content, tags, url)
+                    VALUES (new.id, COALESCE(new.title,''), COALESCE(new.content,''),
+                            COALESCE(new.tags,''), COALESCE(new.url,''));
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS after_brain_update_trigram
+                AFTER UPDATE ON brain_entries BEGIN
+                  INSERT INTO brain_trigram(brain_trigram, rowid, title, content, tags, url)
+                    VALUES ('delete', old.id, COALESCE(old.title,''), COALESCE(old.content,''),
+                            COALESCE(old.tags,''), COALESCE(old.url,''));
+                  INSERT INTO brain_trigram(rowid, title, content, tags, url)
+                    VALUES (new.id, COALESCE(new.title,''), COALESCE(new.content,''),
+                            COALESCE(new.tags,''), COALESCE(new.url,''));
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS after_brain_delete_trigram
+                AFTER DELETE ON brain_entries BEGIN
+                  INSERT INTO brain_trigram(brain_trigram, rowid, title, content, tags, url)
+                    VALUES ('delete', old.id, COALESCE(old.title,''), COALESCE(old.content,''),
+                            COALESCE(old.tags,''), COALESCE(old.url,''));
+                END
+            """)
+            conn.execute("INSERT INTO brain_trigram(brain_trigram) VALUES('rebuild')")
+        except sqlite3.OperationalError:
+            # FTS5 or the trigram tokenizer (SQLite < 3.34) missing: substring
+            # search falls back to LIKE.
+            pass
+        conn.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (7)")
+
+    if version < 8:
+        # Prefix indexes for completion-style searches. Positions are kept
+        # (detail=full); `brain index rebuild` applies config's brain.fts_detail.
+        if fts_options(conn) is not None:
+            rebuild_brain_fts(conn, "full", content="brain_entries")
+        conn.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (8)")
+
+    if version < 9:
+        # Spaced-repetition schedule for resurfacing (brain review, welcome screen).
+        # Bookkeeping updates like these mustn't reindex the entry's text.
+        _narrow_update_trigger(conn, "after_brain_update", ("title", "content", "tags"))
+        _narrow_update_trigger(
+            conn, "after_brain_update_trigram", ("title", "content", "tags", "url")
+        )
+        for column in ("next_review_at DATETIME", "review_step INTEGER DEFAULT 0"):
+            try:
+                conn.execute(f"ALTER TABLE brain_entries ADD COLUMN {column}")
+            except sqlite3.OperationalError:
+                pass  # already exists
+        conn.execute("""
+            UPDATE brain_entries SET next_review_at = datetime(created_at, '+1 day')
+            WHERE next_review_at IS NULL
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_brain_next_review ON brain_entries(next_review_at)"
+        )
+        conn.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (9)")
+
+    if version < 10:
+        # Related-notes index (brain.vectors): packed sparse TF-IDF vectors and
+        # document frequencies. term 0 holds the entry count; its presence
+        # marks the index as built, so an existing brain is backfilled lazily.
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS brain_vectors (
+                entry_id INTEGER PRIMARY KEY,
+                terms    BLOB NOT NULL,
+                weights  BLOB NOT NULL,
+                norm     REAL NOT NULL
+            )
+        """)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS brain_df (term INTEGER PRIMARY KEY, df INTEGER NOT NULL)"
+        )
+        if not conn.execute("SELECT EXISTS (SELECT 1 FROM brain_entries)").fetchone()[0]:
+            conn.execute("INSERT OR IGNORE INTO brain_df (term, df) VALUES (0, 0)")
+        conn.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (10)")
+
+    if version < 11:
+        # Near-duplicate index (brain.minhash): one MinHash signature per entry
+        # and its LSH band buckets. entry_id 0 marks the index as built, so an
+        # existing brain is backfilled lazily.
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS brain_minhash (
+                entry_id  INTEGER PRIMARY KEY,
+                signature BLOB NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS brain_lsh (
+                band     INTEGER NOT NULL,
+                bucket   INTEGER NOT NULL,
+                entry_id INTEGER NOT NULL,
+                PRIMARY KEY (band, bucket, entry_id)
+            ) WITHOUT ROWID
+        """)
+        if not conn.execute("SELECT EXISTS (SELECT 1 FROM brain_entries)").fetchone()[0]:
+            conn.execute(
+                "INSERT OR IGNORE INTO brain_minhash (entry_id, signature) VALUES (0, x'')"
+            )
+        conn.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (11)")
+
+    if version < 12:
+        # Materialized counts for count_entries, list_tags, brain stats and the
+        # dashboard, so none of them has to count brain_entries again.
+        _create_brain_stats(conn, bodies=False)
+        conn.execute("DELETE FROM brain_stats")
+        index_brain_stats(conn, bodies=False)
+        conn.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (12)")
+
+    if version < 13:
+        # Earlier versions of entry content (brain.revisions): zlib keyframes
+        # and word deltas against the previous revision.
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS brain_revisions (
+                entry_id   INTEGER  NOT NULL,
+                rev        INTEGER  NOT NULL,
+                keyframe   INTEGER  NOT NULL,
+                data       BLOB     NOT NULL,
+                size       INTEGER  NOT NULL,
+                created_at DATETIME NOT NULL,
+                PRIMARY KEY (entry_id, rev)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (13)")
+
+    if version < 14:
+        # Large content moves to brain_bodies, compressed (see store_body).
+        # The FTS tables read the full text through the brain_text view and
+        # the sync and stats triggers look bodies up, so both are recreated.
+        _create_body_store(conn)
+        _create_fts_triggers(conn)
+        for event in ("insert", "update", "delete"):
+            conn.execute(f"DROP TRIGGER IF EXISTS after_brain_{event}_stats")
+        _create_brain_stats(conn)
+        packed, before, after = pack_bodies(conn)
+        options = fts_options(conn)
+        if options is not None:
+            rebuild_brain_fts(conn, options["detail"], options["prefix"])
+        if fts_options(conn, "brain_trigram") is not None:
+            conn.execute("DROP TABLE brain_trigram")
+            conn.execute("""
+                CREATE VIRTUAL TABLE brain_trigram
+                USING fts5(title, content, tags, url, content="brain_text",
+                           content_rowid="id", tokenize="trigram")
+            """)
+            conn.execute("INSERT INTO brain_trigram(brain_trigram) VALUES('rebuild')")
+        if packed:
+            from synthevix.core.utils import format_bytes
+            sys.stderr.write(f"Compressed {packed:,} large Brain entries: "
+                             f"{format_bytes(before)} → {format_bytes(after)}\n")
+        conn.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (14)")
+
+    if version < 15:
+        # Wiki links between entries (brain.links), and the title index that
+        # resolves [[Title]] links. Existing content is parsed once here.
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS brain_links (
+                src_id INTEGER NOT NULL,
+                dst_id INTEGER,
+                title  TEXT COLLATE NOCASE
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_brain_links_src ON brain_links(src_id, dst_id)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_brain_links_dst ON brain_links(dst_id, src_id)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_brain_links_title ON brain_links(title) "
+            "WHERE title IS NOT NULL"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_brain_title ON brain_entries(title COLLATE NOCASE)"
+        )
+        from synthevix.brain import links
+        links.rebuild(conn)
+        conn.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (15)")
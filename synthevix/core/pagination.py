@@ -0,0 +1,108 @@
+"""Keyset (cursor) pagination for the model list queries.
+
+Pages are ordered newest-first on ``(<time column>, id)``. Each page carries an
+opaque cursor holding the last row's key, and the next page seeks past it in
+the time index, so page 500 costs the same as page 1 (no OFFSET walk).
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+Fetch = Callable[[Optional[str]], "Page"]
+
+
+@dataclass
+class Page:
+    """One page of rows plus the cursor for the next (None on the last page)."""
+
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(key: Any, row_id: int) -> str:
+    raw = json.dumps([key, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    """Inverse of ``encode_cursor``. Raises ValueError for anything it did not produce."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key, row_id = json.loads(raw)
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from None
+    if not isinstance(row_id, int) or isinstance(row_id, bool):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return key, row_id
+
+
+def fetch_page(
+    conn,
+    query: str,
+    params: Sequence,
+    key: str,
+    after: Optional[str] = None,
+    limit: int = 50,
+    make: Callable[[Any], Any] = dict,
+) -> Page:
+    """Run ``query`` (``SELECT ... WHERE ...``, no ORDER BY/LIMIT) as one page.
+
+    ``key`` is the indexed time column; ``id`` breaks ties between equal keys.
+    One extra row is fetched to tell whether another page exists. ``make``
+    turns each row into an item (a dict unless given, e.g. a summary record).
+    """
+    params = list(params)
+    if after:
+        value, row_id = decode_cursor(after)
+        # The leading range on ``key`` is what lets SQLite seek in the index.
+        query += f" AND {key} <= ? AND ({key} < ? OR id < ?)"
+        params += [value, value, row_id]
+    query += f" ORDER BY {key} DESC, id DESC LIMIT ?"
+    params.append(limit + 1)
+
+    rows = conn.execute(query, params).fetchall()
+    if len(rows) <= limit:
+        return Page([make(r) for r in rows])
+    last = rows[limit - 1]
+    return Page([make(r) for r in rows[:limit]], encode_cursor(last[key], last["id"]))
+
+
+def iter_rows(fetch: Fetch, after: Optional[str] = None) -> Iterator[Any]:
+    """Yield every row across pages, fetching each page only when it is reached."""
+    cursor = after
+    while True:
+        page = fetch(cursor)
+        yield from page.items
+        if not page.next_cursor:
+            return
+        cursor = page.next_cursor
+
+
+def show_pages(
+    fetch: Fetch,
+    render: Callable[[List[dict]], None],
+    console,
+    after: Optional[str] = None,
+    interactive: bool = False,
+) -> None:
+    """Render one page and hint at ``--after``, or page interactively on demand."""
+    cursor = after
+    while True:
+        page = fetch(cursor)
+        render(page.items)
+        if not page.next_cursor:
+            return
+        if not interactive:
+            console.print(f"  [dim]More results: --after {page.next_cursor}[/dim]\n")
+            return
+        try:
+            reply = console.input("  [dim]Enter for the next page, q to quit:[/dim] ")
+        except (EOFError, KeyboardInterrupt):
+            return
+        if reply.strip().lower().startswith("q"):
+            return
+        cursor = page.next_cursor
@@ -0,0 +1,245 @@
+"""Opt-in run profiler: SQL statements, sub-command imports, init_db, config and rendering.
+
+Enabled with ``synthevix --profile <cmd>`` or ``SYNTHEVIX_PROFILE=1``. Passing a
+path ending in ``.json`` (``--profile=run.json`` / ``SYNTHEVIX_PROFILE=run.json``)
+writes the breakdown there instead of printing it to stderr.
+
+SQL is measured with a connection factory whose cursors time ``execute`` and
+every fetch, attributing the time to the statement that produced the rows, and
+``set_trace_callback`` counts every statement SQLite actually runs (including
+implicit BEGIN/COMMIT). Phases are timed by wrapping the functions involved,
+so timings are inclusive: SQL run by ``init_db`` shows up in both tables.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+ENV_VAR = "SYNTHEVIX_PROFILE"
+FLAG = "--profile"
+
+
+@dataclass
+class Stat:
+    calls: int = 0
+    seconds: float = 0.0
+
+
+class Profiler:
+    def __init__(self, output: Optional[str] = None) -> None:
+        self.output = output            # None → table on stderr, else JSON file path
+        self.started = time.perf_counter()
+        self.phases: Dict[str, Stat] = {}
+        self.sql: Dict[str, Stat] = {}
+        self.traced: Dict[str, int] = {}
+        self._active: Dict[str, int] = {}
+
+    # ── Recording ──────────────────────────────────────────────────────────────
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        # Re-entrant calls (load_config inside a render, say) count once.
+        depth = self._active.get(name, 0)
+        self._active[name] = depth + 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._active[name] = depth
+            if depth == 0:
+                stat = self.phases.setdefault(name, Stat())
+                stat.calls += 1
+                stat.seconds += time.perf_counter() - start
+
+    def add_sql(self, sql: str, seconds: float, call: bool) -> None:
+        stat = self.sql.setdefault(_normalize(sql), Stat())
+        stat.calls += call
+        stat.seconds += seconds
+
+    def trace(self, sql: str) -> None:
+        key = _normalize(sql)
+        self.traced[key] = self.traced.get(key, 0) + 1
+
+    # ── Reporting ──────────────────────────────────────────────────────────────
+
+    def as_dict(self) -> dict:
+        def rows(d: Dict[str, Stat]) -> list:
+            return [
+                {"name": k, "calls": s.calls, "total_ms": round(s.seconds * 1000, 3),
+                 "mean_ms": round(s.seconds * 1000 / s.calls, 3) if s.calls else 0.0}
+                for k, s in sorted(d.items(), key=lambda kv: kv[1].seconds, reverse=True)
+            ]
+        return {
+            "argv": sys.argv[1:],
+            "wall_ms": round((time.perf_counter() - self.started) * 1000, 3),
+            "phases": rows(self.phases),
+            "sql": rows(self.sql),
+            "sql_statements_executed": sum(self.traced.values()),
+            "sql_traced": dict(sorted(self.traced.items(), key=lambda kv: kv[1], reverse=True)),
+        }
+
+    def report(self) -> None:
+        data = self.as_dict()
+        if self.output:
+            with open(self.output, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            sys.stderr.write(f"profile written to {self.output}\n")
+            return
+
+        out = sys.stderr
+        out.write(f"\n── profile: {' '.join(data['argv']) or '(welcome)'} "
+                  f"— {data['wall_ms']:.1f} ms wall, "
+                  f"{data['sql_statements_executed']} SQL statements ──\n")
+        out.write(f"{'phase':<44}{'calls':>7}{'total ms':>11}{'mean ms':>10}\n")
+        for r in data["phases"]:
+            out.write(f"{r['name']:<44}{r['calls']:>7}{r['total_ms']:>11.2f}{r['mean_ms']:>10.3f}\n")
+        out.write(f"\n{'sql':<44}{'calls':>7}{'total ms':>11}{'mean ms':>10}\n")
+        for r in data["sql"][:25]:
+            name = r["name"] if len(r["name"]) <= 43 else r["name"][:42] + "…"
+            out.write(f"{name:<44}{r['calls']:>7}{r['total_ms']:>11.2f}{r['mean_ms']:>10.3f}\n")
+        if len(data["sql"]) > 25:
+            out.write(f"… {len(data['sql']) - 25} more (use --profile=out.json for all)\n")
+
+
+_WS = re.compile(r"\s+")
+
+
+def _normalize(sql: str) -> str:
+    return _WS.sub(" ", sql).strip()
+
+
+_profiler: Optional[Profiler] = None
+
+
+def active() -> Optional[Profiler]:
+    return _profiler
+
+
+# ── SQL instrumentation ────────────────────────────────────────────────────────
+
+class ProfiledCursor(sqlite3.Cursor):
+    """Cursor that charges execute and fetch time to the statement it ran."""
+
+    _sql = ""
+
+    def _timed(self, fn, *args, call: bool = False):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            if _profiler is not None and self._sql:
+                _profiler.add_sql(self._sql, time.perf_counter() - start, call)
+
+    def execute(self, sql, parameters=()):
+        self._sql = sql
+        return self._timed(super().execute, sql, parameters, call=True)
+
+    def executemany(self, sql, seq_of_parameters):
+        self._sql = sql
+        return self._timed(super().executemany, sql, seq_of_parameters, call=True)
+
+    def executescript(self, sql_script):
+        self._sql = sql_script
+        return self._timed(super().executescript, sql_script, call=True)
+
+    def fetchone(self):
+        return self._timed(super().fetchone)
+
+    def fetchmany(self, size=None):
+        return self._timed(super().fetchmany, size if size is not None else self.arraysize)
+
+    def fetchall(self):
+        return self._timed(super().fetchall)
+
+    def __next__(self):
+        return self._timed(super().__next__)
+
+
+class ProfiledConnection(sqlite3.Connection):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        if _profiler is not None:
+            self.set_trace_callback(_profiler.trace)
+
+    def cursor(self, factory=ProfiledCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+
+# ── Setup ──────────────────────────────────────────────────────────────────────
+
+def _wrap(owner, attr: str, phase: str) -> None:
+    original = getattr(owner, attr)
+
+    @functools.wraps(original)
+    def wrapper(*args, **kwargs):
+        with _profiler.phase(phase):
+            return original(*args, **kwargs)
+
+    setattr(owner, attr, wrapper)
+
+
+def _wrap_lazy_import(group_cls) -> None:
+    original = group_cls.get_command
+
+    @functools.wraps(original)
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.commands:
+            return original(self, ctx, cmd_name)
+        with _profiler.phase(f"import {cmd_name}"):
+            return original(self, ctx, cmd_name)
+
+    group_cls.get_command = get_command
+
+
+def enable(output: Optional[str] = None, group_cls=None) -> Profiler:
+    """Start profiling this process. Call before commands are imported."""
+    global _profiler
+    if _profiler is not None:
+        return _profiler
+    _profiler = Profiler(output)
+
+    from rich.console import Console
+
+    from synthevix.core import config, database
+
+    database.close_connection()   # reopen through the profiled factory
+    database._connection_factory = ProfiledConnection
+    _wrap(database, "init_db", "init_db")
+    _wrap(config, "load_config", "load_config")
+    _wrap(Console, "print", "render")
+    if group_cls is not None:
+        _wrap_lazy_import(group_cls)
+    return _profiler
+
+
+def from_argv(argv: List[str]) -> Optional[str]:
+    """Strip a leading ``--profile[=out.json]`` from ``argv`` in place.
+
+    Returns the requested output ("" for a stderr table) or None when profiling
+    was not requested on the command line or through ``SYNTHEVIX_PROFILE``.
+    """
+    if argv and (argv[0] == FLAG or argv[0].startswith(FLAG + "=")):
+        flag = argv.pop(0)
+        return flag.partition("=")[2]
+    env = os.environ.get(ENV_VAR, "")
+    if env and env != "0":
+        return env if env.endswith(".json") else ""
+    return None
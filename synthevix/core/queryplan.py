@@ -0,0 +1,147 @@
+"""EXPLAIN QUERY PLAN auditing for model queries.
+
+With ``SYNTHEVIX_DEBUG_SQL=1`` every distinct statement is explained once, right
+before it first runs, and a warning is printed to stderr when the plan scans one
+of the tables that grow with use. The same machinery backs
+``tests/test_queryplan.py``, which runs the model layer and checks every scan
+against an allowlist.
+
+A ``SCAN ... USING INDEX`` on a statement with a ``LIMIT`` walks the index in
+order and stops early, so it is not reported.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Type, cast
+
+ENV_VAR = "SYNTHEVIX_DEBUG_SQL"
+
+# Tables whose size is unbounded; scanning anything else is cheap by design.
+LARGE_TABLES = frozenset({
+    "brain_entries", "entry_tags", "brain_vectors", "brain_df", "brain_minhash", "brain_lsh",
+    "brain_stats", "brain_revisions", "brain_bodies", "brain_links",
+    "quests", "mood_logs", "pomodoro_sessions", "coding_streaks",
+})
+
+_EXPLAINABLE = re.compile(
+    r"^\s*(SELECT|WITH|UPDATE|DELETE|INSERT\s+INTO\s+\w+\s*(\([^)]*\))?\s*SELECT)\b", re.I
+)
+_FROM_ALIAS = re.compile(
+    r"\b(?:FROM|JOIN|UPDATE|INTO)\s+(\w+)"
+    r"(?:\s+(?:AS\s+)?(?!(?:WHERE|ON|JOIN|ORDER|GROUP|LIMIT|SET|LEFT|INNER|CROSS|USING|VALUES)\b)(\w+))?",
+    re.I,
+)
+_SCAN = re.compile(r"^SCAN (\w+)(.*)$")
+_WS = re.compile(r"\s+")
+
+
+@dataclass
+class Plan:
+    sql: str
+    details: List[str]
+    scans: List[str] = field(default_factory=list)   # large tables scanned
+
+
+def normalize(sql: str) -> str:
+    return _WS.sub(" ", sql).strip()
+
+
+def _aliases(sql: str) -> Dict[str, str]:
+    names: Dict[str, str] = {}
+    for table, alias in _FROM_ALIAS.findall(sql):
+        names[table] = table
+        if alias:
+            names[alias] = table
+    return names
+
+
+def explain(conn: sqlite3.Connection, sql: str, parameters=()) -> Optional[Plan]:
+    """Return the query plan for ``sql``, or None if it isn't a query we can explain."""
+    if not _EXPLAINABLE.match(sql):
+        return None
+    try:
+        rows = sqlite3.Connection.execute(conn, f"EXPLAIN QUERY PLAN {sql}", parameters).fetchall()
+    except sqlite3.Error:
+        return None
+    details = [r[3] for r in rows]
+    names = _aliases(sql)
+    bounded = re.search(r"\bLIMIT\b", sql, re.I) is not None
+    scans = []
+    for detail in details:
+        m = _SCAN.match(detail)
+        if not m:
+            continue
+        table = names.get(m.group(1), m.group(1))
+        if table not in LARGE_TABLES:
+            continue
+        if "USING" in m.group(2) and "COVERING" not in m.group(2) and bounded:
+            continue
+        scans.append(table)
+    return Plan(normalize(sql), details, scans)
+
+
+class Auditor:
+    """Explains each distinct statement once and keeps the plans."""
+
+    def __init__(self, warn: bool = True) -> None:
+        self.warn = warn
+        self.plans: Dict[str, Plan] = {}
+
+    def check(self, conn: sqlite3.Connection, sql: str, parameters=()) -> None:
+        key = normalize(sql)
+        if key in self.plans:
+            return
+        plan = explain(conn, sql, parameters)
+        if plan is None:
+            return
+        self.plans[key] = plan
+        if plan.scans and self.warn:
+            sys.stderr.write(
+                f"⚠ full scan of {', '.join(sorted(set(plan.scans)))}: {key[:160]}\n"
+                + "".join(f"    {d}\n" for d in plan.details)
+            )
+
+    def scans(self) -> Dict[str, Plan]:
+        return {k: p for k, p in self.plans.items() if p.scans}
+
+
+_auditor: Optional[Auditor] = None
+_previous_factory: Optional[Type[sqlite3.Connection]] = None
+
+
+class AuditMixin:
+    """Connection mixin that audits a statement before running it."""
+
+    def execute(self, sql, parameters=()):
+        if _auditor is not None:
+            _auditor.check(self, sql, parameters)
+        return super().execute(sql, parameters)
+
+
+def enable(warn: bool = True) -> Auditor:
+    """Audit every statement on connections opened from now on."""
+    global _auditor, _previous_factory
+    from synthevix.core import database
+
+    if _auditor is None:
+        _auditor = Auditor(warn)
+        _previous_factory = base = database._connection_factory
+        database._connection_factory = cast(
+            Type[sqlite3.Connection], type(f"Audited{base.__name__}", (AuditMixin, base), {})
+        )
+        database.close_connection()
+    return _auditor
+
+
+def disable() -> None:
+    global _auditor, _previous_factory
+    from synthevix.core import database
+
+    if _auditor is not None and _previous_factory is not None:
+        database._connection_factory = _previous_factory
+        database.close_connection()
+    _auditor = _previous_factory = None
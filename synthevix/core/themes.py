@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
-import toml
-from rich.style import Style
-from rich.theme import Theme as RichTheme
+if TYPE_CHECKING:
+    from rich.theme import Theme as RichTheme
 
 SYNTHEVIX_DIR = Path.home() / ".synthevix"
 
@@ -112,6 +112,10 @@ _BUILTIN_THEMES: Dict[str, Dict[str, str]] = {
 }
 
 
+# (path, mtime_ns, size) -> parsed themes, so repeated lookups skip the TOML parse.
+_custom_cache: Dict[tuple, Dict[str, Dict[str, str]]] = {}
+
+
 def _load_custom_themes(custom_path: str) -> Dict[str, Dict[str, str]]:
     """Load custom themes from a TOML file if configured."""
     if not custom_path:
@@ -120,23 +124,35 @@ def _load_custom_themes(custom_path: str) -> Dict[str, Dict[str, str]]:
     if not p.exists():
         # Try ~/.synthevix/themes/
         p = SYNTHEVIX_DIR / "themes" / custom_path
-    if p.exists():
+    try:
+        st = os.stat(p)
+    except OSError:
+        return {}
+    key = (str(p), st.st_mtime_ns, st.st_size)
+    if key not in _custom_cache:
+        import toml
         try:
-            data = toml.load(str(p))
-            return data.get("themes", {})
+            themes = toml.load(str(p)).get("themes", {})
         except Exception:
-            pass
-    return {}
+            themes = {}
+        _custom_cache.clear()  # only the current version of a file is worth keeping
+        _custom_cache[key] = themes
+    return _custom_cache[key]
 
 
 def get_theme_data(theme_name: str, custom_path: str = "") -> Dict[str, str]:
     """Return raw color dict for the requested theme name."""
-    all_themes = {**_BUILTIN_THEMES, **_load_custom_themes(custom_path)}
-    return all_themes.get(theme_name, _BUILTIN_THEMES["cyberpunk"])
+    custom = _load_custom_themes(custom_path)
+    if theme_name in custom:
+        return custom[theme_name]
+    return _BUILTIN_THEMES.get(theme_name, _BUILTIN_THEMES["cyberpunk"])
 
 
-def get_rich_theme(theme_name: str, custom_path: str = "") -> RichTheme:
+def get_rich_theme(theme_name: str, custom_path: str = "") -> "RichTheme":
     """Build a Rich Theme object from the Synthevix theme definition."""
+    from rich.style import Style
+    from rich.theme import Theme as RichTheme
+
     t = get_theme_data(theme_name, custom_path)
     return RichTheme({
         "primary":   Style(color=t["primary"]),
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, date
-from typing import Any, List, Optional
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Callable, List, Optional, Tuple
 
 
 def time_of_day() -> str:
@@ -87,11 +87,55 @@ def truncate_text(text: str, max_len: int = 60) -> str:
     return text[: max_len - 1] + "…"
 
 
+def format_bytes(n: float) -> str:
+    """Human-readable size like '4.2 MB'."""
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
 def today_str() -> str:
     """Return today's date as 'YYYY-MM-DD'."""
     return date.today().isoformat()
 
 
+def day_bounds(day: date) -> Tuple[str, str]:
+    """Return ('YYYY-MM-DD', next day) for index-friendly ``col >= ? AND col < ?`` filters.
+
+    Matches both ``CURRENT_TIMESTAMP`` and ``isoformat()`` values, like ``DATE(col) = ?``.
+    """
+    return day.isoformat(), (day + timedelta(days=1)).isoformat()
+
+
+def local_day_bounds_utc(day: date) -> Tuple[str, str]:
+    """Return the UTC ``CURRENT_TIMESTAMP`` range covering local calendar day ``day``."""
+    fmt = "%Y-%m-%d %H:%M:%S"
+    start = datetime.combine(day, time.min).astimezone(timezone.utc)
+    end = datetime.combine(day + timedelta(days=1), time.min).astimezone(timezone.utc)
+    return start.strftime(fmt), end.strftime(fmt)
+
+
+def count_streak(has_day: Callable[[date], bool], today: Optional[date] = None) -> int:
+    """Count consecutive active days walking back from today.
+
+    A day may be skipped between active days (and at the start), matching the
+    long-standing streak rules, so each step probes at most two days.
+    """
+    streak = 0
+    check = today or date.today()
+    while True:
+        if has_day(check):
+            d = check
+        elif has_day(check - timedelta(days=1)):
+            d = check - timedelta(days=1)
+        else:
+            return streak
+        streak += 1
+        check = d - timedelta(days=1)
+
+
 def parse_duration(duration: str) -> int:
     """Parse a duration string like '7d', '2w', '1m' into number of days."""
     unit = duration[-1].lower()
@@ -3,23 +3,24 @@
 from datetime import datetime, timedelta
 from typing import List, Optional
 
-from synthevix.cosmos.models import get_mood_history
+from synthevix.cosmos.models import MoodSummary, get_mood_summaries
 
 
-def _weekly_avg(entries: List[dict], week_start: datetime, week_end: datetime) -> Optional[float]:
+def _weekly_avg(entries: List[MoodSummary], week_start: datetime,
+                week_end: datetime) -> Optional[float]:
     """Return average mood for entries within [week_start, week_end), or None if empty."""
     bucket = []
     for e in entries:
         try:
-            logged = datetime.fromisoformat(str(e["logged_at"]))
+            logged = datetime.fromisoformat(str(e.logged_at))
         except Exception:
             continue
         if week_start <= logged < week_end:
-            bucket.append(e["mood"])
+            bucket.append(e.mood)
     return sum(bucket) / len(bucket) if bucket else None
 
 
-def _four_week_trend_text(entries: List[dict]) -> str:
+def _four_week_trend_text(entries: List[MoodSummary]) -> str:
     """Return a 4-week mood trend block as Rich markup, or '' if no data."""
     now = datetime.now()
     weeks = []
@@ -55,20 +56,20 @@ def _four_week_trend_text(entries: List[dict]) -> str:
 
 def generate_weekly_insight() -> str:
     """Analyze the last 7 days of mood data and return a stylized insight."""
-    entries = get_mood_history(days=7)
+    entries = get_mood_summaries(days=7)
 
     if not entries:
         return "Insufficient data. Log your mood for a few days to unlock insights."
 
     total_logs = len(entries)
-    average_mood = sum(e["mood"] for e in entries) / total_logs
-    energy_vals = [e["energy"] for e in entries if e.get("energy")]
+    average_mood = sum(e.mood for e in entries) / total_logs
+    energy_vals = [e.energy for e in entries if e.energy]
     average_energy = sum(energy_vals) / len(energy_vals) if energy_vals else 0
 
     if len(entries) >= 2:
         half = len(entries) // 2
-        avg1 = sum(e["mood"] for e in entries[:half]) / half
-        avg2 = sum(e["mood"] for e in entries[half:]) / (len(entries) - half)
+        avg1 = sum(e.mood for e in entries[:half]) / half
+        avg2 = sum(e.mood for e in entries[half:]) / (len(entries) - half)
         trend = "improving" if avg2 > avg1 else "declining" if avg1 > avg2 else "stable"
     else:
         trend = "stable"
@@ -99,7 +100,7 @@ def generate_weekly_insight() -> str:
     )
 
     # 4-week trend
-    all_entries = get_mood_history(days=28)
+    all_entries = get_mood_summaries(days=28)
     trend_text = _four_week_trend_text(all_entries)
     if trend_text:
         output += f"\n\n📊 [bold]4-Week Mood Trend:[/bold]\n{trend_text}"
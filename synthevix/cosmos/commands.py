@@ -75,13 +75,29 @@ def cmd_mood(
 @app.command("history")
 def cmd_history(
     last: str = typer.Option("30d", "--last", help="Duration, e.g. 30d, 2w"),
+    limit: int = typer.Option(50, "--limit", "-n", help="Logs per page"),
+    after: Optional[str] = typer.Option(None, "--after",
+                                        help="Continue from a cursor printed by a previous page"),
+    page: bool = typer.Option(False, "--page", "-p", help="Page through results interactively"),
 ):
     """View your mood history with a sparkline chart."""
+    from synthevix.core.pagination import show_pages
     from synthevix.core.utils import parse_duration
     days = parse_duration(last)
-    entries = models.get_mood_history(days=days)
-    console.print()
-    print_mood_history(entries, console, _theme_color())
+    color = _theme_color()
+
+    def render(entries):
+        console.print()
+        print_mood_history(entries, console, color)
+
+    try:
+        show_pages(
+            lambda cursor: models.get_mood_history_page(days=days, limit=limit, after=cursor),
+            render, console, after=after, interactive=page,
+        )
+    except ValueError as e:
+        console.print(f"[bold red]{e}[/bold red]")
+        raise typer.Exit(1)
 
     stats = models.get_mood_stats(days=days)
     if stats["count"]:
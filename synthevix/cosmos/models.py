@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import List, Optional
 
-from synthevix.core.database import get_connection
+from synthevix.core.database import connection, transaction
+from synthevix.core.pagination import Page, fetch_page, iter_rows
+from synthevix.core.utils import day_bounds
 
 
 MOOD_LABELS = {1: "Terrible", 2: "Bad", 3: "Meh", 4: "Good", 5: "Great", 6: "Amazing"}
@@ -14,46 +17,83 @@ MOOD_EMOJIS = {1: "😭", 2: "😞", 3: "😐", 4: "🙂", 5: "😄", 6: "🤩"}
 
 def log_mood(mood: int, energy: Optional[int] = None, note: Optional[str] = None) -> int:
     """Insert a mood log entry. Returns the new ID."""
-    conn = get_connection()
-    with conn:
+    with transaction() as conn:
         cur = conn.execute("""
             INSERT INTO mood_logs (mood, energy, note) VALUES (?, ?, ?)
         """, (mood, energy, note))
-    conn.close()
     return cur.lastrowid
 
 
-def get_mood_history(days: int = 30, limit: int = 100) -> List[dict]:
-    """Return mood logs from the last N days."""
+def get_mood_history_page(
+    days: int = 30, limit: int = 50, after: Optional[str] = None,
+) -> Page:
+    """Return one page of mood logs from the last N days, newest first."""
     since = (datetime.now() - timedelta(days=days)).isoformat()
-    conn = get_connection()
-    rows = conn.execute("""
-        SELECT * FROM mood_logs WHERE logged_at >= ? ORDER BY logged_at DESC LIMIT ?
-    """, (since, limit)).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    return fetch_page(
+        connection(), "SELECT * FROM mood_logs WHERE logged_at >= ?", [since],
+        "logged_at", after, limit,
+    )
+
+
+def get_mood_history(days: int = 30, limit: Optional[int] = None) -> List[dict]:
+    """Return mood logs from the last N days (all of them unless ``limit`` is given)."""
+    if limit is not None:
+        return get_mood_history_page(days, limit).items
+    return list(iter_rows(lambda after: get_mood_history_page(days, 500, after)))
+
+
+@dataclass(slots=True)
+class MoodSummary:
+    """A mood log without its note, for charts and insights."""
+
+    id: int
+    mood: int
+    energy: Optional[int]
+    logged_at: str
+
+
+def _mood_summary(row) -> MoodSummary:
+    return MoodSummary(*row)
+
+
+def get_mood_summaries_page(
+    days: int = 30, limit: int = 50, after: Optional[str] = None,
+) -> Page:
+    """``get_mood_history_page`` without the notes, as MoodSummary items."""
+    since = (datetime.now() - timedelta(days=days)).isoformat()
+    return fetch_page(
+        connection(), "SELECT id, mood, energy, logged_at FROM mood_logs WHERE logged_at >= ?",
+        [since], "logged_at", after, limit, _mood_summary,
+    )
+
+
+def get_mood_summaries(days: int = 30, limit: Optional[int] = None) -> List[MoodSummary]:
+    """Mood logs from the last N days without their notes, newest first."""
+    if limit is not None:
+        return get_mood_summaries_page(days, limit).items
+    return list(iter_rows(lambda after: get_mood_summaries_page(days, 500, after)))
 
 
 def get_today_mood() -> Optional[dict]:
     """Return the most recent mood log from today, or None."""
-    today = date.today().isoformat()
-    conn = get_connection()
-    row = conn.execute("""
-        SELECT * FROM mood_logs WHERE DATE(logged_at) = ? ORDER BY logged_at DESC LIMIT 1
-    """, (today,)).fetchone()
-    conn.close()
+    row = connection().execute("""
+        SELECT * FROM mood_logs WHERE logged_at >= ? AND logged_at < ?
+        ORDER BY logged_at DESC LIMIT 1
+    """, day_bounds(date.today())).fetchone()
     return dict(row) if row else None
 
 
 def get_mood_stats(days: int = 30) -> dict:
     """Return average mood and energy for the last N days."""
-    history = get_mood_history(days=days)
-    if not history:
+    since = (datetime.now() - timedelta(days=days)).isoformat()
+    row = connection().execute("""
+        SELECT COUNT(*), AVG(mood), AVG(energy) FROM mood_logs WHERE logged_at >= ?
+    """, (since,)).fetchone()
+    count, avg_mood, avg_energy = row
+    if not count:
         return {"count": 0, "avg_mood": None, "avg_energy": None}
-    moods = [e["mood"] for e in history]
-    energies = [e["energy"] for e in history if e["energy"] is not None]
     return {
-        "count": len(history),
-        "avg_mood": round(sum(moods) / len(moods), 2),
-        "avg_energy": round(sum(energies) / len(energies), 2) if energies else None,
+        "count": count,
+        "avg_mood": round(avg_mood, 2),
+        "avg_energy": round(avg_energy, 2) if avg_energy is not None else None,
     }
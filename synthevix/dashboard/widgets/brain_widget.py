@@ -4,7 +4,7 @@ from textual.widgets import DataTable
 from textual.message import Message
 from rich.text import Text
 
-from synthevix.brain.models import list_entries
+from synthevix.brain.models import count_entries, list_entry_summaries
 
 
 class BrainWidget(DataTable):
@@ -45,11 +45,13 @@ class BrainWidget(DataTable):
         self._entry_ids.clear()
 
         try:
-            entries = list_entries(limit=15)
+            entries = list_entry_summaries(limit=15)
+            total = count_entries()
         except Exception:
-            entries = []
+            entries, total = [], 0
 
         primary = self.app.get_theme_color("primary")
+        self.border_title = f"[bold {primary}]🧠  Brain[/bold {primary}] [dim]{total:,}[/dim]"
         accent = self.app.get_theme_color("secondary")
 
         type_colors = {
@@ -61,14 +63,14 @@ class BrainWidget(DataTable):
 
         import json
         for e in entries:
-            t_style = type_colors.get(e["type"], "white")
-            title = e["title"] or "Untitled"
+            t_style = type_colors.get(e.type, "white")
+            title = e.title or "Untitled"
 
             if len(title) > 26:
                 title = title[:23] + "..."
 
             try:
-                tags = json.loads(e.get("tags", "[]"))
+                tags = json.loads(e.tags or "[]")
             except Exception:
                 tags = []
                 
@@ -79,10 +81,10 @@ class BrainWidget(DataTable):
             if not tags:
                 tags_text.append("—", style="dim")
 
-            self._entry_ids.append(e["id"])
+            self._entry_ids.append(e.id)
             self.add_row(
-                Text(str(e["id"]), style="dim"),
-                Text(e["type"][:4].upper(), style=t_style),
+                Text(str(e.id), style="dim"),
+                Text(e.type[:4].upper(), style=t_style),
                 Text(title, style=f"bold {primary}"),
                 tags_text
             )
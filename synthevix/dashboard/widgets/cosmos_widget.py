@@ -33,8 +33,8 @@ class CosmosWidget(Static):
             today_mood = None
 
         try:
-            from synthevix.cosmos.models import get_mood_history
-            history = get_mood_history(days=7)
+            from synthevix.cosmos.models import get_mood_summaries
+            history = get_mood_summaries(days=7)
         except Exception:
             history = []
 
@@ -60,7 +60,7 @@ class CosmosWidget(Static):
         if history:
             t.append(f"\n{'7-day trend':<{LABEL_WIDTH}}", style="dim")
             for entry in reversed(history[-7:]):
-                v = entry.get("mood", 3)
+                v = entry.mood
                 t.append("█", style=MOOD_COLORS.get(v, "white"))
             t.append("\n")
 
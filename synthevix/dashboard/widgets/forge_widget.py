@@ -24,8 +24,8 @@ class ForgeStats(Static):
             streak = get_current_coding_streak()
             today_day = get_coding_day(datetime.date.today())
             commits_today = today_day.get("commits", 0) if today_day else 0
-            from synthevix.forge.models import get_streak_data
-            streak_data = get_streak_data(days=30)
+            from synthevix.forge.models import get_streak_days
+            streak_data = get_streak_days(days=30)
         except Exception:
             streak = 0
             commits_today = 0
@@ -46,7 +46,7 @@ class ForgeStats(Static):
         # 30-day mini heatmap
         if streak_data:
             import datetime as dt
-            commit_map = {r["date"]: r.get("commits", 0) for r in streak_data}
+            commit_map = {r.date: r.commits for r in streak_data}
             today = dt.date.today()
             t.append(f"{'Activity (30d)':<{label_width}}", style="dim")
             for i in range(29, -1, -1):
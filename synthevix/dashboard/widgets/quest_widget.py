@@ -4,7 +4,7 @@ from textual.widgets import DataTable
 from textual.message import Message
 from rich.text import Text
 
-from synthevix.quest.models import list_quests
+from synthevix.quest.models import QuestSummary, list_quest_summaries
 
 
 class QuestWidget(DataTable):
@@ -19,7 +19,7 @@ class QuestWidget(DataTable):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._quests: list[dict] = []
+        self._quests: list[QuestSummary] = []
 
     def on_mount(self) -> None:
         primary = self.app.get_theme_color("primary")
@@ -39,7 +39,7 @@ class QuestWidget(DataTable):
             return
 
         q = self._quests[idx]
-        self.post_message(self.QuestSelected(q["id"], q["title"]))
+        self.post_message(self.QuestSelected(q.id, q.title))
 
     def update_quests(self) -> None:
         """Fetch active quests and populate the data table."""
@@ -47,7 +47,7 @@ class QuestWidget(DataTable):
         self._quests.clear()
 
         try:
-            quests = list_quests(status="active", limit=50)
+            quests = list_quest_summaries(status="active", limit=50)
         except Exception:
             quests = []
 
@@ -66,14 +66,14 @@ class QuestWidget(DataTable):
         from synthevix.core.utils import format_relative
         
         for q in quests:
-            diff_style = diff_colors.get(q["difficulty"], "white")
+            diff_style = diff_colors.get(q.difficulty, "white")
             self._quests.append(q)
             
             due_str = "[dim]—[/dim]"
-            if q.get("due_date"):
+            if q.due_date:
                 try:
-                    due_date = datetime.datetime.strptime(q["due_date"].split()[0], "%Y-%m-%d").date()
-                    rel_due = format_relative(q["due_date"])
+                    due_date = datetime.datetime.strptime(q.due_date.split()[0], "%Y-%m-%d").date()
+                    rel_due = format_relative(q.due_date)
                     if due_date < datetime.date.today():
                         due_str = f"[bold red]{rel_due}[/bold red]"
                     elif due_date == datetime.date.today():
@@ -81,11 +81,12 @@ class QuestWidget(DataTable):
                     else:
                         due_str = f"[dim]{rel_due}[/dim]"
                 except Exception:
-                    due_str = f"[dim]{q['due_date']}[/dim]"
+                    due_str = f"[dim]{q.due_date}[/dim]"
 
             self.add_row(
-                Text(str(q["id"]), style="dim"),
-                Text(q["difficulty"][:3].upper(), style=diff_style),
-                Text((q["title"][:29] + "...") if len(q["title"]) > 32 else q["title"], style=f"bold {primary}"),
+                Text(str(q.id), style="dim"),
+                Text(q.difficulty[:3].upper(), style=diff_style),
+                Text((q.title[:29] + "...") if len(q.title) > 32 else q.title,
+                     style=f"bold {primary}"),
                 Text.from_markup(due_str),
             )
@@ -84,7 +84,7 @@ def cmd_streak(
             console.print(f"  [dim]Recorded {total} commits across {len(repos_with_commits)} repo(s).[/dim]\n")
 
     streak = models.get_current_coding_streak()
-    data = models.get_streak_data(days=60)
+    data = models.get_streak_days(days=60)
     print_streak_heatmap(data, streak, console, color)
 
 
@@ -248,9 +248,9 @@ def cmd_stats(
     from synthevix.core.utils import parse_duration
     days = parse_duration(last)
     color = _theme_color()
-    data = models.get_streak_data(days=days)
-    total_commits = sum(r.get("commits", 0) for r in data)
-    active_days = sum(1 for r in data if r.get("commits", 0) > 0)
+    data = models.get_streak_days(days=days)
+    total_commits = sum(r.commits for r in data)
+    active_days = sum(1 for r in data if r.commits > 0)
     streak = models.get_current_coding_streak()
 
     console.print(Panel(
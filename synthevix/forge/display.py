@@ -3,20 +3,24 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
-from typing import List
+from typing import TYPE_CHECKING, List
 
 from rich.console import Console
 from rich.table import Table
 
 from synthevix.core.utils import truncate_text
 
+if TYPE_CHECKING:
+    from synthevix.forge.models import StreakDay
 
-def print_streak_heatmap(streak_data: List[dict], streak: int, console: Console, theme_color: str) -> None:
+
+def print_streak_heatmap(streak_data: List[StreakDay], streak: int, console: Console,
+                         theme_color: str) -> None:
     """Display a GitHub-style coding streak heatmap (last 30 days)."""
     # Build a map of date -> commits
     commit_map = {}
     for row in streak_data:
-        commit_map[row["date"]] = row.get("commits", 0)
+        commit_map[row.date] = row.commits
 
     today = date.today()
     days_to_show = 30
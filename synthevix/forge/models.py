@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import json
+import os
+import sqlite3
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional
 
-from synthevix.core.database import get_connection
+from synthevix.core import database
+from synthevix.core.database import connection, transaction
+from synthevix.core.utils import count_streak
 
 
 def record_coding_day(day: Optional[str] = None, commits: int = 1, repos: Optional[List[str]] = None) -> None:
     """Insert or update a coding_streaks record for the given date."""
     d = day or date.today().isoformat()
-    conn = get_connection()
-    with conn:
+    with transaction() as conn:
         existing = conn.execute(
             "SELECT commits, repos FROM coding_streaks WHERE date = ?", (d,)
         ).fetchone()
@@ -27,107 +32,144 @@ def record_coding_day(day: Optional[str] = None, commits: int = 1, repos: Option
             conn.execute("""
                 INSERT INTO coding_streaks (date, commits, repos) VALUES (?, ?, ?)
             """, (d, commits, json.dumps(repos or [])))
-    conn.close()
 
 
 def get_streak_data(days: int = 90) -> List[dict]:
     """Return coding_streaks records for the last N days."""
     since = (date.today() - timedelta(days=days)).isoformat()
-    conn = get_connection()
-    rows = conn.execute("""
+    rows = connection().execute("""
         SELECT date, commits, repos FROM coding_streaks
         WHERE date >= ? ORDER BY date DESC
     """, (since,)).fetchall()
-    conn.close()
     return [dict(r) for r in rows]
 
 
+@dataclass(slots=True)
+class StreakDay:
+    """Commits on one day, without the repos they went to."""
+
+    date: str
+    commits: int
+
+
+def get_streak_days(days: int = 90) -> List[StreakDay]:
+    """``get_streak_data`` without the repo lists, for heatmaps and totals."""
+    since = (date.today() - timedelta(days=days)).isoformat()
+    rows = connection().execute("""
+        SELECT date, commits FROM coding_streaks
+        WHERE date >= ? ORDER BY date DESC
+    """, (since,)).fetchall()
+    return [StreakDay(*r) for r in rows]
+
+
 def get_coding_day(day: date) -> Optional[dict]:
     """Return the coding_streaks record for a specific date."""
-    conn = get_connection()
-    row = conn.execute(
+    row = connection().execute(
         "SELECT commits, repos FROM coding_streaks WHERE date = ?", (day.isoformat(),)
     ).fetchone()
-    conn.close()
     return dict(row) if row else None
 
 
 def get_current_coding_streak() -> int:
     """Return the current consecutive coding day streak."""
-    conn = get_connection()
-    rows = conn.execute(
-        "SELECT date FROM coding_streaks WHERE commits > 0 ORDER BY date DESC"
-    ).fetchall()
-    conn.close()
-    if not rows:
-        return 0
-
-    streak = 0
-    check = date.today()
-    for row in rows:
-        d = date.fromisoformat(row["date"])
-        if d == check or d == check - timedelta(days=1):
-            streak += 1
-            check = d - timedelta(days=1)
-        else:
-            break
-    return streak
+    conn = connection()
+
+    def coded(day: date) -> bool:
+        return conn.execute(
+            "SELECT 1 FROM coding_streaks WHERE date = ? AND commits > 0", (day.isoformat(),)
+        ).fetchone() is not None
+
+    return count_streak(coded)
 
 
 # ── Templates ─────────────────────────────────────────────────────────────────
 
 def list_templates() -> List[dict]:
-    conn = get_connection()
-    rows = conn.execute("SELECT * FROM forge_templates ORDER BY name").fetchall()
-    conn.close()
+    rows = connection().execute("SELECT * FROM forge_templates ORDER BY name").fetchall()
     return [dict(r) for r in rows]
 
 
 def add_template(id: str, name: str, path: str, description: str = "") -> None:
-    conn = get_connection()
-    with conn:
+    with transaction() as conn:
         conn.execute("""
             INSERT OR REPLACE INTO forge_templates (id, name, description, path) VALUES (?, ?, ?, ?)
         """, (id, name, description, path))
-    conn.close()
 
 
 def delete_template(template_id: str) -> bool:
-    conn = get_connection()
-    with conn:
+    with transaction() as conn:
         cur = conn.execute("DELETE FROM forge_templates WHERE id = ?", (template_id,))
-    conn.close()
     return cur.rowcount > 0
 
 
 # ── Aliases ────────────────────────────────────────────────────────────────────
+# aliases.json mirrors forge_aliases so `synthevix <alias>` can resolve without
+# touching the schema. It is rewritten whenever an alias is added or removed.
+
+def _alias_cache_path() -> Path:
+    return database.SYNTHEVIX_DIR / "aliases.json"
+
+
+def refresh_alias_cache() -> None:
+    """Regenerate the on-disk alias → command map from forge_aliases."""
+    rows = connection().execute("SELECT alias, command FROM forge_aliases").fetchall()
+    path = _alias_cache_path()
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({r["alias"]: r["command"] for r in rows}, f)
+    os.replace(tmp, path)
+
+
+def invalidate_alias_cache() -> None:
+    """Drop the alias cache, e.g. after the database file is replaced."""
+    _alias_cache_path().unlink(missing_ok=True)
+
+
+def resolve_alias(alias: str) -> Optional[str]:
+    """Return the command for an alias, or None.
+
+    Reads aliases.json; if it is missing or unreadable, does a single keyed
+    lookup and rebuilds the cache. Never creates the database or runs init_db.
+    """
+    try:
+        with open(_alias_cache_path(), encoding="utf-8") as f:
+            aliases: Dict[str, str] = json.load(f)
+        return aliases.get(alias)
+    except (OSError, ValueError):
+        pass
+
+    if not database.DB_PATH.exists():
+        return None
+    try:
+        row = connection().execute(
+            "SELECT command FROM forge_aliases WHERE alias = ?", (alias,)
+        ).fetchone()
+        refresh_alias_cache()
+    except sqlite3.Error:
+        return None  # Schema not created yet
+    return row["command"] if row else None
+
 
 def list_aliases() -> List[dict]:
-    conn = get_connection()
-    rows = conn.execute("SELECT * FROM forge_aliases ORDER BY alias").fetchall()
-    conn.close()
+    rows = connection().execute("SELECT * FROM forge_aliases ORDER BY alias").fetchall()
     return [dict(r) for r in rows]
 
 
 def add_alias(alias: str, command: str, description: str = "") -> None:
-    conn = get_connection()
-    with conn:
+    with transaction() as conn:
         conn.execute("""
             INSERT OR REPLACE INTO forge_aliases (alias, command, description) VALUES (?, ?, ?)
         """, (alias, command, description))
-    conn.close()
+    refresh_alias_cache()
 
 
 def delete_alias(alias: str) -> bool:
-    conn = get_connection()
-    with conn:
+    with transaction() as conn:
         cur = conn.execute("DELETE FROM forge_aliases WHERE alias = ?", (alias,))
-    conn.close()
+    refresh_alias_cache()
     return cur.rowcount > 0
 
 
 def get_alias(alias: str) -> Optional[dict]:
-    conn = get_connection()
-    row = conn.execute("SELECT * FROM forge_aliases WHERE alias = ?", (alias,)).fetchone()
-    conn.close()
+    row = connection().execute("SELECT * FROM forge_aliases WHERE alias = ?", (alias,)).fetchone()
     return dict(row) if row else None
@@ -1,49 +1,67 @@
-"""Synthevix — root CLI entry point."""
+"""Synthevix — root Typer app (the console entry point is ``synthevix.cli``)."""
 
 from __future__ import annotations
 
-import shutil
+import importlib
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import typer
-from rich.columns import Columns
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+from typer.core import TyperGroup
 
 from synthevix import __version__
-from synthevix.core.banner import print_banner
-from synthevix.core.config import load_config
-from synthevix.core.database import SYNTHEVIX_DIR, backup_db, init_db
-from synthevix.core.themes import get_theme_data
-from synthevix.core.utils import xp_bar
-from synthevix.cosmos.greetings import get_greeting, get_time_emoji
-from synthevix.cosmos.quotes import format_quote, random_quote
-from synthevix.quest.xp import level_from_xp
-
-# Import sub-apps
-from synthevix.brain.commands import app as brain_app
-from synthevix.quest.commands import app as quest_app
-from synthevix.cosmos.commands import app as cosmos_app
-from synthevix.forge.commands import app as forge_app
-from synthevix.config_commands import app as config_app
+
+if TYPE_CHECKING:
+    import click  # typer's own dependency; only the annotations need it
+
+# Sub-apps are registered by module path and imported only when dispatched,
+# so `synthevix --version` doesn't pay for rich, questionary, requests and
+# every display module. Alias runs never import this module at all.
+LAZY_SUBCOMMANDS = {
+    "brain":  "synthevix.brain.commands",
+    "quest":  "synthevix.quest.commands",
+    "cosmos": "synthevix.cosmos.commands",
+    "forge":  "synthevix.forge.commands",
+    "config": "synthevix.config_commands",
+    "backup": "synthevix.backup_commands",
+}
+
+# Sub-apps that read model tables and so need the schema migrated first.
+_DATA_SUBCOMMANDS = ("brain", "quest", "cosmos", "forge")
+
+
+class LazyGroup(TyperGroup):
+    """Typer group that resolves sub-apps from LAZY_SUBCOMMANDS on first use."""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        names = super().list_commands(ctx)
+        return names + [n for n in LAZY_SUBCOMMANDS if n not in names]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in LAZY_SUBCOMMANDS and cmd_name not in self.commands:
+            module = importlib.import_module(LAZY_SUBCOMMANDS[cmd_name])
+            self.add_command(typer.main.get_command(module.app), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
 
 app = typer.Typer(
     name="synthevix",
     help="✨ Your Personal Terminal Command Center",
+    cls=LazyGroup,
     invoke_without_command=True,
     no_args_is_help=False,
     pretty_exceptions_enable=False,
 )
 
-app.add_typer(brain_app,  name="brain")
-app.add_typer(quest_app,  name="quest")
-app.add_typer(cosmos_app, name="cosmos")
-app.add_typer(forge_app,  name="forge")
-app.add_typer(config_app, name="config")
+_console = None
 
-console = Console()
+
+def _get_console():
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 
 @app.callback(invoke_without_command=True)
@@ -55,12 +73,19 @@ def main_callback(
     Run `synthevix` with no subcommand to launch the welcome screen.
     """
     if version:
-        console.print(f"Synthevix v{__version__}")
+        typer.echo(f"Synthevix v{__version__}")
         raise typer.Exit()
 
     if ctx.invoked_subcommand is not None:
+        if ctx.invoked_subcommand in _DATA_SUBCOMMANDS:
+            from synthevix.core.database import init_db
+            init_db()  # applies pending migrations; one PRAGMA read when current
         return
 
+    from synthevix.core.config import load_config
+    from synthevix.core.database import init_db
+    from synthevix.core.themes import get_theme_data
+
     # First-run init
     init_db()
 
@@ -70,15 +95,21 @@ def main_callback(
 
     # Interactive home menu (which now renders the banner & dashboard itself)
     from synthevix.menu import run_menu
-    run_menu(console, color, username=cfg.general.username)
+    run_menu(_get_console(), color, username=cfg.general.username)
 
 
 def _print_quick_stats(cfg, theme, color: str) -> None:
     """Render the Quick Stats Panel shown on launch."""
+    from rich.align import Align
+    from rich.panel import Panel
+    from rich.text import Text
+
+    from synthevix.core.utils import xp_bar
+    from synthevix.quest.xp import level_from_xp
     from synthevix.quest.models import get_profile
     from synthevix.cosmos.models import get_today_mood, MOOD_EMOJIS, MOOD_LABELS
     from synthevix.forge.models import get_current_coding_streak
-    from synthevix.quest.models import list_quests
+    from synthevix.quest.models import list_quest_summaries
 
     try:
         profile = get_profile()
@@ -90,7 +121,7 @@ def _print_quick_stats(cfg, theme, color: str) -> None:
     streak = profile.get("current_streak", 0)
 
     try:
-        active_quests = len(list_quests(status="active", limit=100))
+        active_quests = len(list_quest_summaries(status="active", limit=100))
     except Exception:
         active_quests = 0
 
@@ -124,14 +155,13 @@ def _print_quick_stats(cfg, theme, color: str) -> None:
     text.append(f"  💻  Coding streak: ", style="dim")
     text.append(f"{coding_streak} day{'s' if coding_streak != 1 else ''}\n", style="bold")
 
-    from rich.align import Align
-    
     panel = Panel(
         text,
         title=f"[bold {color}]Commander Dashboard[/bold {color}]",
         border_style=color,
         expand=False,
     )
+    console = _get_console()
     console.print(Align.center(panel))
     console.print()
 
@@ -141,6 +171,10 @@ def _print_quick_stats(cfg, theme, color: str) -> None:
 @app.command("stats")
 def cmd_stats():
     """Show a full CLI overview dashboard (all modules)."""
+    from synthevix.core.config import load_config
+    from synthevix.core.database import init_db
+    from synthevix.core.themes import get_theme_data
+
     init_db()
     cfg = load_config()
     color = get_theme_data(cfg.theme.active)["primary"]
@@ -149,12 +183,14 @@ def cmd_stats():
     from synthevix.quest.display import print_stats_panel
     from synthevix.quest.models import get_profile
     profile = get_profile()
-    print_stats_panel(profile, console, color)
+    print_stats_panel(profile, _get_console(), color)
 
 
 @app.command("dashboard")
 def cmd_dashboard():
     """Launch the full-screen interactive TUI Dashboard (Phase 2)."""
+    from synthevix.core.database import init_db
+
     init_db()
     from synthevix.dashboard.app import SynthevixDashboard
     app = SynthevixDashboard()
@@ -170,62 +206,30 @@ def cmd_tui():
 
 @app.command("import")
 def cmd_import(
-    file: str = typer.Argument(..., help="Path to backup .db file to restore"),
+    file: str = typer.Argument(
+        ..., help="Backup .db/.db.gz file, or a backup ID from `backup list`"
+    ),
 ):
     """Restore database from a backup file."""
+    from synthevix.core.backup import find_backup, restore_backup
+    from synthevix.core.config import load_config
+    from synthevix.core.database import backup_db
+    from synthevix.core.themes import get_theme_data
+
+    console = _get_console()
     src = Path(file)
     if not src.exists():
-        console.print(f"[bold red]File not found: {file}[/bold red]")
-        raise typer.Exit(1)
+        record = find_backup(file)
+        if record is None or not record.path.exists():
+            console.print(f"[bold red]File not found: {file}[/bold red]")
+            raise typer.Exit(1)
+        src = record.path
     ok = typer.confirm(f"Replace current data.db with '{src.name}'? This cannot be undone.")
     if not ok:
         return
-    backup_db()  # Backup current first
-    dest = SYNTHEVIX_DIR / "data.db"
-    shutil.copy2(src, dest)
+    backup_db("pre-import")  # Backup current first
+    restore_backup(src)      # Also brings an older backup up to the current schema
+    from synthevix.forge.models import invalidate_alias_cache
+    invalidate_alias_cache()
     color = get_theme_data(load_config().theme.active)["primary"]
     console.print(f"  [bold {color}]✓[/bold {color}]  Data restored from {src}")
-
-
-@app.command("backup")
-def cmd_backup():
-    """Create a timestamped database backup."""
-    init_db()
-    dest = backup_db()
-    color = get_theme_data(load_config().theme.active)["primary"]
-    console.print(f"  [bold {color}]✓[/bold {color}]  Backup created at {dest}")
-
-
-def main():
-    """Custom entry point to intercept custom aliases before Typer runs."""
-    import sys
-    import os
-    
-    if len(sys.argv) > 1:
-        # Check if the first argument is a custom alias
-        potential_alias = sys.argv[1]
-        
-        # Don't intercept known top-level commands or flags
-        if not potential_alias.startswith("-") and potential_alias not in ["brain", "quest", "cosmos", "forge", "config", "stats", "dashboard", "tui", "import", "backup"]:
-            try:
-                # Need DB init for models
-                init_db()
-                from synthevix.forge.models import list_aliases
-                aliases = list_aliases()
-                for a in aliases:
-                    if a["alias"] == potential_alias:
-                        # Reconstruct the command string, appending any extra arguments the user passed
-                        extra_args = " ".join(sys.argv[2:])
-                        full_cmd = f"{a['command']} {extra_args}".strip()
-                        
-                        cfg = load_config()
-                        color = get_theme_data(cfg.theme.active)["primary"]
-                        console.print(f"  [dim]⚡ Executing alias: {full_cmd}[/dim]")
-                        
-                        # Execute the raw command in the shell
-                        sys.exit(os.system(full_cmd) >> 8)
-            except Exception:
-                pass  # If DB fails or table doesn't exist, just fall through to Typer
-                
-    # Run the main Typer app
-    app()
@@ -39,11 +39,11 @@ def _overdue_count() -> int:
     """Return the number of active quests past their due date."""
     import datetime
     try:
-        from synthevix.quest.models import list_quests
+        from synthevix.quest.models import list_quest_summaries
         today = datetime.date.today()
         count = 0
-        for q in list_quests(status="active", limit=200):
-            due = q.get("due_date")
+        for q in list_quest_summaries(status="active", limit=200):
+            due = q.due_date
             if due:
                 try:
                     if datetime.date.fromisoformat(str(due).split()[0]) < today:
@@ -68,6 +68,7 @@ MODULES = [
         ("📋  List all entries",     ["brain", "list"]),
         ("🔍  Search entries",       ["brain", "search"]),
         ("🎲  Random entry",         ["brain", "random"]),
+        ("🔁  Review due entries",   ["brain", "review"]),
         ("🏷  View all tags",        ["brain", "tags"]),
         ("📤  Export to Markdown",   ["brain", "export"]),
     ]),
@@ -125,8 +126,42 @@ QUICK_ACTIONS = [
 
 # ── Helpers ──────────────────────────────────────────────────────────────────────
 
+# Commands that must own the terminal ($EDITOR, the live Pomodoro timer, the
+# full-screen dashboard) run in a child process; everything else is dispatched
+# in-process so it reuses the open DB connection, config and imported modules.
+SUBPROCESS_COMMANDS = {
+    ("brain", "add"),
+    ("brain", "edit"),
+    ("config", "edit"),
+    ("quest", "focus"),
+    ("dashboard",),
+}
+
+_cli = None
+
+
+def _needs_subprocess(args: List[str]) -> bool:
+    return any(tuple(args[:len(key)]) == key for key in SUBPROCESS_COMMANDS)
+
+
 def _invoke(args: List[str]) -> None:
-    subprocess.run([sys.argv[0]] + args)
+    global _cli
+    if _needs_subprocess(args):
+        subprocess.run([sys.argv[0]] + args)
+        return
+
+    if _cli is None:
+        import typer
+        from synthevix.main import app
+        _cli = typer.main.get_command(app)
+    try:
+        # standalone_mode reports usage errors and Ctrl+C the same way the
+        # real CLI does; the SystemExit it ends with must not end the menu.
+        _cli.main(args=args, prog_name="synthevix", standalone_mode=True)
+    except SystemExit:
+        pass
+    except Exception as e:
+        Console(stderr=True).print(f"  [bold red]✗ {' '.join(args)} failed:[/bold red] {e}")
 
 
 def _prompt_extra(cli_args: List[str], style: Style) -> List[str]:
@@ -237,10 +272,10 @@ def run_menu(console: Console, initial_hex_color: str, username: str = "Commande
         console.print(Align.center(f"{emoji}  [bold {hex_color}]{greeting}[/bold {hex_color}]"))
         console.print(Align.center(f"[dim italic]✨  {format_quote(quote)}[/dim italic]\n"))
 
-        # Brain resurface — show a random past entry
+        # Brain resurface — the most overdue review, else a random past entry
         try:
-            from synthevix.brain.models import random_entry
-            entry = random_entry()
+            from synthevix.brain.models import resurface_entry
+            entry = resurface_entry()
             if entry:
                 title = entry.get("title") or entry["type"].capitalize()
                 raw_content = (entry.get("content") or "").replace("\n", " ")
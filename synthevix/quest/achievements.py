@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 from typing import List, Optional
 
-from synthevix.core.database import get_connection
+from synthevix.core.database import connection, transaction
+from synthevix.core.utils import count_streak, day_bounds
 
 
 @dataclass
@@ -35,9 +36,7 @@ _ACHIEVEMENT_MAP = {a.id: a for a in ACHIEVEMENTS}
 
 
 def get_unlocked_ids() -> List[str]:
-    conn = get_connection()
-    rows = conn.execute("SELECT achievement_id FROM user_achievements").fetchall()
-    conn.close()
+    rows = connection().execute("SELECT achievement_id FROM user_achievements").fetchall()
     return [r["achievement_id"] for r in rows]
 
 
@@ -58,19 +57,22 @@ def check_and_unlock(profile: dict) -> List[Achievement]:
     already_unlocked = set(get_unlocked_ids())
     newly_unlocked: List[Achievement] = []
 
-    conn = get_connection()
+    conn = connection()
 
     # Gather stats needed for checks
     quests_completed = conn.execute(
         "SELECT COUNT(*) FROM quests WHERE status = 'completed'"
     ).fetchone()[0]
 
-    today = date.today().isoformat()
     quests_today = conn.execute(
-        "SELECT COUNT(*) FROM quests WHERE status = 'completed' AND DATE(completed_at) = ?", (today,)
+        "SELECT COUNT(*) FROM quests"
+        " WHERE status = 'completed' AND completed_at >= ? AND completed_at < ?",
+        day_bounds(date.today()),
     ).fetchone()[0]
 
-    brain_count = conn.execute("SELECT COUNT(*) FROM brain_entries").fetchone()[0]
+    brain_count = conn.execute(
+        "SELECT COALESCE(MAX(count), 0) FROM brain_stats WHERE kind = 'total' AND key = ''"
+    ).fetchone()[0]
 
     # Coding streak from forge
     coding_streak = _get_coding_streak(conn)
@@ -92,7 +94,7 @@ def check_and_unlock(profile: dict) -> List[Achievement]:
         "all_achievements": len(already_unlocked),
     }
 
-    with conn:
+    with transaction():
         for a in ACHIEVEMENTS:
             if a.id in already_unlocked:
                 continue
@@ -101,56 +103,34 @@ def check_and_unlock(profile: dict) -> List[Achievement]:
                 _unlock(a.id, conn)
                 newly_unlocked.append(a)
 
-    conn.close()
     return newly_unlocked
 
 
 def _get_coding_streak(conn) -> int:
     """Count the current consecutive coding days from the coding_streaks table."""
-    rows = conn.execute(
-        "SELECT date FROM coding_streaks WHERE commits > 0 ORDER BY date DESC"
-    ).fetchall()
-    if not rows:
-        return 0
-
-    streak = 0
-    check = date.today()
-    for row in rows:
-        d = date.fromisoformat(row["date"])
-        if d == check or d == check - timedelta(days=1):
-            streak += 1
-            check = d - timedelta(days=1)
-        else:
-            break
-    return streak
+    def coded(day: date) -> bool:
+        return conn.execute(
+            "SELECT 1 FROM coding_streaks WHERE date = ? AND commits > 0", (day.isoformat(),)
+        ).fetchone() is not None
+    return count_streak(coded)
 
 
 def _get_mood_streak(conn) -> int:
     """Count consecutive days with at least one mood log."""
-    rows = conn.execute(
-        "SELECT DISTINCT DATE(logged_at) as d FROM mood_logs ORDER BY d DESC"
-    ).fetchall()
-    if not rows:
-        return 0
-
-    streak = 0
-    check = date.today()
-    for row in rows:
-        d = date.fromisoformat(row["d"])
-        if d == check or d == check - timedelta(days=1):
-            streak += 1
-            check = d - timedelta(days=1)
-        else:
-            break
-    return streak
+    def logged(day: date) -> bool:
+        return conn.execute(
+            "SELECT 1 FROM mood_logs WHERE logged_at >= ? AND logged_at < ? LIMIT 1",
+            day_bounds(day),
+        ).fetchone() is not None
+    return count_streak(logged)
 
 
 def get_all_achievements_with_status() -> List[dict]:
     """Return all achievements with unlocked status and timestamp."""
     unlocked = {}
-    conn = get_connection()
-    rows = conn.execute("SELECT achievement_id, unlocked_at FROM user_achievements").fetchall()
-    conn.close()
+    rows = connection().execute(
+        "SELECT achievement_id, unlocked_at FROM user_achievements"
+    ).fetchall()
     for r in rows:
         unlocked[r["achievement_id"]] = r["unlocked_at"]
 
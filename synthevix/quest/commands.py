@@ -34,6 +34,15 @@ def _multiplier() -> float:
     return load_config().quest.xp_multiplier
 
 
+def _show_pages(fetch, render, after: Optional[str], interactive: bool) -> None:
+    from synthevix.core.pagination import show_pages
+    try:
+        show_pages(fetch, render, console, after=after, interactive=interactive)
+    except ValueError as e:
+        console.print(f"[bold red]{e}[/bold red]")
+        raise typer.Exit(1)
+
+
 @app.command("add")
 def cmd_add(
     title: str = typer.Argument(..., help="Quest title"),
@@ -64,13 +73,25 @@ def cmd_add(
 def cmd_list(
     status: Optional[str] = typer.Option("active", "--status", "-s",
                                          help="Filter: active | completed | failed | all"),
-    limit: int = typer.Option(50, "--limit", "-n"),
+    limit: int = typer.Option(50, "--limit", "-n", help="Quests per page"),
+    after: Optional[str] = typer.Option(None, "--after",
+                                        help="Continue from a cursor printed by a previous page"),
+    page: bool = typer.Option(False, "--page", "-p", help="Page through results interactively"),
 ):
     """List quests."""
     filter_status = None if status == "all" else status
-    quests = models.list_quests(status=filter_status, limit=limit)
-    console.print()
-    print_quests_table(quests, console, _theme_color())
+    color = _theme_color()
+
+    def render(quests):
+        console.print()
+        print_quests_table(quests, console, color)
+
+    _show_pages(
+        lambda cursor: models.list_quest_summaries_page(
+            status=filter_status, limit=limit, after=cursor
+        ),
+        render, after, page,
+    )
 
 
 @app.command("complete")
@@ -184,21 +205,33 @@ def cmd_achievements():
 @app.command("history")
 def cmd_history(
     last: Optional[str] = typer.Option(None, "--last", help="e.g. 30d, 2w"),
-    limit: int = typer.Option(50, "--limit", "-n"),
+    limit: int = typer.Option(50, "--limit", "-n", help="Quests per page"),
+    after: Optional[str] = typer.Option(None, "--after",
+                                        help="Continue from a cursor printed by a previous page"),
+    page: bool = typer.Option(False, "--page", "-p", help="Page through results interactively"),
 ):
     """View completed and failed quest history."""
-    quests = models.get_quest_history(last=last, limit=limit)
-    print_quests_table(quests, console, _theme_color())
+    color = _theme_color()
+    _show_pages(
+        lambda cursor: models.get_quest_history_summaries_page(
+            last=last, limit=limit, after=cursor
+        ),
+        lambda quests: print_quests_table(quests, console, color),
+        after, page,
+    )
 
 
 @app.command("calendar")
 def cmd_calendar():
     """View a 4-week calendar of your completed quests."""
+    from synthevix.core.pagination import iter_rows
     from synthevix.quest.display import print_calendar
     # Get last 35 days to be safe for a full 4-week aligned grid
-    quests = models.get_quest_history(last="35d", limit=1000)
+    quests = iter_rows(
+        lambda cursor: models.get_quest_history_summaries_page(last="35d", limit=500, after=cursor)
+    )
     # Filter to only completed quests for the heatmap
-    completed = [q for q in quests if q.get("status") == "completed"]
+    completed = [q for q in quests if q.status == "completed"]
     print_calendar(completed, console, _theme_color())
 
 
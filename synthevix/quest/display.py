@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import TYPE_CHECKING, List
 
 from rich.console import Console
 from rich.panel import Panel
@@ -12,6 +12,9 @@ from rich.text import Text
 from synthevix.core.utils import format_date, format_relative, truncate_text, xp_bar
 from synthevix.quest.xp import level_from_xp
 
+if TYPE_CHECKING:
+    from synthevix.quest.models import QuestSummary
+
 DIFFICULTY_COLORS = {
     "trivial":   "dim white",
     "easy":      "green",
@@ -29,7 +32,7 @@ STATUS_ICONS = {
 }
 
 
-def print_quests_table(quests: List[dict], console: Console, theme_color: str) -> None:
+def print_quests_table(quests: List[QuestSummary], console: Console, theme_color: str) -> None:
     if not quests:
         console.print(Panel("[dim]No quests found.[/dim]", border_style=theme_color))
         return
@@ -49,20 +52,20 @@ def print_quests_table(quests: List[dict], console: Console, theme_color: str) -
     table.add_column("Due", width=14, justify="left")
 
     for q in quests:
-        status = q.get("status", "active")
-        diff = q.get("difficulty", "medium")
+        status = q.status or "active"
+        diff = q.difficulty
         icon = STATUS_ICONS.get(status, "•")
         status_label = f"{icon}  {status}"
         diff_color = DIFFICULTY_COLORS.get(diff, "white")
         diff_label = f"[{diff_color}]{diff[:10]}[/{diff_color}]"
-        xp = str(q.get("xp_earned", 0)) if q.get("xp_earned") else "—"
+        xp = str(q.xp_earned) if q.xp_earned else "—"
 
         import datetime
         due_str = "[dim]—[/dim]"
-        if q.get("due_date"):
+        if q.due_date:
             try:
-                due_date = datetime.datetime.strptime(q["due_date"].split()[0], "%Y-%m-%d").date()
-                rel_due = format_relative(q["due_date"])
+                due_date = datetime.datetime.strptime(q.due_date.split()[0], "%Y-%m-%d").date()
+                rel_due = format_relative(q.due_date)
                 if due_date < datetime.date.today():
                     due_str = f"[bold red]{rel_due}[/bold red]"
                 elif due_date == datetime.date.today():
@@ -70,15 +73,15 @@ def print_quests_table(quests: List[dict], console: Console, theme_color: str) -
                 else:
                     due_str = f"[dim]{rel_due}[/dim]"
             except Exception:
-                due_str = f"[dim]{q['due_date']}[/dim]"
+                due_str = f"[dim]{q.due_date}[/dim]"
 
         table.add_row(
-            str(q["id"]),
+            str(q.id),
             status_label,
-            Text(truncate_text(q["title"], 40), overflow="ellipsis"),
+            Text(truncate_text(q.title, 40), overflow="ellipsis"),
             diff_label,
             xp,
-            format_relative(q.get("created_at")),
+            format_relative(q.created_at),
             due_str,
         )
 
@@ -163,14 +166,14 @@ def print_xp_earned(xp: int, console: Console, theme_color: str) -> None:
     console.print(f"\n  [bold {theme_color}]+{xp} XP[/bold {theme_color}]  [dim]earned![/dim]")
 
 
-def print_calendar(history: List[dict], console: Console, theme_color: str) -> None:
+def print_calendar(history: List[QuestSummary], console: Console, theme_color: str) -> None:
     """Print a 4-week calendar grid showing habit/quest completion."""
     import datetime
     
     # Bucket history by date string (YYYY-MM-DD)
     days_data = {}
     for entry in history:
-        date_str = entry.get("completed_at", "").split()[0]
+        date_str = entry.completed_at.split()[0] if entry.completed_at else ""
         if date_str:
             days_data[date_str] = days_data.get(date_str, 0) + 1
             
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import List, Optional
 
-from synthevix.core.database import get_connection
+from synthevix.core.database import connection, transaction
+from synthevix.core.pagination import Page, fetch_page
+from synthevix.core.utils import local_day_bounds_utc
 from synthevix.quest.xp import calculate_xp, calculate_xp_penalty, level_from_xp
 
 
@@ -17,36 +20,76 @@ def add_quest(
     repeat: str = "none",
 ) -> int:
     """Insert a new quest. Returns the new quest ID."""
-    conn = get_connection()
-    with conn:
+    with transaction() as conn:
         cur = conn.execute("""
             INSERT INTO quests (title, description, difficulty, due_date, repeat)
             VALUES (?, ?, ?, ?, ?)
         """, (title, description, difficulty, due_date, repeat))
-    conn.close()
     return cur.lastrowid
 
 
-def list_quests(status: Optional[str] = "active", limit: int = 50) -> List[dict]:
-    """List quests, optionally filtered by status."""
-    conn = get_connection()
+@dataclass(slots=True)
+class QuestSummary:
+    """A quest as tables and the dashboard show it (get_quest() has the rest)."""
+
+    id: int
+    title: str
+    difficulty: str
+    status: str
+    xp_earned: int
+    due_date: Optional[str]
+    created_at: str
+    completed_at: Optional[str]
+
+
+_SUMMARY_COLUMNS = "id, title, difficulty, status, xp_earned, due_date, created_at, completed_at"
+
+
+def _summary(row) -> QuestSummary:
+    return QuestSummary(*row)
+
+
+def _quests_query(columns: str, status: Optional[str]) -> tuple:
+    query = f"SELECT {columns} FROM quests WHERE 1=1"
+    params: list = []
     if status:
-        rows = conn.execute(
-            "SELECT * FROM quests WHERE status = ? ORDER BY created_at DESC LIMIT ?",
-            (status, limit),
-        ).fetchall()
-    else:
-        rows = conn.execute(
-            "SELECT * FROM quests ORDER BY created_at DESC LIMIT ?", (limit,)
-        ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+        query += " AND status = ?"
+        params.append(status)
+    return query, params
+
+
+def list_quests_page(
+    status: Optional[str] = "active", limit: int = 50, after: Optional[str] = None,
+) -> Page:
+    """Return one page of quests, newest first, continuing from cursor ``after``."""
+    query, params = _quests_query("*", status)
+    return fetch_page(connection(), query, params, "created_at", after, limit)
+
+
+def list_quests(
+    status: Optional[str] = "active", limit: int = 50, after: Optional[str] = None,
+) -> List[dict]:
+    """List quests, optionally filtered by status."""
+    return list_quests_page(status, limit, after).items
+
+
+def list_quest_summaries_page(
+    status: Optional[str] = "active", limit: int = 50, after: Optional[str] = None,
+) -> Page:
+    """``list_quests_page`` with only the columns tables show, as QuestSummary items."""
+    query, params = _quests_query(_SUMMARY_COLUMNS, status)
+    return fetch_page(connection(), query, params, "created_at", after, limit, _summary)
+
+
+def list_quest_summaries(
+    status: Optional[str] = "active", limit: int = 50, after: Optional[str] = None,
+) -> List[QuestSummary]:
+    """Summaries of quests, optionally filtered by status."""
+    return list_quest_summaries_page(status, limit, after).items
 
 
 def get_quest(quest_id: int) -> Optional[dict]:
-    conn = get_connection()
-    row = conn.execute("SELECT * FROM quests WHERE id = ?", (quest_id,)).fetchone()
-    conn.close()
+    row = connection().execute("SELECT * FROM quests WHERE id = ?", (quest_id,)).fetchone()
     return dict(row) if row else None
 
 
@@ -55,50 +98,47 @@ def complete_quest(quest_id: int, xp_multiplier: float = 1.0) -> dict:
     Mark a quest completed, update profile XP and streak.
     Returns dict with xp_earned, leveled_up, new_level, new_achievements.
     """
-    conn = get_connection()
-    quest = conn.execute("SELECT * FROM quests WHERE id = ?", (quest_id,)).fetchone()
-    if not quest:
-        conn.close()
-        raise ValueError(f"Quest {quest_id} not found.")
-    if quest["status"] != "active":
-        conn.close()
-        raise ValueError(f"Quest {quest_id} is already {quest['status']}.")
-
-    profile = conn.execute("SELECT * FROM user_profile WHERE id = 1").fetchone()
-    profile = dict(profile)
-
-    # Update streak
-    today = date.today()
-    last_date = profile.get("last_quest_date")
-    current_streak = profile.get("current_streak", 0)
-    shields = profile.get("streak_shields", 0)
-
-    if last_date:
-        last = date.fromisoformat(str(last_date))
-        diff = (today - last).days
-        if diff == 0:
-            pass  # Same day, streak unchanged
-        elif diff == 1:
-            current_streak += 1  # Consecutive day
-        elif diff == 2 and shields > 0:
-            current_streak += 1  # Use a shield
-            shields -= 1
+    with transaction() as conn:
+        quest = conn.execute("SELECT * FROM quests WHERE id = ?", (quest_id,)).fetchone()
+        if not quest:
+            raise ValueError(f"Quest {quest_id} not found.")
+        if quest["status"] != "active":
+            raise ValueError(f"Quest {quest_id} is already {quest['status']}.")
+
+        profile = conn.execute("SELECT * FROM user_profile WHERE id = 1").fetchone()
+        profile = dict(profile)
+
+        # Update streak
+        today = date.today()
+        last_date = profile.get("last_quest_date")
+        current_streak = profile.get("current_streak", 0)
+        shields = profile.get("streak_shields", 0)
+
+        if last_date:
+            last = date.fromisoformat(str(last_date))
+            diff = (today - last).days
+            if diff == 0:
+                pass  # Same day, streak unchanged
+            elif diff == 1:
+                current_streak += 1  # Consecutive day
+            elif diff == 2 and shields > 0:
+                current_streak += 1  # Use a shield
+                shields -= 1
+            else:
+                current_streak = 1  # Streak broken
         else:
-            current_streak = 1  # Streak broken
-    else:
-        current_streak = 1  # First quest ever
+            current_streak = 1  # First quest ever
 
-    longest = max(profile.get("longest_streak", 0), current_streak)
-    # Earn a shield every 7-day streak milestone
-    new_shields = shields + (1 if current_streak > 0 and current_streak % 7 == 0 else 0)
+        longest = max(profile.get("longest_streak", 0), current_streak)
+        # Earn a shield every 7-day streak milestone
+        new_shields = shields + (1 if current_streak > 0 and current_streak % 7 == 0 else 0)
 
-    xp_earned = calculate_xp(quest["difficulty"], current_streak, xp_multiplier)
-    new_total_xp = profile["total_xp"] + xp_earned
-    old_level = profile["level"]
-    new_level, _, _ = level_from_xp(new_total_xp)
-    leveled_up = new_level > old_level
+        xp_earned = calculate_xp(quest["difficulty"], current_streak, xp_multiplier)
+        new_total_xp = profile["total_xp"] + xp_earned
+        old_level = profile["level"]
+        new_level, _, _ = level_from_xp(new_total_xp)
+        leveled_up = new_level > old_level
 
-    with conn:
         conn.execute("""
             UPDATE quests
             SET status = 'completed', xp_earned = ?, completed_at = CURRENT_TIMESTAMP
@@ -112,14 +152,13 @@ def complete_quest(quest_id: int, xp_multiplier: float = 1.0) -> dict:
             WHERE id = 1
         """, (new_total_xp, new_level, current_streak, longest, new_shields, today.isoformat()))
 
-    # Check achievements with updated profile
-    updated_profile = {**profile, "total_xp": new_total_xp, "level": new_level,
-                       "current_streak": current_streak}
+        # Check achievements with updated profile
+        updated_profile = {**profile, "total_xp": new_total_xp, "level": new_level,
+                           "current_streak": current_streak}
 
-    from synthevix.quest.achievements import check_and_unlock
-    new_achievements = check_and_unlock(updated_profile)
+        from synthevix.quest.achievements import check_and_unlock
+        new_achievements = check_and_unlock(updated_profile)
 
-    conn.close()
     return {
         "xp_earned": xp_earned,
         "leveled_up": leveled_up,
@@ -132,24 +171,20 @@ def complete_quest(quest_id: int, xp_multiplier: float = 1.0) -> dict:
 
 def fail_quest(quest_id: int) -> dict:
     """Mark a quest as failed and apply XP penalty."""
-    conn = get_connection()
-    quest = conn.execute("SELECT * FROM quests WHERE id = ?", (quest_id,)).fetchone()
-    if not quest:
-        conn.close()
-        raise ValueError(f"Quest {quest_id} not found.")
-    if quest["status"] != "active":
-        conn.close()
-        raise ValueError(f"Quest {quest_id} is already {quest['status']}.")
-
-    penalty = calculate_xp_penalty(quest["difficulty"])
-    with conn:
+    with transaction() as conn:
+        quest = conn.execute("SELECT * FROM quests WHERE id = ?", (quest_id,)).fetchone()
+        if not quest:
+            raise ValueError(f"Quest {quest_id} not found.")
+        if quest["status"] != "active":
+            raise ValueError(f"Quest {quest_id} is already {quest['status']}.")
+
+        penalty = calculate_xp_penalty(quest["difficulty"])
         conn.execute("UPDATE quests SET status = 'failed' WHERE id = ?", (quest_id,))
         conn.execute("""
             UPDATE user_profile
             SET total_xp = MAX(0, total_xp - ?)
             WHERE id = 1
         """, (penalty,))
-    conn.close()
     return {"xp_penalty": penalty}
 
 
@@ -158,41 +193,35 @@ def reset_quest(quest_id: int) -> bool:
 
     Raises ValueError if quest not found, not recurring, or already active.
     """
-    conn = get_connection()
-    quest = conn.execute("SELECT * FROM quests WHERE id = ?", (quest_id,)).fetchone()
-    if not quest:
-        conn.close()
-        raise ValueError(f"Quest {quest_id} not found.")
-    quest = dict(quest)
-    if quest.get("repeat", "none") == "none":
-        conn.close()
-        raise ValueError(f"Quest {quest_id} is not a recurring quest (repeat=none).")
-    if quest["status"] == "active":
-        conn.close()
-        raise ValueError(f"Quest {quest_id} is already active.")
-    with conn:
+    with transaction() as conn:
+        quest = conn.execute("SELECT * FROM quests WHERE id = ?", (quest_id,)).fetchone()
+        if not quest:
+            raise ValueError(f"Quest {quest_id} not found.")
+        quest = dict(quest)
+        if quest.get("repeat", "none") == "none":
+            raise ValueError(f"Quest {quest_id} is not a recurring quest (repeat=none).")
+        if quest["status"] == "active":
+            raise ValueError(f"Quest {quest_id} is already active.")
         conn.execute("""
             UPDATE quests
             SET status = 'active', completed_at = NULL, xp_earned = 0
             WHERE id = ?
         """, (quest_id,))
-    conn.close()
     return True
 
 
 def get_profile() -> dict:
     """Return the user_profile row as a dict."""
-    conn = get_connection()
-    row = conn.execute("SELECT * FROM user_profile WHERE id = 1").fetchone()
-    conn.close()
+    row = connection().execute("SELECT * FROM user_profile WHERE id = 1").fetchone()
     return dict(row) if row else {}
 
 
-def get_quest_history(last: Optional[str] = None, limit: int = 50) -> List[dict]:
-    """Return completed and failed quests, optionally filtered by duration."""
+def _history_query(columns: str, last: Optional[str]) -> tuple:
     from synthevix.core.utils import parse_duration
-    conn = get_connection()
-    query = "SELECT * FROM quests WHERE status IN ('completed', 'failed')"
+    # The planner prefers the (status, created_at) index and then sorts every
+    # match; the partial index yields history newest-first with no sort.
+    query = (f"SELECT {columns} FROM quests INDEXED BY idx_quests_history"
+             " WHERE status IN ('completed', 'failed')")
     params: list = []
 
     if last:
@@ -201,12 +230,37 @@ def get_quest_history(last: Optional[str] = None, limit: int = 50) -> List[dict]
         query += " AND created_at >= ?"
         params.append(since)
 
-    query += " ORDER BY created_at DESC LIMIT ?"
-    params.append(limit)
+    return query, params
 
-    rows = conn.execute(query, params).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+
+def get_quest_history_page(
+    last: Optional[str] = None, limit: int = 50, after: Optional[str] = None,
+) -> Page:
+    """Return one page of completed and failed quests, newest first."""
+    query, params = _history_query("*", last)
+    return fetch_page(connection(), query, params, "created_at", after, limit)
+
+
+def get_quest_history(
+    last: Optional[str] = None, limit: int = 50, after: Optional[str] = None,
+) -> List[dict]:
+    """Return completed and failed quests, optionally filtered by duration."""
+    return get_quest_history_page(last, limit, after).items
+
+
+def get_quest_history_summaries_page(
+    last: Optional[str] = None, limit: int = 50, after: Optional[str] = None,
+) -> Page:
+    """``get_quest_history_page`` with only the columns tables show, as QuestSummary items."""
+    query, params = _history_query(_SUMMARY_COLUMNS, last)
+    return fetch_page(connection(), query, params, "created_at", after, limit, _summary)
+
+
+def get_quest_history_summaries(
+    last: Optional[str] = None, limit: int = 50, after: Optional[str] = None,
+) -> List[QuestSummary]:
+    """Summaries of completed and failed quests, optionally filtered by duration."""
+    return get_quest_history_summaries_page(last, limit, after).items
 
 
 def generate_daily_quests() -> List[dict]:
@@ -229,48 +283,40 @@ def generate_daily_quests() -> List[dict]:
 
 
 def count_quests_completed() -> int:
-    conn = get_connection()
-    n = conn.execute("SELECT COUNT(*) FROM quests WHERE status = 'completed'").fetchone()[0]
-    conn.close()
-    return n
+    return connection().execute(
+        "SELECT COUNT(*) FROM quests WHERE status = 'completed'"
+    ).fetchone()[0]
 
 
 def delete_quest(quest_id: int) -> bool:
     """Delete a quest by ID. Returns True if a row was removed, False otherwise."""
-    conn = get_connection()
-    with conn:
+    with transaction() as conn:
         cur = conn.execute("DELETE FROM quests WHERE id = ?", (quest_id,))
-    conn.close()
     return cur.rowcount > 0
 
 
 def log_pomodoro(duration_minutes: int, quest_id: Optional[int] = None) -> None:
-    conn = get_connection()
-    with conn:
+    with transaction() as conn:
         conn.execute("""
             INSERT INTO pomodoro_sessions (duration_minutes, quest_id)
             VALUES (?, ?)
         """, (duration_minutes, quest_id))
-    conn.close()
 
 
 def get_today_pomodoro_count() -> int:
-    conn = get_connection()
-    row = conn.execute("""
+    # completed_at is UTC (CURRENT_TIMESTAMP); compare against today's local bounds.
+    row = connection().execute("""
         SELECT COUNT(*) FROM pomodoro_sessions
-        WHERE date(completed_at, 'localtime') = date('now', 'localtime')
-    """).fetchone()
-    conn.close()
+        WHERE completed_at >= ? AND completed_at < ?
+    """, local_day_bounds_utc(date.today())).fetchone()
     return row[0] if row else 0
 
 
 def get_pomodoro_history(limit: int = 10) -> List[dict]:
-    conn = get_connection()
-    rows = conn.execute("""
+    rows = connection().execute("""
         SELECT * FROM pomodoro_sessions
         ORDER BY completed_at DESC LIMIT ?
     """, (limit,)).fetchall()
-    conn.close()
     return [dict(r) for r in rows]
 
 
@@ -291,7 +337,5 @@ def update_profile(**fields) -> None:
         raise ValueError(f"Unknown profile fields: {invalid}")
     set_clause = ", ".join(f"{k} = ?" for k in fields)
     values = list(fields.values())
-    conn = get_connection()
-    with conn:
+    with transaction() as conn:
         conn.execute(f"UPDATE user_profile SET {set_clause} WHERE id = 1", values)
-    conn.close()
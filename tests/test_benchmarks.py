@@ -0,0 +1,100 @@
+"""Tests for the benchmark data generator and harness."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+
+# ── Fixtures ────────────────────────────────────────────────────────────────────
+
+@pytest.fixture(autouse=True)
+def use_temp_db(tmp_path, monkeypatch):
+    monkeypatch.setattr("synthevix.core.database.SYNTHEVIX_DIR", tmp_path)
+    monkeypatch.setattr("synthevix.core.database.DB_PATH", tmp_path / "data.db")
+    monkeypatch.setattr("synthevix.core.database.BACKUP_DIR", tmp_path / "backups")
+    import synthevix.core.database as db
+    db.init_db()
+
+
+ANCHOR = datetime(2026, 1, 15, 12, 0, 0)
+
+
+def _dump(table: str) -> list:
+    from synthevix.core.database import connection
+    return [tuple(r) for r in connection().execute(f"SELECT * FROM {table} ORDER BY 1")]
+
+
+# ── Generator Tests ─────────────────────────────────────────────────────────────
+
+def test_populate_respects_sizes():
+    from benchmarks.generate import Sizes, populate
+    from synthevix.core.database import connection
+    populate(Sizes(brain=50, quests=40, moods=30, pomodoro=20, coding_days=10), anchor=ANCHOR)
+    conn = connection()
+    counts = {t: conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0]
+              for t in ("brain_entries", "quests", "mood_logs", "pomodoro_sessions",
+                        "coding_streaks")}
+    assert counts == {"brain_entries": 50, "quests": 40, "mood_logs": 30,
+                      "pomodoro_sessions": 20, "coding_streaks": 10}
+    # FTS stays in sync through the normal triggers.
+    assert conn.execute("SELECT COUNT(*) FROM brain_fts").fetchone()[0] == 50
+
+
+def test_populate_is_deterministic_for_seed(tmp_path, monkeypatch):
+    from benchmarks.generate import Sizes, populate
+    from synthevix.core import database
+    sizes = Sizes(brain=25, quests=25, moods=25, pomodoro=25, coding_days=25)
+    populate(sizes, seed=7, anchor=ANCHOR)
+    first = _dump("brain_entries"), _dump("quests")
+
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "second.db")
+    populate(sizes, seed=7, anchor=ANCHOR)
+    assert (_dump("brain_entries"), _dump("quests")) == first
+
+
+def test_generated_rows_are_within_the_window():
+    from benchmarks.generate import Sizes, populate
+    populate(Sizes(brain=100, quests=100, moods=0, pomodoro=0, coding_days=30), anchor=ANCHOR)
+    completed = [r[-2] for r in _dump("quests") if r[-2]]  # completed_at
+    assert completed and max(completed) <= ANCHOR.strftime("%Y-%m-%d %H:%M:%S")
+    assert _dump("coding_streaks")[-1][0] == "2026-01-15"
+
+
+# ── Harness Tests ───────────────────────────────────────────────────────────────
+
+def test_run_operation_reports_time_and_memory():
+    from benchmarks.harness import Operation, run_operation
+    calls = []
+    op = Operation("alloc", lambda: bytearray(256 * 1024), setup=lambda: calls.append(1))
+    result = run_operation(op, repeats=3, warmup=1)
+    assert result.repeats == 3 and result.median_ms >= 0
+    assert result.peak_kb >= 256
+    assert len(calls) == 5  # warmup + repeats + memory pass
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    from benchmarks.harness import Result, compare
+    base = {"a": Result("a", 10.0, 9.0, 100.0, 5), "b": Result("b", 10.0, 9.0, 100.0, 5)}
+    results = [Result("a", 20.0, 19.0, 100.0, 5), Result("b", 11.0, 10.0, 1000.0, 5),
+               Result("c", 1.0, 1.0, 1.0, 5)]
+    flags = {c.result.name: c.flags for c in compare(results, base, threshold=0.25)}
+    assert flags == {"a": ["time"], "b": ["memory"], "c": []}
+
+
+def test_compare_ignores_tiny_absolute_changes():
+    from benchmarks.harness import Result, compare
+    base = {"fast": Result("fast", 0.01, 0.01, 1.0, 5)}
+    [cmp] = compare([Result("fast", 0.05, 0.05, 2.0, 5)], base)
+    assert not cmp.regressed
+
+
+def test_baselines_round_trip(tmp_path):
+    from benchmarks.harness import Result, load_baselines, save_baselines
+    path = tmp_path / "baselines.json"
+    save_baselines("100", [Result("x", 1.5, 1.0, 10.0, 5)], path)
+    save_baselines("100", [Result("y", 2.5, 2.0, 20.0, 5)], path)
+    loaded = load_baselines(path)
+    assert set(loaded["100"]) == {"x", "y"}
+    assert loaded["100"]["x"].median_ms == 1.5
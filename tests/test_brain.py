@@ -104,6 +104,108 @@ def test_list_tags():
     assert tag_map["javascript"] == 1
 
 
+def test_list_tags_tracks_updates_and_deletes():
+    from synthevix.brain.models import add_entry, delete_entry, list_tags, update_entry
+
+    a = add_entry(type="note", content="A", tags=["python", "async"])
+    b = add_entry(type="note", content="B", tags=["python"])
+    update_entry(a, tags=json.dumps(["rust"]))
+    delete_entry(b)
+
+    assert list_tags() == [{"tag": "rust", "count": 1}]
+
+
+def test_list_entries_tag_filter_applies_before_limit():
+    from synthevix.brain.models import add_entry, list_entries
+
+    for i in range(5):
+        add_entry(type="note", content=f"tagged {i}", tags=["keep"])
+    for i in range(20):
+        add_entry(type="note", content=f"other {i}", tags=["other"])
+
+    entries = list_entries(tag_filter="keep", limit=3)
+    assert len(entries) == 3
+    assert all("keep" in json.loads(e["tags"]) for e in entries)
+
+
+def test_list_entries_tag_filter_all_and_any():
+    from synthevix.brain.models import add_entry, list_entries
+
+    both = add_entry(type="note", content="both", tags=["python", "async"])
+    py = add_entry(type="note", content="py", tags=["python"])
+    add_entry(type="note", content="js", tags=["javascript"])
+
+    all_ids = {e["id"] for e in list_entries(tag_filter=["python", "async"])}
+    any_ids = {e["id"] for e in list_entries(tag_filter=["async", "python"], tag_match="any")}
+    assert all_ids == {both}
+    assert any_ids == {both, py}
+
+
+def test_tag_index_backfilled_by_migration():
+    from synthevix.brain.models import list_entries, list_tags
+    from synthevix.core import database
+
+    conn = database.connection()
+    for trigger in ("insert", "update", "delete"):
+        conn.execute(f"DROP TRIGGER after_brain_{trigger}_tags")
+    conn.execute("DROP TABLE entry_tags")
+    conn.execute(
+        "INSERT INTO brain_entries (type, content, tags) VALUES "
+        "('note', 'old', '[\"legacy\", \"python\"]'), ('note', 'bad', 'not json')"
+    )
+    conn.execute("PRAGMA user_version = 0")
+    conn.execute("DELETE FROM schema_version WHERE version >= 5")
+    conn.commit()
+    database._schema_ready.clear()
+    database.init_db()
+
+    assert {t["tag"] for t in list_tags()} == {"legacy", "python"}
+    assert [e["content"] for e in list_entries(tag_filter="legacy")] == ["old"]
+
+
+def test_list_entries_pages_walk_every_entry_once():
+    from synthevix.brain.models import add_entry, list_entries_page
+
+    # Identical created_at timestamps: only the id tie-break keeps pages apart.
+    ids = [add_entry(type="note", content=f"n{i}") for i in range(7)]
+    seen, cursor, pages = [], None, 0
+    while True:
+        page = list_entries_page(limit=3, after=cursor)
+        seen += [e["id"] for e in page.items]
+        pages += 1
+        if not page.next_cursor:
+            break
+        cursor = page.next_cursor
+
+    assert seen == sorted(ids, reverse=True)
+    assert pages == 3
+
+
+def test_entry_summaries_page_like_full_rows():
+    from synthevix.brain.models import (
+        EntrySummary, add_entry, list_entries, list_entry_summaries_page,
+    )
+
+    for i in range(5):
+        add_entry(type="note", content=f"n{i} " + "x" * 200, title=None if i % 2 else f"T{i}",
+                  tags=["a"])
+    first = list_entry_summaries_page(tag_filter="a", limit=3)
+    second = list_entry_summaries_page(tag_filter="a", limit=3, after=first.next_cursor)
+    summaries = first.items + second.items
+
+    assert all(isinstance(s, EntrySummary) for s in summaries)
+    assert [(s.id, s.title, s.tags) for s in summaries] == \
+        [(e["id"], e["title"], e["tags"]) for e in list_entries(tag_filter="a")]
+    assert summaries[-1].preview == ("n0 " + "x" * 200)[:80]
+    assert second.next_cursor is None
+
+
+def test_list_entries_page_rejects_bad_cursor():
+    from synthevix.brain.models import list_entries_page
+    with pytest.raises(ValueError):
+        list_entries_page(after="garbage")
+
+
 def test_random_entry_returns_none_when_empty():
     from synthevix.brain.models import random_entry
     assert random_entry() is None
@@ -118,6 +220,79 @@ def test_random_entry_returns_entry_when_populated():
     assert entry["content"] == "Only entry"
 
 
+def test_random_entry_survives_id_gaps():
+    from synthevix.brain.models import add_entry, delete_entry, random_entry
+
+    ids = [add_entry(type="note", content=f"n{i}") for i in range(50)]
+    keep = {ids[0], ids[25], ids[-1]}
+    for eid in set(ids) - keep:
+        delete_entry(eid)
+    seen = {random_entry()["id"] for _ in range(100)}
+    assert seen <= keep
+    assert len(seen) > 1
+
+
+def _make_due(*ids, days_ago: int = 1) -> None:
+    from synthevix.core.database import transaction
+    with transaction() as conn:
+        for i, eid in enumerate(ids):
+            conn.execute(
+                "UPDATE brain_entries SET next_review_at = datetime('now', ?) WHERE id = ?",
+                (f"-{days_ago + len(ids) - i} days", eid),
+            )
+
+
+def test_new_entries_are_scheduled_and_due_ones_come_oldest_first():
+    from synthevix.brain.models import add_entry, count_due, due_entries, get_entry, resurface_entry
+
+    a, b, c = (add_entry(type="note", content=x) for x in "abc")
+    assert get_entry(a)["next_review_at"] is not None
+    assert due_entries() == [] and count_due() == 0
+    assert resurface_entry()["id"] in {a, b, c}  # nothing due: random
+
+    _make_due(c, a)
+    assert [e["id"] for e in due_entries()] == [c, a]
+    assert count_due() == 2
+    assert resurface_entry()["id"] == c
+
+
+def test_review_climbs_interval_ladder_and_again_resets():
+    from datetime import datetime
+    from synthevix.brain.models import (
+        REVIEW_INTERVALS, add_entry, due_entries, get_entry, review_entry,
+    )
+
+    eid = add_entry(type="note", content="spaced")
+    _make_due(eid)
+
+    def days_out(when: str) -> int:
+        return round((datetime.fromisoformat(when) - datetime.utcnow()).total_seconds() / 86400)
+
+    assert days_out(review_entry(eid, "good")) == REVIEW_INTERVALS[1]
+    assert days_out(review_entry(eid, "easy")) == REVIEW_INTERVALS[3]
+    assert days_out(review_entry(eid, "again")) == REVIEW_INTERVALS[0]
+    assert get_entry(eid)["review_step"] == 0
+    assert due_entries() == []
+    assert review_entry(9999) is None
+    with pytest.raises(ValueError):
+        review_entry(eid, "meh")
+
+
+def test_review_does_not_reindex_entry_text():
+    from synthevix.core.database import connection
+    from synthevix.brain.models import add_entry, review_entry
+
+    eid = add_entry(type="note", content="stable text")
+    statements = []
+    conn = connection()
+    conn.set_trace_callback(statements.append)
+    try:
+        review_entry(eid, "good")
+    finally:
+        conn.set_trace_callback(None)
+    assert not any("brain_fts" in s or "brain_trigram" in s for s in statements)
+
+
 def test_export_markdown(tmp_path):
     from synthevix.brain.models import add_entry, export_entries
     from synthevix.core import database
@@ -130,6 +305,178 @@ def test_export_markdown(tmp_path):
         assert "Export Test" in content
 
 
+def test_export_json_streams_every_entry(monkeypatch):
+    from synthevix.brain import models
+
+    monkeypatch.setattr(models, "_EXPORT_CHUNK", 2)
+    ids = [models.add_entry(type="note", content=f"Entry {i}") for i in range(5)]
+    calls = []
+    path = models.export_entries(
+        format="json", progress=lambda done, total: calls.append((done, total))
+    )
+
+    data = json.loads(Path(path).read_text())
+    assert [e["id"] for e in data] == ids[::-1]
+    assert calls[-1] == (5, 5)
+
+
+def test_export_jsonl_compressed_with_since(tmp_path):
+    import gzip
+    from synthevix.brain.models import add_entry, export_entries
+    from synthevix.core.database import connection
+
+    old = add_entry(type="note", content="Old")
+    new = add_entry(type="note", content="New")
+    connection().execute(
+        "UPDATE brain_entries SET updated_at = '2020-01-01 00:00:00' WHERE id = ?", (old,)
+    )
+    connection().commit()
+
+    path = export_entries(format="jsonl", updated_since="2025-01-01", compress="gz")
+    assert path.endswith(".jsonl.gz")
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert [r["id"] for r in rows] == [new]
+
+
+def test_export_empty_json_is_valid():
+    from synthevix.brain.models import export_entries
+    assert json.loads(Path(export_entries(format="json")).read_text()) == []
+
+
+def test_import_markdown_folder_with_front_matter(tmp_path):
+    from synthevix.brain.importer import ImportReport, read_source
+    from synthevix.brain.models import get_entry, import_entries, list_tags, search_entries
+
+    notes = tmp_path / "vault"
+    (notes / "sub").mkdir(parents=True)
+    (notes / "a.md").write_text(
+        "---\ntitle: Alpha\ntags: [python, async]\ntype: journal\n---\nAlpha body\n"
+    )
+    (notes / "sub" / "b.md").write_text(
+        "---\ntags:\n  - python\n---\n# Beta heading\nBeta zebra body\n"
+    )
+    (notes / "c.md").write_text("---\ntype: poem\n---\nskipped\n")
+
+    report = ImportReport()
+    assert import_entries(read_source(notes, report)) == 2
+    assert report.skipped and "unknown type" in report.skipped[0][1]
+
+    alpha = get_entry(1)
+    assert (alpha["title"], alpha["type"], json.loads(alpha["tags"])) == (
+        "Alpha", "journal", ["python", "async"]
+    )
+    assert get_entry(2)["title"] == "Beta heading"
+    assert {t["tag"]: t["count"] for t in list_tags()} == {"python": 2, "async": 1}
+    assert [e["id"] for e in search_entries("zebra")] == [2]
+
+
+def test_import_jsonl_round_trips_export_and_restores_triggers(tmp_path):
+    from synthevix.brain.importer import read_source
+    from synthevix.brain.models import (
+        add_entry, count_entries, export_entries, import_entries, list_entries, search_entries,
+    )
+    from synthevix.core.database import connection
+
+    for i in range(3):
+        add_entry(type="note", content=f"giraffe {i}", tags=["zoo"])
+    path = export_entries(format="jsonl", compress="gz")
+
+    # Existing rows outnumber the import: the FTS index is caught up by id range.
+    assert import_entries(read_source(Path(path)), batch_size=2) == 3
+    assert count_entries() == 6
+    assert len(search_entries("giraffe")) == 6
+    assert len(list_entries(tag_filter="zoo")) == 6
+
+    triggers = {
+        r[0] for r in connection().execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    }
+    assert {"after_brain_insert", "after_brain_insert_tags"} <= triggers
+    new = add_entry(type="note", content="okapi", tags=["zoo"])
+    assert [e["id"] for e in search_entries("okapi")] == [new]
+
+
+def test_import_jsonl_skips_records_with_wrong_field_types(tmp_path):
+    from synthevix.brain.importer import ImportReport, read_source
+    from synthevix.brain.models import get_entry, import_entries
+
+    path = tmp_path / "notes.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in [
+        {"content": 123},
+        {"content": {"text": "nested"}},
+        {"content": "tagged oddly", "tags": {"a": 1}},
+        {"content": "fine", "tags": "x, y"},
+    ]) + "\n")
+
+    report = ImportReport()
+    assert import_entries(read_source(path, report)) == 1
+    assert [reason for _, reason in report.skipped] == [
+        "content is not text", "content is not text", "tags are not a list or text",
+    ]
+    assert json.loads(get_entry(1)["tags"]) == ["x", "y"]
+
+
+def test_import_normalizes_timestamps_to_utc(tmp_path):
+    from synthevix.brain.importer import ImportReport, read_source
+    from synthevix.brain.models import (
+        add_entry, get_entry, import_entries, list_entry_summaries_page,
+    )
+    from synthevix.core.database import connection
+
+    recent = add_entry("note", content="written today")
+    path = tmp_path / "notes.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in [
+        {"content": "older", "created_at": "2024-01-02T10:00:00Z"},
+        {"content": "newer", "created_at": "2024-01-03T08:30:00+02:00", "updated_at": "2024-01-04"},
+        {"content": "vague", "created_at": "yesterday"},
+    ]) + "\n")
+
+    report = ImportReport()
+    assert import_entries(read_source(path, report)) == 2
+    assert report.skipped == [(f"{path}:3", "invalid created_at 'yesterday'")]
+    older, newer = get_entry(recent + 1), get_entry(recent + 2)
+    assert older["created_at"] == "2024-01-02 10:00:00"
+    assert newer["created_at"] == "2024-01-03 06:30:00"
+    assert newer["updated_at"] == "2024-01-04 00:00:00"
+    assert connection().execute(
+        "SELECT COUNT(*) FROM brain_entries WHERE next_review_at IS NULL").fetchone()[0] == 0
+
+    first = list_entry_summaries_page(limit=2)
+    rest = list_entry_summaries_page(limit=2, after=first.next_cursor)
+    assert [e.id for e in first.items + rest.items] == [recent, recent + 2, recent + 1]
+
+
+def test_interrupted_import_keeps_insert_triggers():
+    from synthevix.brain.models import (
+        add_entry, count_entries, import_entries, list_entries, search_entries,
+    )
+    from synthevix.core.database import connection
+
+    add_entry(type="note", content="existing")
+
+    def stop(done):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        import_entries(({"content": f"walrus {i}"} for i in range(5)), batch_size=2, progress=stop)
+
+    triggers = {
+        r[0] for r in connection().execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    }
+    assert {"after_brain_insert", "after_brain_insert_trigram",
+            "after_brain_insert_tags", "after_brain_insert_stats"} <= triggers
+    assert count_entries() == 1 and search_entries("walrus") == []
+    assert _stats_rows() == _recounted_stats()
+
+    new = add_entry(type="note", content="narwhal", tags=["sea"])
+    assert [e["id"] for e in search_entries("narwhal")] == [new]
+    assert [e["id"] for e in list_entries(tag_filter="sea")] == [new]
+    assert count_entries() == 2
+    counted = connection().execute("SELECT COUNT(*) FROM brain_entries").fetchone()[0]
+    assert count_entries() == counted
+    assert _stats_rows() == _recounted_stats()
+
+
 def test_count_entries():
     from synthevix.brain.models import add_entry, count_entries
     assert count_entries() == 0
@@ -138,6 +485,165 @@ def test_count_entries():
     assert count_entries() == 2
 
 
+def _stats_rows():
+    from synthevix.core.database import connection
+    rows = connection().execute("SELECT kind, key, count, bytes FROM brain_stats")
+    return sorted(tuple(r) for r in rows)
+
+
+def _recounted_stats():
+    from collections import Counter
+    from synthevix.core.database import connection
+    counts, sizes = Counter(), Counter()
+    for r in connection().execute("SELECT type, language, content, tags FROM brain_text"):
+        try:
+            tags = json.loads(r["tags"])
+        except (TypeError, ValueError):
+            tags = []
+        keys = [("total", ""), ("type", r["type"])]
+        if r["language"]:
+            keys.append(("language", r["language"]))
+        keys += [("tag", t) for t in set(tags if isinstance(tags, list) else [])
+                 if isinstance(t, str)]
+        for key in keys:
+            counts[key] += 1
+            sizes[key] += len(r["content"].encode())
+    return sorted((*key, counts[key], sizes[key]) for key in counts)
+
+
+def test_brain_stats_kept_current_by_triggers():
+    from synthevix.brain.models import (
+        add_entry, brain_stats, count_entries, delete_entry, import_entries, list_tags,
+        update_entry,
+    )
+
+    a = add_entry("snippet", "print('héllo')", tags=["py", "py", "demo"], language="python")
+    b = add_entry("note", "plain note", tags=["demo"])
+    import_entries([{"type": "journal", "content": "dear diary", "tags": ["life"]},
+                    {"type": "snippet", "content": "fn main() {}", "language": "rust"}])
+    import_entries([{"type": "note", "content": "per row", "tags": ["demo"]}], defer_indexes=False)
+    update_entry(a, content="print('hi')", tags='["py"]', language="python3")
+    update_entry(b, type="journal")
+    delete_entry(b)
+    assert _stats_rows() == _recounted_stats()
+
+    assert count_entries() == 4
+    assert list_tags(2) == [{"tag": "demo", "count": 1}, {"tag": "life", "count": 1}]
+    stats = brain_stats(top_tags=1)
+    assert (stats["entries"], stats["tags"]) == (4, 3)
+    assert stats["bytes"] == sum(r[3] for r in _recounted_stats() if r[0] == "total")
+    types = {t["name"]: t["count"] for t in stats["types"]}
+    assert types == {"journal": 1, "snippet": 2, "note": 1}
+    assert [lang["name"] for lang in stats["languages"]] == ["python3", "rust"]
+    assert len(stats["top_tags"]) == 1
+
+
+def test_brain_stats_backfilled_by_migration():
+    from synthevix.brain.models import count_entries
+    from synthevix.core import database
+
+    conn = database.connection()
+    for trigger in ("insert", "update", "delete"):
+        conn.execute(f"DROP TRIGGER after_brain_{trigger}_stats")
+    conn.execute("DROP TABLE brain_stats")
+    conn.execute(
+        "INSERT INTO brain_entries (type, content, tags, language) VALUES "
+        "('snippet', 'x = 1', '[\"py\"]', 'python'), ('note', 'bad', 'not json', NULL)"
+    )
+    conn.execute("PRAGMA user_version = 0")
+    conn.execute("DELETE FROM schema_version WHERE version >= 12")
+    conn.commit()
+    database._schema_ready.clear()
+    database.init_db()
+
+    assert count_entries() == 2
+    assert _stats_rows() == _recounted_stats()
+
+
+# ── Large content ────────────────────────────────────────────────────────────
+
+def _long_text(marker: str) -> str:
+    return " ".join(f"line {i} about sqlite pages" for i in range(600)) + f" {marker}"
+
+
+def _bodies() -> int:
+    from synthevix.core.database import connection
+    return connection().execute("SELECT COUNT(*) FROM brain_bodies").fetchone()[0]
+
+
+def test_large_content_stored_compressed_and_read_in_full(tmp_path):
+    from synthevix.brain.models import (
+        add_entry, delete_entry, entry_revision, export_entries, get_entry, import_entries,
+        list_entries, search_entries, update_entry,
+    )
+    from synthevix.core.database import PREVIEW_CHARS, connection
+
+    big = _long_text("zebrafinch")
+    eid = add_entry("journal", big, title="Long")
+    import_entries([{"type": "snippet", "content": _long_text("okapi"), "language": "sql"}])
+    row = connection().execute(
+        "SELECT content, body_id FROM brain_entries WHERE id = ?", (eid,)
+    ).fetchone()
+    assert row["body_id"] is not None and row["content"] == big[:PREVIEW_CHARS]
+    assert _bodies() == 2
+
+    assert get_entry(eid)["content"] == big
+    assert [e["content"] for e in list_entries() if e["id"] == eid] == [big]
+    assert all("body_id" not in e for e in list_entries())
+    assert [e["content"] for e in search_entries("zebrafinch")] == [big]
+    assert [e["id"] for e in search_entries("ebrafin", mode="substring")] == [eid]
+    assert len(search_entries("okapi")) == 1
+    assert _stats_rows() == _recounted_stats()
+
+    path = export_entries("jsonl")
+    exported = [json.loads(line) for line in Path(path).read_text().splitlines()]
+    assert big in [e["content"] for e in exported]
+    assert all("body_id" not in e for e in exported)
+
+    update_entry(eid, content="short now")
+    assert _bodies() == 1
+    assert search_entries("zebrafinch") == []
+    assert entry_revision(eid, 1) == big
+    update_entry(eid, content=_long_text("axolotl"))
+    assert [e["id"] for e in search_entries("axolotl")] == [eid]
+    assert _stats_rows() == _recounted_stats()
+
+    delete_entry(eid)
+    assert _bodies() == 1
+    assert search_entries("axolotl") == []
+    assert _stats_rows() == _recounted_stats()
+
+    assert update_entry(eid, content=_long_text("ghost")) is False
+    assert _bodies() == 1
+
+
+def test_migration_compresses_existing_large_entries(capsys):
+    from synthevix.brain.models import add_entry, get_entry, search_entries
+    from synthevix.core import database
+
+    big = _long_text("quokka")
+    small = add_entry("note", "stays inline")
+    conn = database.connection()
+    eid = conn.execute(
+        "INSERT INTO brain_entries (type, content) VALUES ('journal', ?)", (big,)
+    ).lastrowid
+    conn.execute("PRAGMA user_version = 0")
+    conn.execute("DELETE FROM schema_version WHERE version >= 14")
+    conn.commit()
+    database._schema_ready.clear()
+    database.init_db()
+
+    assert "Compressed 1 large Brain entries" in capsys.readouterr().err
+    bodies = dict(conn.execute("SELECT id, body_id FROM brain_entries").fetchall())
+    assert bodies[small] is None and bodies[eid] is not None
+    assert get_entry(eid)["content"] == big
+    assert [e["id"] for e in search_entries("quokka")] == [eid]
+    assert 'content="brain_text"' in conn.execute(
+        "SELECT sql FROM sqlite_master WHERE name = 'brain_trigram'"
+    ).fetchone()[0]
+    assert _stats_rows() == _recounted_stats()
+
+
 def test_fts5_search_finds_by_content():
     from synthevix.brain.models import add_entry, search_entries
     add_entry("note", content="The quick brown fox jumps over the lazy dog", title="Fox Note")
@@ -147,6 +653,36 @@ def test_fts5_search_finds_by_content():
     assert "Fox Note" in titles
     assert "Unrelated" not in titles
 
+def test_fts_query_quotes_user_input():
+    from synthevix.brain.fts import to_fts_query
+    assert to_fts_query('c++ "half quoted') == '"c++" AND "half quoted"'
+    assert to_fts_query("a OR b -c pre*") == '(("a" OR "b") AND "pre" *) NOT "c"'
+    assert to_fts_query("title:async http://x.io") == 'title : "async" AND "http://x.io"'
+    assert to_fts_query("-only ***") is None
+
+
+@pytest.mark.parametrize("query", ['"', "it's", "a:b", "-", "foo-bar", "NEAR(", "x AND", "(", "*"])
+def test_search_never_raises_on_fts_syntax(query):
+    from synthevix.brain.models import add_entry, search_entries
+    add_entry("note", content="foo bar it's a:b")
+    search_entries(query)
+
+
+def test_search_ranks_title_and_tags_above_content_and_highlights():
+    from synthevix.brain.fts import HIGHLIGHT_END, HIGHLIGHT_START
+    from synthevix.brain.models import add_entry, search_entries
+
+    body = add_entry("note", content="a long note that mentions sqlite " + "filler " * 40,
+                     title="Misc")
+    tagged = add_entry("note", content="nothing here", title="Other", tags=["sqlite"])
+    titled = add_entry("note", content="short", title="SQLite tuning")
+
+    results = search_entries("sqlite")
+    assert [r["id"] for r in results] == [titled, tagged, body]
+    assert results[0]["title_hl"] == f"{HIGHLIGHT_START}SQLite{HIGHLIGHT_END} tuning"
+    assert f"{HIGHLIGHT_START}sqlite{HIGHLIGHT_END}" in results[2]["snippet"]
+
+
 def test_fts5_search_updated_after_edit():
     from synthevix.brain.models import add_entry, update_entry, search_entries
     eid = add_entry("note", content="original content", title="Edit Me")
@@ -155,3 +691,488 @@ def test_fts5_search_updated_after_edit():
     assert any(r["id"] == eid for r in results)
     old_results = search_entries("original")
     assert not any(r["id"] == eid for r in old_results)
+
+
+def test_substring_search_finds_identifier_fragments_and_urls():
+    from synthevix.brain.models import add_entry, search_entries
+    snippet = add_entry("snippet", content="conn = db.getConnection(timeout=5)", title="DB helper")
+    link = add_entry("bookmark", content="Docs", url="https://sqlite.org/fts5.html")
+    add_entry("note", content="connection pooling notes")
+
+    assert search_entries("getConn") == []
+    assert [r["id"] for r in search_entries("getConn", mode="substring")] == [snippet]
+    assert [r["id"] for r in search_entries("fts5.htm", mode="substring")] == [link]
+    # Terms under three characters can't use the trigram index: LIKE fallback.
+    assert [r["id"] for r in search_entries("B h", mode="substring")] == [snippet]
+
+
+def test_fuzzy_search_tolerates_typos():
+    from synthevix.brain.models import add_entry, search_entries
+    target = add_entry("note", content="Tune the postgres connection pool", title="Pooling")
+    add_entry("note", content="Grocery list: apples, bread")
+    results = search_entries("conection", mode="fuzzy")
+    assert [r["id"] for r in results] == [target]
+    with pytest.raises(ValueError):
+        search_entries("x", mode="regex")
+
+
+def test_import_keeps_trigram_index_in_sync():
+    from synthevix.brain.models import add_entry, import_entries, search_entries
+    add_entry("note", content="existing rowAlpha")
+    import_entries([{"type": "note", "content": f"imported rowBeta{i}"} for i in range(3)])
+    assert len(search_entries("rowBeta", mode="substring")) == 3
+    assert len(search_entries("owAlph", mode="substring")) == 1
+
+
+def test_search_index_built_with_prefix_indexes():
+    from synthevix.core.database import connection, fts_options
+    assert fts_options(connection()) == {"detail": "full", "prefix": "2 3"}
+    assert fts_options(connection(), "missing") is None
+
+
+def test_column_detail_index_is_smaller_and_still_searchable():
+    from synthevix.brain.fts import to_fts_query
+    from synthevix.brain.models import add_entry, index_stats, rebuild_search_index, search_entries
+
+    for i in range(300):
+        words = " ".join(f"word{(i * j) % 89} quick brown fox" for j in range(20))
+        add_entry("note", content=words, title=f"Entry {i}")
+    full = {r["name"]: r for r in index_stats()}
+    rebuild_search_index("column")
+    column = {r["name"]: r for r in index_stats()}
+
+    assert column["brain_fts"]["detail"] == "column"
+    assert column["brain_fts"]["bytes"] < full["brain_fts"]["bytes"]
+    assert 0 < column["brain_fts"]["ratio"] < full["brain_fts"]["ratio"]
+    # No positions: a phrase degrades to all of its words instead of erroring.
+    assert to_fts_query('"brown fox"', phrases=False) == '("brown" AND "fox")'
+    assert len(search_entries('"brown fox" qu*')) == 20
+    # The sync triggers survive the drop and recreate.
+    new = add_entry("note", content="zebra crossing")
+    assert [r["id"] for r in search_entries("zebra")] == [new]
+
+    with pytest.raises(ValueError):
+        rebuild_search_index("none")
+
+
+def test_failed_index_rebuild_keeps_old_index():
+    from synthevix.brain.models import add_entry, search_entries
+    from synthevix.core.database import connection, fts_options, rebuild_brain_fts, transaction
+
+    ids = [add_entry("note", content=f"hello {i}") for i in range(5)]
+    before = fts_options(connection())
+    with pytest.raises(sqlite3.Error):
+        with transaction() as conn:
+            rebuild_brain_fts(conn, "column", prefix="0")   # fails after the DROP
+    assert fts_options(connection()) == before
+    assert sorted(e["id"] for e in search_entries("hello")) == ids
+
+
+def test_index_rebuild_saves_detail_only_after_success(tmp_path, monkeypatch):
+    from typer.testing import CliRunner
+    from synthevix.brain import commands, models
+    from synthevix.core import config
+
+    monkeypatch.setattr(config, "SYNTHEVIX_DIR", tmp_path)
+    monkeypatch.setattr(config, "CONFIG_PATH", tmp_path / "config.toml")
+    config.invalidate_config_cache()
+
+    def fail(detail, vacuum=True):
+        raise sqlite3.OperationalError("interrupted")
+
+    rebuild = models.rebuild_search_index
+    monkeypatch.setattr(models, "rebuild_search_index", fail)
+    result = CliRunner().invoke(commands.app, ["index", "rebuild", "--detail", "column"])
+    assert result.exit_code != 0
+    assert config.load_config().brain.fts_detail == "full"
+
+    monkeypatch.setattr(models, "rebuild_search_index", rebuild)
+    result = CliRunner().invoke(commands.app, ["index", "rebuild", "--detail", "column"])
+    assert result.exit_code == 0, result.output
+    assert config.load_config().brain.fts_detail == "column"
+    config._memo.clear()
+
+
+# ── Related entries ──────────────────────────────────────────────────────────
+
+def test_related_entries_ranked_by_similarity_and_kept_incrementally():
+    from synthevix.brain.models import add_entry, delete_entry, related_entries, update_entry
+
+    base = add_entry("note", content="Tuning sqlite indexes and query plans for faster queries",
+                     title="SQLite tuning", tags=["sqlite"])
+    close = add_entry("note", content="sqlite query plans: reading explain output for indexes",
+                      tags=["sqlite"])
+    loose = add_entry("note", content="Postgres indexes are different from sqlite ones")
+    add_entry("journal", content="Went hiking with the family, great weather")
+
+    related = related_entries(base)
+    assert [r["id"] for r in related] == [close, loose]
+    assert 0 < related[1]["similarity"] < related[0]["similarity"] <= 1
+
+    update_entry(loose, content="Sourdough starter feeding schedule")
+    assert [r["id"] for r in related_entries(base)] == [close]
+    new = add_entry("note", content="sqlite indexes query plans tuning", title="More tuning")
+    assert related_entries(base)[0]["id"] == new
+    delete_entry(new)
+    assert [r["id"] for r in related_entries(base)] == [close]
+    assert related_entries(9999) == []
+
+
+def test_related_index_backfilled_by_related_command_not_view():
+    from typer.testing import CliRunner
+    from synthevix.brain import commands
+    from synthevix.brain.models import (
+        add_entry, import_entries, rebuild_related_index, related_entries, related_index_built,
+    )
+    from synthevix.core.database import transaction
+
+    a = add_entry("note", content="rust borrow checker lifetimes")
+    with transaction() as conn:  # as if the brain predates the index
+        conn.execute("DELETE FROM brain_vectors")
+        conn.execute("DELETE FROM brain_df")
+    b = add_entry("note", content="rust lifetimes and the borrow checker explained")
+    import_entries([{"type": "note", "content": "borrow checker errors in rust"}])
+
+    assert related_entries(a) == []
+    result = CliRunner().invoke(commands.app, ["view", str(a)])
+    assert result.exit_code == 0 and "Related" not in result.output
+    assert not related_index_built()
+
+    result = CliRunner().invoke(commands.app, ["related", str(a)])
+    assert result.exit_code == 0 and related_index_built()
+    first = related_entries(a)
+    assert {r["id"] for r in first} == {b, b + 1}
+    assert rebuild_related_index() == 3
+    assert [(r["id"], round(r["similarity"], 6)) for r in related_entries(a)] == \
+        [(r["id"], round(r["similarity"], 6)) for r in first]
+
+
+def test_related_dot_products_match_without_numpy(monkeypatch):
+    import builtins
+    from array import array
+    from synthevix.brain.vectors import _dots
+
+    rows = [(array("I", [1, 5, 9]).tobytes(), array("f", [1.0, 2.0, 3.0]).tobytes()),
+            (array("I", [2]).tobytes(), array("f", [4.0]).tobytes())]
+    query = {5: 0.5, 9: 1.0, 7: 2.0}
+    real_import = builtins.__import__
+
+    def no_numpy(name, *args, **kwargs):
+        if name == "numpy":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_numpy)
+    assert _dots(query, rows) == [4.0, 0.0]
+
+
+def test_related_dot_products_with_numpy():
+    pytest.importorskip("numpy")
+    from array import array
+    from synthevix.brain.vectors import _dots
+
+    rows = [(array("I", [1, 5, 9]).tobytes(), array("f", [1.0, 2.0, 3.0]).tobytes()),
+            (array("I", [2]).tobytes(), array("f", [4.0]).tobytes())]
+    assert _dots({5: 0.5, 9: 1.0, 7: 2.0}, rows) == [4.0, 0.0]
+
+
+def test_print_related_escapes_untitled_content():
+    from rich.console import Console
+    from synthevix.brain.display import print_related
+
+    console = Console(record=True, width=120)
+    print_related([{"id": 1, "type": "note", "title": None,
+                    "content": "[bold]markup[/bold] [not closed", "similarity": 0.9}],
+                  console, "cyan")
+    assert "[bold]markup[/bold] [not closed" in console.export_text()
+
+
+# ── Near-duplicates ──────────────────────────────────────────────────────────
+
+_ARTICLE = ("Write-ahead logging lets readers keep going while a single writer appends to the log; "
+            "checkpoints copy committed pages back into the main database file when the log grows")
+
+
+def test_minhash_similarity_estimates_overlap():
+    from synthevix.brain.minhash import signature, similarity
+
+    assert similarity(signature(_ARTICLE), signature(_ARTICLE.upper())) == 1.0
+    near = similarity(signature(_ARTICLE), signature(_ARTICLE + " too large"))
+    far = similarity(signature(_ARTICLE),
+                     signature("Sourdough starter feeding schedule for the week"))
+    assert near >= 0.7 > far
+    assert len(signature("")) == len(signature("one")) == 64
+
+
+def test_near_duplicates_found_on_insert_and_kept_incrementally():
+    from synthevix.brain.models import add_entry, delete_entry, find_near_duplicates, update_entry
+
+    original = add_entry("note", content=_ARTICLE, title="WAL")
+    add_entry("note", content="Sourdough starter feeding schedule for the week")
+    dupes = find_near_duplicates(_ARTICLE + " too large")
+    assert [d["id"] for d in dupes] == [original]
+    assert dupes[0]["similarity"] >= 0.7
+    assert find_near_duplicates(_ARTICLE, exclude=original) == []
+
+    copy = add_entry("note", content=_ARTICLE.replace("single", "lone"))
+    assert [d["id"] for d in find_near_duplicates(_ARTICLE)] == [original, copy]
+    update_entry(copy, content="Completely different words about gardening and tomatoes")
+    assert [d["id"] for d in find_near_duplicates(_ARTICLE)] == [original]
+    delete_entry(original)
+    assert find_near_duplicates(_ARTICLE) == []
+
+
+def test_duplicate_index_backfills_and_clusters_merge():
+    from synthevix.brain import minhash
+    from synthevix.brain.models import (
+        add_entry, duplicate_clusters, get_entry, import_entries, merge_entries,
+        rebuild_duplicate_index,
+    )
+    from synthevix.core.database import connection, transaction
+
+    a = add_entry("note", content=_ARTICLE, tags=["sqlite"])
+    with transaction() as conn:  # as if the brain predates the index
+        conn.execute("DELETE FROM brain_lsh")
+        conn.execute("DELETE FROM brain_minhash")
+    b = add_entry("note", content=_ARTICLE + " again", tags=["wal"])
+    import_entries([{"type": "note", "content": _ARTICLE + " once more", "tags": ["sqlite", "db"]},
+                    {"type": "note", "content": "Unrelated note about hiking boots"}])
+
+    groups = duplicate_clusters()
+    assert [[e.id for e in g] for g in groups] == [[a, b, b + 1]]
+    assert minhash.is_built(connection())
+    assert rebuild_duplicate_index() == 4
+
+    assert merge_entries(a, [b, b + 1]) == 2
+    assert get_entry(b) is None and get_entry(b + 1) is None
+    assert json.loads(get_entry(a)["tags"]) == ["sqlite", "wal", "db"]
+    assert duplicate_clusters() == []
+    with pytest.raises(ValueError):
+        merge_entries(9999, [a])
+
+
+def test_unbuilt_duplicate_index_is_not_built_by_a_lookup():
+    from typer.testing import CliRunner
+    from synthevix.brain import commands
+    from synthevix.brain.models import (
+        add_entry, duplicate_index_built, find_near_duplicates, rebuild_duplicate_index,
+    )
+    from synthevix.core.database import transaction
+
+    original = add_entry("note", content=_ARTICLE)
+    with transaction() as conn:  # as if the brain predates the index
+        conn.execute("DELETE FROM brain_lsh")
+        conn.execute("DELETE FROM brain_minhash")
+
+    assert find_near_duplicates(_ARTICLE) == []
+    assert not duplicate_index_built()
+    result = CliRunner().invoke(commands.app, ["add", _ARTICLE + " again"])
+    assert result.exit_code == 0 and "brain index rebuild" in result.output
+    assert not duplicate_index_built()
+
+    assert rebuild_duplicate_index() == 2
+    assert [d["id"] for d in find_near_duplicates(_ARTICLE)] == [original, original + 1]
+
+
+def test_clusters_compare_every_pair_in_a_bucket():
+    from array import array
+
+    from synthevix.brain import minhash
+    from synthevix.core.database import transaction
+
+    # Entries 2 and 4 match each other but neither 1 nor 3, and share only one
+    # bucket, which 1 and 3 are in too.
+    sigs = {1: [1] * 64, 2: [2] * 64, 3: [3] * 64, 4: [2] * 64}
+    with transaction() as conn:
+        conn.executemany("INSERT INTO brain_minhash (entry_id, signature) VALUES (?, ?)",
+                         [(i, array("I", sig).tobytes()) for i, sig in sigs.items()])
+        conn.executemany("INSERT INTO brain_lsh (band, bucket, entry_id) VALUES (0, 7, ?)",
+                         [(i,) for i in sigs])
+        assert minhash.clusters(conn) == [[2, 4]]
+
+
+def test_entries_without_words_are_not_duplicates():
+    from synthevix.brain.models import (
+        add_entry, duplicate_clusters, find_near_duplicates, rebuild_duplicate_index, update_entry,
+    )
+
+    add_entry("note", content="", title="Groceries")
+    second = add_entry("note", content="", title="Meeting agenda")
+    assert find_near_duplicates("") == []
+    assert duplicate_clusters() == []
+    assert rebuild_duplicate_index() == 0
+
+    update_entry(second, content=_ARTICLE)
+    assert [d["id"] for d in find_near_duplicates(_ARTICLE)] == [second]
+    update_entry(second, content="…")
+    assert find_near_duplicates(_ARTICLE) == [] and duplicate_clusters() == []
+
+
+# ── Revisions ────────────────────────────────────────────────────────────────
+
+def test_revision_delta_round_trips():
+    from synthevix.brain.revisions import apply_delta, encode_delta
+
+    base = "  first line\nsecond   line with words\n\ttabbed\n"
+    edited = (base.replace("second", "2nd"), "new start\n" + base[5:] + "  trailing  ")
+    for text in ("", base, *edited):
+        assert apply_delta(base, encode_delta(base, text)) == text
+
+
+def test_edits_keep_revisions_with_bounded_delta_chains():
+    from synthevix.brain import revisions
+    from synthevix.brain.models import (
+        add_entry, entry_history, entry_revision, get_entry, update_entry,
+    )
+    from synthevix.core.database import connection
+
+    versions = ["Notes on sqlite: " + " ".join(f"point {i}" for i in range(40))]
+    eid = add_entry("note", versions[0])
+    for i in range(1, 20):
+        revised = versions[-1].replace(f"point {i}", f"point {i} (revised)")
+        versions.append(revised + f" addendum {i}")
+        update_entry(eid, content=versions[-1])
+    update_entry(eid, content=versions[-1])  # unchanged: no revision
+    update_entry(eid, title="Titled")
+
+    history = entry_history(eid)
+    assert [r["rev"] for r in history] == list(range(1, 20))
+    assert [r["rev"] for r in history if r["keyframe"]] == [1, 9, 17]
+    assert all(entry_revision(eid, r) == versions[r - 1] for r in range(1, 20))
+    assert entry_revision(eid, 20) is None and entry_revision(eid, 0) is None
+    assert get_entry(eid)["content"] == versions[-1]
+
+    chain = connection().execute(
+        "SELECT COUNT(*) FROM brain_revisions WHERE entry_id = ? AND rev BETWEEN 9 AND 16", (eid,)
+    ).fetchone()[0]
+    assert chain == revisions.KEYFRAME_EVERY
+    # Deltas against the previous version take a fraction of full copies.
+    assert sum(r["stored"] for r in history) * 4 < sum(r["size"] for r in history)
+
+
+def test_restore_revision_and_delete_drop_history():
+    from synthevix.brain.models import (
+        add_entry, delete_entry, entry_history, get_entry, restore_revision, update_entry,
+    )
+
+    eid = add_entry("note", "original text")
+    update_entry(eid, content="a bad edit")
+    restore_revision(eid, 1)
+    assert get_entry(eid)["content"] == "original text"
+    assert [r["rev"] for r in entry_history(eid)] == [1, 2]
+    with pytest.raises(ValueError):
+        restore_revision(eid, 5)
+
+    delete_entry(eid)
+    assert entry_history(eid) == []
+
+
+# ── Links ────────────────────────────────────────────────────────────────────
+
+def _linked_ids(entries):
+    return sorted(e.id for e in entries)
+
+
+def test_parse_links():
+    from synthevix.brain.links import parse
+    ids, titles = parse(
+        "see [[12]], [[ Rust notes ]] and [[rust NOTES]]; not [[]] or [x] or [[a\nb]]"
+    )
+    assert ids == {12}
+    assert titles == ["Rust notes"]
+
+
+def test_backlinks_follow_adds_edits_and_deletes():
+    from synthevix.brain.models import add_entry, backlinks, delete_entry, update_entry
+
+    target = add_entry("note", "target", title="Rust Notes")
+    by_id = add_entry("note", f"see [[{target}]]")
+    by_title = add_entry("journal", "read [[rust notes]] again and [[rust notes]]")
+    add_entry("note", "no links here, just [brackets]")
+    assert _linked_ids(backlinks(target)) == [by_id, by_title]
+
+    update_entry(by_id, content="nothing anymore")
+    assert _linked_ids(backlinks(target)) == [by_title]
+    update_entry(by_id, content=f"back to [[{target}]]", title="Linker")
+    assert _linked_ids(backlinks(target)) == [by_id, by_title]
+
+    delete_entry(by_title)
+    assert _linked_ids(backlinks(target)) == [by_id]
+    delete_entry(target)
+    assert backlinks(target) == []
+
+
+def test_title_links_resolve_when_titles_appear_and_move():
+    from synthevix.brain.models import add_entry, backlinks, delete_entry, update_entry
+
+    src = add_entry("note", "todo: write [[Future Plans]]")
+    first = add_entry("note", "plans v1", title="future plans")
+    assert _linked_ids(backlinks(first)) == [src]
+
+    second = add_entry("note", "plans v2", title="Future Plans")
+    assert backlinks(second) == []          # the oldest entry with the title wins
+
+    update_entry(first, title="Old plans")
+    assert backlinks(first) == [] and _linked_ids(backlinks(second)) == [src]
+    delete_entry(second)
+    assert backlinks(second) == []
+    update_entry(first, title="FUTURE PLANS")
+    assert _linked_ids(backlinks(first)) == [src]
+
+
+def test_import_links_new_and_existing_entries():
+    from synthevix.brain.models import add_entry, backlinks, import_entries
+
+    waiting = add_entry("note", "see [[Imported hub]]")
+    import_entries([
+        {"type": "note", "title": "Imported hub", "content": "hub"},
+        {"type": "note", "content": "also [[imported hub]]"},
+    ])
+    hub = waiting + 1
+    assert _linked_ids(backlinks(hub)) == [waiting, hub + 1]
+
+
+def test_link_graph_walks_both_directions_to_depth():
+    from synthevix.brain.models import add_entry, link_graph, update_entry
+
+    a = add_entry("note", "start", title="A")
+    b = add_entry("note", "links [[A]]", title="B")
+    c = add_entry("note", "links [[B]] and [[A]]", title="C")
+    d = add_entry("note", "links [[C]]", title="D")
+    update_entry(a, content=f"start, now pointing at [[{d}]] and itself [[A]]")
+
+    nodes = link_graph(a, depth=1)
+    assert [(n["id"], n["depth"]) for n in nodes] == [(a, 0), (b, 1), (c, 1), (d, 1)]
+    assert {n["id"]: n["outgoing"] for n in nodes[1:]} == {b: False, c: False, d: True}
+
+    e = add_entry("note", "far away [[B]]")
+    nodes = link_graph(d, depth=2)
+    assert {n["id"]: (n["depth"], n["parent"]) for n in nodes} == {
+        d: (0, None), a: (1, d), c: (1, d), b: (2, a),
+    }
+    assert e in {n["id"] for n in link_graph(d, depth=3)}
+    assert link_graph(999) == []
+    with pytest.raises(ValueError):
+        link_graph(a, depth=0)
+
+
+def test_migration_indexes_existing_links():
+    from synthevix.brain.models import backlinks
+    from synthevix.core import database
+
+    conn = database.connection()
+    target = conn.execute(
+        "INSERT INTO brain_entries (type, title, content) VALUES ('note', 'Hub', 'x')"
+    ).lastrowid
+    src = conn.execute("INSERT INTO brain_entries (type, content) VALUES ('note', ?)",
+                       (f"[[{target}]] [[hub]] " + _long_text("quokka"),)).lastrowid
+    database.pack_bodies(conn)
+    conn.execute("DELETE FROM brain_links")
+    conn.execute("PRAGMA user_version = 0")
+    conn.execute("DELETE FROM schema_version WHERE version >= 15")
+    conn.commit()
+    database._schema_ready.clear()
+    database.init_db()
+
+    assert _linked_ids(backlinks(target)) == [src]
+    assert conn.execute("SELECT COUNT(*) FROM brain_links").fetchone()[0] == 2
@@ -0,0 +1,183 @@
+"""Tests for the root CLI — lazy sub-command loading and cold-start import budget."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import time allowed for `import synthevix.main`, in milliseconds.
+# Typer alone accounts for most of it; override on slow machines.
+IMPORT_BUDGET_MS = int(os.environ.get("SYNTHEVIX_IMPORT_BUDGET_MS", "150"))
+
+# Modules that must stay out of the cold-start path.
+HEAVY_MODULES = (
+    "rich.console",
+    "questionary",
+    "requests",
+    "textual",
+    "synthevix.brain.commands",
+    "synthevix.quest.commands",
+    "synthevix.cosmos.commands",
+    "synthevix.forge.commands",
+    "synthevix.config_commands",
+    "synthevix.backup_commands",
+)
+
+
+def _importtime(code: str, home: Path | None = None) -> dict:
+    """Run `python -X importtime -c code` and return {module: cumulative_us}."""
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    if home is not None:
+        env["HOME"] = str(home)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env, cwd=REPO_ROOT,
+    )
+    assert proc.returncode == 0, proc.stderr
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+# ── Lazy Loading Tests ────────────────────────────────────────────────────────────
+
+def test_cold_import_skips_heavy_modules():
+    modules = _importtime("import synthevix.main")
+    loaded = [m for m in HEAVY_MODULES if m in modules]
+    assert loaded == [], f"cold start imported {loaded}"
+
+
+def test_cold_import_within_budget():
+    # Best of three to smooth over a noisy machine.
+    best = min(_importtime("import synthevix.main")["synthevix.main"] for _ in range(3))
+    assert best / 1000 <= IMPORT_BUDGET_MS, f"synthevix.main took {best / 1000:.1f}ms"
+
+
+def test_alias_runs_without_loading_typer(tmp_path):
+    _importtime(
+        "from synthevix.core.database import init_db; init_db()\n"
+        "from synthevix.forge.models import add_alias; add_alias('hi', 'echo hi')",
+        home=tmp_path,
+    )
+    # The stand-in for exec fails the run if Typer or Click were loaded by then.
+    modules = _importtime(
+        "import os, sys\n"
+        "def execvp(file, argv):\n"
+        "    assert argv == ['echo', 'hi', 'there'], argv\n"
+        "    sys.exit(bool({'typer', 'click'} & set(sys.modules)))\n"
+        "os.execvp = execvp\n"
+        "sys.argv = ['synthevix', 'hi', 'there']\n"
+        "from synthevix.cli import main; main()",
+        home=tmp_path,
+    )
+    assert "synthevix.forge.models" in modules
+    assert "synthevix.main" not in modules and "typer" not in modules
+
+
+def test_top_level_commands_match_app():
+    from synthevix.cli import TOP_LEVEL_COMMANDS
+    from synthevix.main import LAZY_SUBCOMMANDS, app
+
+    assert TOP_LEVEL_COMMANDS == {*LAZY_SUBCOMMANDS, *(c.name for c in app.registered_commands)}
+
+
+def test_version_does_not_load_subcommands(monkeypatch):
+    from typer.testing import CliRunner
+    from synthevix.main import LAZY_SUBCOMMANDS, app
+
+    # Earlier tests may have loaded them; monkeypatch puts them back afterwards.
+    for module in LAZY_SUBCOMMANDS.values():
+        monkeypatch.delitem(sys.modules, module, raising=False)
+
+    result = CliRunner().invoke(app, ["--version"])
+    assert result.exit_code == 0
+    assert "Synthevix v" in result.output
+    assert [m for m in LAZY_SUBCOMMANDS.values() if m in sys.modules] == []
+
+
+def test_subcommand_dispatch_loads_module():
+    from typer.testing import CliRunner
+    from synthevix.main import LAZY_SUBCOMMANDS, app
+
+    result = CliRunner().invoke(app, ["forge", "alias", "--help"])
+    assert result.exit_code == 0
+    assert LAZY_SUBCOMMANDS["forge"] in sys.modules
+
+
+def test_help_lists_lazy_subcommands():
+    from typer.testing import CliRunner
+    from synthevix.main import LAZY_SUBCOMMANDS, app
+
+    result = CliRunner().invoke(app, ["--help"])
+    assert result.exit_code == 0
+    for name in LAZY_SUBCOMMANDS:
+        assert name in result.output
+
+
+# ── Menu Dispatch Tests ───────────────────────────────────────────────────────────
+
+def test_menu_dispatches_in_process(monkeypatch):
+    from synthevix import menu
+
+    spawned = []
+    monkeypatch.setattr(menu.subprocess, "run", lambda *a, **k: spawned.append(a))
+    menu._invoke(["quest", "--help"])
+    menu._invoke(["quest", "no-such-command"])  # usage error must not end the menu
+    assert spawned == []
+
+
+def test_menu_uses_subprocess_for_terminal_commands(monkeypatch):
+    from synthevix import menu
+
+    spawned = []
+    monkeypatch.setattr(menu.subprocess, "run", lambda cmd, **k: spawned.append(cmd[1:]))
+    menu._invoke(["brain", "add", "--type", "note"])
+    menu._invoke(["quest", "focus"])
+    assert spawned == [["brain", "add", "--type", "note"], ["quest", "focus"]]
+
+
+# ── Profiler Tests ────────────────────────────────────────────────────────────────
+
+def test_profile_flag_writes_json_breakdown(tmp_path):
+    import json
+
+    out = tmp_path / "profile.json"
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT), "HOME": str(tmp_path)}
+    env.pop("SYNTHEVIX_PROFILE", None)
+    proc = subprocess.run(
+        [sys.executable, "-c", "from synthevix.cli import main; main()",
+         f"--profile={out}", "stats"],
+        capture_output=True, text=True, env=env, cwd=REPO_ROOT,
+    )
+    assert proc.returncode == 0, proc.stderr
+    data = json.loads(out.read_text())
+    assert data["argv"] == ["stats"]
+    assert {p["name"] for p in data["phases"]} >= {"init_db", "load_config", "render"}
+    assert any(s["name"].startswith("SELECT") for s in data["sql"])
+    assert data["sql_statements_executed"] > 0
+
+
+def test_profile_argv_parsing(monkeypatch):
+    from synthevix.core.profiler import from_argv
+
+    monkeypatch.delenv("SYNTHEVIX_PROFILE", raising=False)
+    args = ["--profile", "quest", "list"]
+    assert from_argv(args) == "" and args == ["quest", "list"]
+    args = ["--profile=run.json", "stats"]
+    assert from_argv(args) == "run.json" and args == ["stats"]
+    args = ["brain", "list", "--profile"]  # only a leading flag is ours
+    assert from_argv(args) is None and len(args) == 3
+
+    monkeypatch.setenv("SYNTHEVIX_PROFILE", "1")
+    assert from_argv(["stats"]) == ""
+    monkeypatch.setenv("SYNTHEVIX_PROFILE", "0")
+    assert from_argv(["stats"]) is None
@@ -0,0 +1,410 @@
+"""Tests for core infrastructure — shared connections, transactions, and schema init."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+
+# ── Fixtures ────────────────────────────────────────────────────────────────────
+
+@pytest.fixture(autouse=True)
+def use_temp_db(tmp_path, monkeypatch):
+    monkeypatch.setattr("synthevix.core.database.SYNTHEVIX_DIR", tmp_path)
+    monkeypatch.setattr("synthevix.core.database.DB_PATH", tmp_path / "data.db")
+    monkeypatch.setattr("synthevix.core.database.BACKUP_DIR", tmp_path / "backups")
+    import synthevix.core.database as db
+    with db.get_connection() as conn:
+        conn.execute("DROP TABLE IF EXISTS schema_version")
+    db.init_db()
+
+
+# ── Connection Manager Tests ─────────────────────────────────────────────────────
+
+def test_connection_is_shared_within_thread():
+    from synthevix.core.database import connection
+    assert connection() is connection()
+
+
+def test_connection_reopens_when_db_path_changes(tmp_path, monkeypatch):
+    from synthevix.core import database
+    first = database.connection()
+    monkeypatch.setattr("synthevix.core.database.DB_PATH", tmp_path / "other.db")
+    second = database.connection()
+    assert second is not first
+    assert (tmp_path / "other.db").exists()
+
+
+def test_connection_uses_separate_connection_per_thread():
+    import threading
+    from synthevix.core.database import connection
+
+    main_conn = connection()
+    seen = []
+    t = threading.Thread(target=lambda: seen.append(connection()))
+    t.start()
+    t.join()
+    assert seen and seen[0] is not main_conn
+
+
+def test_pragma_profile_applied():
+    from synthevix.core.database import connection
+    conn = connection()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+
+def test_configure_pragmas_reopens_with_new_settings():
+    from synthevix.core import database
+    old = database._manager.profile
+    try:
+        database.configure_pragmas(cache_size=-4000)
+        assert database.connection().execute("PRAGMA cache_size").fetchone()[0] == -4000
+    finally:
+        database._manager.profile = old
+        database.close_connection()
+
+
+def test_transaction_rolls_back_on_error():
+    from synthevix.core.database import connection, transaction
+    with pytest.raises(RuntimeError):
+        with transaction() as conn:
+            conn.execute("INSERT INTO mood_logs (mood) VALUES (3)")
+            raise RuntimeError("boom")
+    assert connection().execute("SELECT COUNT(*) FROM mood_logs").fetchone()[0] == 0
+
+
+def test_nested_transaction_joins_outer():
+    from synthevix.core.database import connection, transaction
+    with pytest.raises(RuntimeError):
+        with transaction() as conn:
+            conn.execute("INSERT INTO mood_logs (mood) VALUES (3)")
+            with transaction() as inner:
+                inner.execute("INSERT INTO mood_logs (mood) VALUES (4)")
+            # The inner block must not have committed the outer work.
+            raise RuntimeError("boom")
+    assert connection().execute("SELECT COUNT(*) FROM mood_logs").fetchone()[0] == 0
+
+
+def test_writes_visible_to_private_connections():
+    from synthevix.core.database import get_connection
+    from synthevix.cosmos.models import log_mood
+    log_mood(5)
+    conn = get_connection()
+    assert conn.execute("SELECT COUNT(*) FROM mood_logs").fetchone()[0] == 1
+    conn.close()
+
+
+def test_complete_quest_uses_single_connection(monkeypatch):
+    from synthevix.quest.models import add_quest, complete_quest
+
+    add_quest("One connection", difficulty="easy")
+    opened = []
+    real_connect = sqlite3.connect
+    monkeypatch.setattr(sqlite3, "connect",
+                        lambda *a, **k: opened.append(a) or real_connect(*a, **k))
+    complete_quest(1)
+    assert opened == []
+
+
+# ── Schema Fast Path Tests ───────────────────────────────────────────────────────
+
+def test_init_db_sets_user_version():
+    from synthevix.core.database import _SCHEMA_VERSION, connection
+    assert connection().execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION
+
+
+def test_init_db_skips_ddl_when_schema_current():
+    from synthevix.core import database
+    statements = []
+    conn = database.connection()
+    conn.set_trace_callback(statements.append)
+    try:
+        database._schema_ready.clear()
+        database.init_db()
+    finally:
+        conn.set_trace_callback(None)
+    assert statements == ["PRAGMA user_version"]
+
+
+def test_init_db_runs_migrations_when_version_behind():
+    from synthevix.core import database
+    conn = database.connection()
+    conn.execute("PRAGMA user_version = 0")
+    conn.execute("DROP TABLE pomodoro_sessions")
+    conn.execute("DELETE FROM schema_version WHERE version >= 3")
+    conn.commit()
+    database._schema_ready.clear()
+    database.init_db()
+    tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert "pomodoro_sessions" in tables
+
+
+# ── Backup Tests ────────────────────────────────────────────────────────────────
+
+def _add_note(title: str) -> None:
+    from synthevix.core.database import transaction
+    with transaction() as conn:
+        conn.execute(
+            "INSERT INTO brain_entries (type, title, content) VALUES ('note', ?, '')", (title,)
+        )
+
+
+def _backup_titles(path) -> list:
+    import gzip
+    raw = path.with_suffix("")  # strip .gz
+    raw.write_bytes(gzip.decompress(path.read_bytes()))
+    conn = sqlite3.connect(str(raw))
+    try:
+        return [r[0] for r in conn.execute("SELECT title FROM brain_entries ORDER BY id")]
+    finally:
+        conn.close()
+
+
+def test_backup_includes_uncheckpointed_wal_pages():
+    from synthevix.core import backup
+    _add_note("only in the wal")
+    record = backup.create_backup()
+    assert _backup_titles(record.path) == ["only in the wal"]
+
+
+def test_backup_deduplicates_unchanged_database():
+    from synthevix.core import backup
+    first = backup.create_backup()
+    second = backup.create_backup()
+    assert first.sha256 == second.sha256
+    assert len(backup.list_backups()) == 2
+    assert len(list(first.path.parent.glob("*.db.gz"))) == 1
+
+    _add_note("changed")
+    third = backup.create_backup()
+    assert third.sha256 != first.sha256
+
+
+def test_backup_progress_reports_pages():
+    from synthevix.core import backup
+    seen = []
+    backup.create_backup(progress=lambda done, total: seen.append((done, total)))
+    assert seen and seen[-1][0] == seen[-1][1]
+
+
+def test_prune_keeps_daily_and_weekly_and_collects_objects():
+    from datetime import datetime, timedelta
+    from synthevix.core import backup
+    now = datetime(2026, 3, 20, 12, 0)
+    records = []
+    for days_ago in range(30):
+        _add_note(f"day {days_ago}")
+        r = backup.create_backup()
+        r.created_at = (now - timedelta(days=days_ago)).isoformat(timespec="seconds")
+        records.append(r)
+    backup._save_index(records)
+
+    removed = backup.prune_backups(backup.RetentionPolicy(keep_daily=3, keep_weekly=2))
+    kept = backup.list_backups()
+    kept_days = [r.created_at[:10] for r in kept]
+    # 3 newest days, plus the newest of the previous ISO week.
+    assert kept_days == ["2026-03-20", "2026-03-19", "2026-03-18", "2026-03-15"]
+    assert len(removed) == 26
+    objects = {p.name for p in kept[0].path.parent.glob("*.db.gz")}
+    assert objects == {f"{r.sha256}.db.gz" for r in kept}
+
+
+def test_prune_includes_legacy_copies():
+    from synthevix.core import backup, database
+    legacy = database.BACKUP_DIR / "data_20200101_000000.db"
+    legacy.write_bytes(b"")
+    backup.create_backup()
+    removed = backup.prune_backups(backup.RetentionPolicy(keep_daily=1, keep_weekly=0))
+    assert [r.id for r in removed] == ["data_20200101_000000"]
+    assert not legacy.exists()
+
+
+def test_migrations_take_a_single_backup():
+    from synthevix.core import backup, database
+    _add_note("before upgrade")
+    conn = database.connection()
+    conn.execute("PRAGMA user_version = 0")
+    conn.execute("DELETE FROM schema_version WHERE version >= 2")
+    conn.commit()
+    database._schema_ready.clear()
+    database.init_db()
+    records = backup.list_backups()
+    assert [r.reason for r in records] == ["migration"]
+    assert _backup_titles(records[0].path) == ["before upgrade"]
+
+
+def test_fresh_database_takes_no_migration_backup():
+    from synthevix.core import backup
+    assert backup.list_backups() == []
+
+
+def test_restore_from_compressed_backup():
+    from synthevix.core import backup, database
+    _add_note("keep me")
+    record = backup.create_backup()
+    _add_note("discard me")
+    backup.restore_backup(record.path)
+    titles = [r[0] for r in database.connection().execute("SELECT title FROM brain_entries")]
+    assert titles == ["keep me"]
+
+
+# ── Config Cache Tests ──────────────────────────────────────────────────────────
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    from synthevix.core import config
+    monkeypatch.setattr(config, "SYNTHEVIX_DIR", tmp_path)
+    monkeypatch.setattr(config, "CONFIG_PATH", tmp_path / "config.toml")
+    config.invalidate_config_cache()
+    yield config
+    config._memo.clear()
+
+
+def test_load_config_parses_toml_once(config_dir, monkeypatch):
+    import toml
+    config_dir.load_config()
+    calls = []
+    monkeypatch.setattr(toml, "load", lambda *a, **k: calls.append(a) or {})
+    config_dir.load_config()
+    config_dir._memo.clear()  # simulate a new process: snapshot only
+    assert config_dir.load_config().general.username == "Commander"
+    assert calls == []
+
+
+def test_load_config_returns_independent_copies(config_dir):
+    cfg = config_dir.load_config()
+    cfg.cosmos.quote_categories.append("mutated")
+    cfg.general.username = "Mutated"
+    fresh = config_dir.load_config()
+    assert "mutated" not in fresh.cosmos.quote_categories
+    assert fresh.general.username == "Commander"
+
+
+def test_save_config_invalidates_cache(config_dir):
+    cfg = config_dir.load_config()
+    cfg.theme.active = "nord"
+    config_dir.save_config(cfg)
+    assert config_dir.load_config().theme.active == "nord"
+
+
+def test_external_edit_is_picked_up(config_dir):
+    import os
+    config_dir.load_config()
+    path = config_dir.CONFIG_PATH
+    path.write_text(path.read_text().replace('active = "cyberpunk"', 'active = "dracula"'))
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert config_dir.load_config().theme.active == "dracula"
+
+
+def test_stale_snapshot_missing_new_section_still_loads(config_dir):
+    import marshal
+    config_dir.load_config()
+    key = config_dir._stat_key()
+    with open(config_dir._snapshot_path(), "wb") as f:
+        marshal.dump((config_dir._SNAPSHOT_FORMAT, key, {"general": {"username": "Old"}}), f)
+    config_dir._memo.clear()
+    cfg = config_dir.load_config()
+    assert cfg.general.username == "Old"
+    assert cfg.backup.keep_daily == 7
+    assert cfg.brain.fts_detail == "full"
+
+
+def test_custom_themes_cached_until_file_changes(tmp_path, monkeypatch):
+    import os
+    import toml
+    from synthevix.core import themes
+    path = tmp_path / "mine.toml"
+    path.write_text('[themes.mine]\nprimary = "#111111"\n')
+    assert themes.get_theme_data("mine", str(path))["primary"] == "#111111"
+
+    real_load = toml.load
+    calls = []
+    monkeypatch.setattr(toml, "load", lambda *a, **k: calls.append(a) or real_load(*a, **k))
+    themes.get_theme_data("mine", str(path))
+    assert calls == []
+
+    path.write_text('[themes.mine]\nprimary = "#222222"\n')
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert themes.get_theme_data("mine", str(path))["primary"] == "#222222"
+
+
+# ── Profiler Tests ──────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def profiled(monkeypatch):
+    from synthevix.core import database, profiler
+    prof = profiler.Profiler()
+    monkeypatch.setattr(profiler, "_profiler", prof)
+    monkeypatch.setattr(database, "_connection_factory", profiler.ProfiledConnection)
+    database.close_connection()
+    yield prof
+    database.close_connection()
+
+
+def test_profiled_connection_times_execute_and_fetch(profiled):
+    from synthevix.core.database import connection, transaction
+    with transaction() as conn:
+        conn.executemany("INSERT INTO mood_logs (mood) VALUES (?)", [(3,), (4,)])
+    rows = connection().execute("SELECT   mood FROM mood_logs\n ORDER BY id").fetchall()
+    assert [r["mood"] for r in rows] == [3, 4]  # row_factory still applies
+
+    stat = profiled.sql["SELECT mood FROM mood_logs ORDER BY id"]
+    assert stat.calls == 1 and stat.seconds > 0
+    assert profiled.sql["INSERT INTO mood_logs (mood) VALUES (?)"].calls == 1
+    assert sum(profiled.traced.values()) >= 4  # pragmas, BEGIN, inserts, COMMIT, select
+
+
+def test_profiler_phase_counts_reentrant_calls_once():
+    from synthevix.core.profiler import Profiler
+    prof = Profiler()
+    with prof.phase("render"):
+        with prof.phase("render"):
+            pass
+    with prof.phase("render"):
+        pass
+    assert prof.phases["render"].calls == 2
+
+
+# ── Pagination Tests ────────────────────────────────────────────────────────────
+
+def test_cursor_round_trips_and_rejects_garbage():
+    from synthevix.core.pagination import decode_cursor, encode_cursor
+    cursor = encode_cursor("2026-03-20 10:00:00", 42)
+    assert decode_cursor(cursor) == ("2026-03-20 10:00:00", 42)
+    for bad in ("", "not-a-cursor", encode_cursor("x", "42")):
+        with pytest.raises(ValueError):
+            decode_cursor(bad)
+
+
+# ── Utility Tests ───────────────────────────────────────────────────────────────
+
+def test_count_streak_allows_single_day_gaps():
+    from datetime import date, timedelta
+    from synthevix.core.utils import count_streak
+    today = date(2026, 3, 20)
+    active = {today - timedelta(days=n) for n in (1, 2, 4, 7)}  # gap of 1, then 2
+    probes = []
+    streak = count_streak(lambda d: probes.append(d) or d in active, today)
+    assert streak == 3
+    assert len(probes) <= 2 * (streak + 1)
+
+
+def test_local_day_bounds_utc_cover_local_midnight(monkeypatch):
+    import time
+    from datetime import date
+    from synthevix.core.utils import local_day_bounds_utc
+    monkeypatch.setenv("TZ", "Asia/Kolkata")  # UTC+05:30
+    time.tzset()
+    try:
+        assert local_day_bounds_utc(date(2026, 3, 20)) == (
+            "2026-03-19 18:30:00", "2026-03-20 18:30:00"
+        )
+    finally:
+        monkeypatch.delenv("TZ")
+        time.tzset()
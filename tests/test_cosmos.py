@@ -62,6 +62,32 @@ def test_mood_stats_empty():
     assert stats["avg_mood"] is None
 
 
+def test_mood_history_has_no_hidden_cap():
+    from synthevix.cosmos.models import (
+        get_mood_history, get_mood_history_page, get_mood_stats, log_mood,
+    )
+    for _ in range(120):
+        log_mood(4)
+    assert len(get_mood_history(days=365)) == 120
+    assert get_mood_stats(days=365)["count"] == 120
+    page = get_mood_history_page(days=365, limit=100)
+    assert len(page.items) == 100 and page.next_cursor
+
+
+def test_mood_summaries_leave_out_notes():
+    from synthevix.cosmos.models import (
+        MoodSummary, get_mood_summaries, get_mood_summaries_page, log_mood,
+    )
+    for i in range(5):
+        log_mood(i + 1, energy=i + 1, note="private")
+    summaries = get_mood_summaries(days=365)
+    assert [s.mood for s in summaries] == [5, 4, 3, 2, 1]
+    assert all(isinstance(s, MoodSummary) and not hasattr(s, "note") for s in summaries)
+    page = get_mood_summaries_page(days=365, limit=3)
+    rest = get_mood_summaries_page(days=365, limit=3, after=page.next_cursor)
+    assert [s.id for s in page.items + rest.items] == [s.id for s in summaries]
+
+
 def test_mood_invalid_value_rejected():
     """DB constraint prevents mood outside 1–6."""
     import sqlite3
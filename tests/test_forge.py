@@ -40,6 +40,16 @@ def test_record_coding_day_accumulates():
     assert data[0]["commits"] == 7
 
 
+def test_streak_days_leave_out_repos():
+    from synthevix.forge.models import StreakDay, get_streak_days, record_coding_day
+    today = date.today()
+    record_coding_day(day=today.isoformat(), commits=2, repos=["/a"])
+    record_coding_day(day=(today - timedelta(days=1)).isoformat(), commits=1)
+    assert get_streak_days(days=7) == [
+        StreakDay(today.isoformat(), 2), StreakDay((today - timedelta(days=1)).isoformat(), 1),
+    ]
+
+
 def test_coding_streak_consecutive_days():
     from synthevix.forge.models import get_current_coding_streak, record_coding_day
     today = date.today().isoformat()
@@ -127,3 +137,69 @@ def test_show_today_calls_git(tmp_path):
         mock_run.return_value = MagicMock(returncode=0, stdout="abc123 Initial commit", stderr="")
         result = show_today(cwd=str(tmp_path))
     assert mock_run.called
+
+
+# ── Alias Fast Path Tests ───────────────────────────────────────────────────────
+
+def test_alias_cache_written_on_add_and_delete(tmp_path):
+    import json
+    from synthevix.forge.models import add_alias, delete_alias
+    add_alias("gs", "git status")
+    assert json.loads((tmp_path / "aliases.json").read_text()) == {"gs": "git status"}
+    delete_alias("gs")
+    assert json.loads((tmp_path / "aliases.json").read_text()) == {}
+
+
+def test_resolve_alias_rebuilds_missing_cache(tmp_path):
+    from synthevix.forge.models import add_alias, invalidate_alias_cache, resolve_alias
+    add_alias("gp", "git push")
+    invalidate_alias_cache()
+    assert resolve_alias("gp") == "git push"
+    assert (tmp_path / "aliases.json").exists()
+    assert resolve_alias("nope") is None
+
+
+def test_resolve_alias_without_database(tmp_path, monkeypatch):
+    from synthevix.forge.models import resolve_alias
+    monkeypatch.setattr("synthevix.core.database.SYNTHEVIX_DIR", tmp_path / "fresh")
+    monkeypatch.setattr("synthevix.core.database.DB_PATH", tmp_path / "fresh" / "data.db")
+    assert resolve_alias("gs") is None
+    assert not (tmp_path / "fresh" / "data.db").exists()
+
+
+def test_main_execs_alias_directly(monkeypatch):
+    import sys
+    from synthevix import cli
+    from synthevix.forge.models import add_alias
+
+    add_alias("gl", "git log --oneline")
+    calls = []
+
+    def fake_execvp(file, argv):
+        calls.append(argv)
+        raise SystemExit(0)
+
+    monkeypatch.setattr("os.execvp", fake_execvp)
+    monkeypatch.setattr(sys, "argv", ["synthevix", "gl", "-n", "3"])
+    with pytest.raises(SystemExit):
+        cli.main()
+    assert calls == [["git", "log", "--oneline", "-n", "3"]]
+
+
+def test_main_uses_shell_for_compound_alias(monkeypatch):
+    import sys
+    from synthevix import cli
+    from synthevix.forge.models import add_alias
+
+    add_alias("up", "git pull && git push")
+    calls = []
+
+    def fake_execv(path, argv):
+        calls.append(argv)
+        raise SystemExit(0)
+
+    monkeypatch.setattr("os.execv", fake_execv)
+    monkeypatch.setattr(sys, "argv", ["synthevix", "up"])
+    with pytest.raises(SystemExit):
+        cli.main()
+    assert calls == [["sh", "-c", "git pull && git push"]]
@@ -0,0 +1,164 @@
+"""Query-plan audit — every model query must avoid full scans of growing tables."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+# Statements allowed to scan a large table, with the reason. Remove an entry as
+# soon as the query stops scanning; the test fails on stale entries too.
+ALLOWED_SCANS = {
+    "SELECT group_concat(entry_id) FROM brain_lsh GROUP BY band, bucket HAVING COUNT(*) > 1":
+        "brain dedupe clusters everything in one ordered pass over the LSH primary key",
+    "SELECT id FROM brain_entries WHERE body_id IS NULL AND length(CAST(content AS BLOB)) > ?":
+        "pack_bodies runs once, in the schema migration (and in benchmark data generation)",
+}
+
+
+# ── Fixtures ────────────────────────────────────────────────────────────────────
+
+@pytest.fixture(autouse=True)
+def use_temp_db(tmp_path, monkeypatch):
+    monkeypatch.setattr("synthevix.core.database.SYNTHEVIX_DIR", tmp_path)
+    monkeypatch.setattr("synthevix.core.database.DB_PATH", tmp_path / "data.db")
+    monkeypatch.setattr("synthevix.core.database.BACKUP_DIR", tmp_path / "backups")
+    import synthevix.core.database as db
+    db.init_db()
+
+
+@pytest.fixture
+def auditor():
+    from synthevix.core import queryplan
+    aud = queryplan.enable(warn=False)
+    yield aud
+    queryplan.disable()
+
+
+def _exercise_models() -> None:
+    """Call every read and write path the commands use."""
+    from benchmarks import harness, operations  # noqa: F401 — registers operations
+    from synthevix.brain import models as brain
+    from synthevix.cosmos import models as cosmos
+    from synthevix.forge import models as forge
+    from synthevix.quest import achievements
+    from synthevix.quest import models as quest
+
+    harness.run(repeats=1, warmup=0)
+
+    eid = brain.add_entry("note", "audit me", title="Audit", tags=["x"])
+    brain.get_entry(eid)
+    brain.update_entry(eid, title="Audited")
+    brain.review_entry(eid, "good")
+    brain.related_entries(eid)
+    linker = brain.add_entry("note", f"see [[{eid}]] and [[Audited]]", title="Linker")
+    brain.update_entry(linker, content="only [[Audited]] now", title="Linker 2")
+    brain.backlinks(eid)
+    brain.link_graph(eid, depth=3)
+    brain.delete_entry(linker)
+    brain.list_entries(type_filter="note", last="7d")
+    brain.list_entries(tag_filter=["python", "x"])
+    brain.list_entries(tag_filter=["python", "x"], tag_match="any")
+    for type_filter in (None, "note"):
+        page = brain.list_entries_page(type_filter=type_filter, limit=5)
+        brain.list_entries_page(type_filter=type_filter, limit=5, after=page.next_cursor)
+        page = brain.list_entry_summaries_page(type_filter=type_filter, limit=5)
+        brain.list_entry_summaries_page(type_filter=type_filter, limit=5, after=page.next_cursor)
+    brain.list_entry_summaries(tag_filter=["python", "x"], tag_match="any")
+    brain.delete_entry(eid)
+
+    qid = quest.add_quest("Audit quest", repeat="daily")
+    quest.get_quest(qid)
+    quest.complete_quest(qid)
+    quest.reset_quest(qid)
+    quest.fail_quest(qid)
+    quest.list_quests(status=None)
+    quest.get_quest_history()
+    for status in (None, "completed"):
+        page = quest.list_quests_page(status=status, limit=5)
+        quest.list_quests_page(status=status, limit=5, after=page.next_cursor)
+    page = quest.get_quest_history_page(limit=5)
+    quest.get_quest_history_page(limit=5, after=page.next_cursor)
+    for status in (None, "active"):
+        page = quest.list_quest_summaries_page(status=status, limit=5)
+        quest.list_quest_summaries_page(status=status, limit=5, after=page.next_cursor)
+    page = quest.get_quest_history_summaries_page(last="30d", limit=5)
+    quest.get_quest_history_summaries_page(last="30d", limit=5, after=page.next_cursor)
+    quest.count_quests_completed()
+    quest.log_pomodoro(25)
+    quest.get_pomodoro_history()
+    quest.update_profile(streak_shields=1)
+    quest.delete_quest(qid)
+    achievements.get_all_achievements_with_status()
+
+    cosmos.log_mood(4, 7, "fine")
+    cosmos.get_today_mood()
+    page = cosmos.get_mood_history_page(days=365, limit=5)
+    cosmos.get_mood_history_page(days=365, limit=5, after=page.next_cursor)
+    page = cosmos.get_mood_summaries_page(days=365, limit=5)
+    cosmos.get_mood_summaries_page(days=365, limit=5, after=page.next_cursor)
+    cosmos.get_mood_stats()
+
+    forge.record_coding_day(commits=2, repos=["/src/a"])
+    forge.record_coding_day(commits=1, repos=["/src/b"])
+    forge.get_coding_day(date.today())
+    forge.get_streak_days(days=30)
+    forge.add_alias("gp", "git push")
+    forge.get_alias("gp")
+    forge.list_aliases()
+    forge.delete_alias("gp")
+    forge.add_template("t", "T", "/tmp/t")
+    forge.list_templates()
+    forge.delete_template("t")
+
+
+# ── Tests ───────────────────────────────────────────────────────────────────────
+
+def test_model_queries_do_not_scan_large_tables(auditor):
+    from benchmarks.generate import Sizes, populate
+    populate(Sizes.scaled(200))
+    _exercise_models()
+
+    unexpected = {sql: p for sql, p in auditor.scans().items() if sql not in ALLOWED_SCANS}
+    report = "\n".join(f"{sql}\n    " + "\n    ".join(p.details) for sql, p in unexpected.items())
+    assert not unexpected, f"full table scans:\n{report}"
+
+    stale = [sql for sql in ALLOWED_SCANS if sql in auditor.plans and not auditor.plans[sql].scans]
+    assert not stale, f"no longer scanning, remove from ALLOWED_SCANS: {stale}"
+    unused = [sql for sql in ALLOWED_SCANS if sql not in auditor.plans]
+    assert not unused, f"never executed, remove from ALLOWED_SCANS: {unused}"
+
+
+def test_explain_reports_scan_with_alias():
+    from synthevix.core.database import connection
+    from synthevix.core.queryplan import explain
+    plan = explain(connection(), "SELECT b.id FROM brain_entries b WHERE b.title = ?", ("x",))
+    assert plan.scans == ["brain_entries"]
+
+
+def test_explain_allows_limited_index_walk():
+    from synthevix.core.database import connection
+    from synthevix.core.queryplan import explain
+    plan = explain(connection(), "SELECT * FROM brain_entries ORDER BY created_at DESC LIMIT 5")
+    assert plan.scans == []
+    assert plan.details and plan.details[0].startswith("SCAN brain_entries USING INDEX")
+
+
+def test_explain_skips_non_queries():
+    from synthevix.core.database import connection
+    from synthevix.core.queryplan import explain
+    assert explain(connection(), "PRAGMA user_version") is None
+    assert explain(connection(), "INSERT INTO mood_logs (mood) VALUES (?)", (3,)) is None
+
+
+def test_debug_mode_warns_once_per_statement(capsys):
+    from synthevix.core import queryplan
+    from synthevix.core.database import connection
+    queryplan.enable()
+    try:
+        for _ in range(3):
+            connection().execute("SELECT * FROM quests WHERE title = ?", ("x",)).fetchall()
+    finally:
+        queryplan.disable()
+    err = capsys.readouterr().err
+    assert err.count("full scan of quests") == 1
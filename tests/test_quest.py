@@ -132,6 +132,40 @@ def test_get_profile_defaults():
     assert profile["current_streak"] == 0
 
 
+def test_quest_history_pages_skip_active_quests():
+    from synthevix.quest.models import add_quest, complete_quest, fail_quest, get_quest_history_page
+
+    done = [add_quest(f"Done {i}") for i in range(3)]
+    add_quest("Still active")
+    for qid in done[:2]:
+        complete_quest(qid)
+    fail_quest(done[2])
+
+    first = get_quest_history_page(limit=2)
+    second = get_quest_history_page(limit=2, after=first.next_cursor)
+    assert [q["id"] for q in first.items + second.items] == done[::-1]
+    assert second.next_cursor is None
+
+
+def test_quest_summaries_match_full_rows():
+    from synthevix.quest.models import (
+        QuestSummary, add_quest, complete_quest, get_quest_history_summaries_page,
+        list_quest_summaries, list_quests,
+    )
+
+    ids = [add_quest(f"Quest {i}", difficulty="hard", due_date="2030-01-01") for i in range(3)]
+    complete_quest(ids[0])
+
+    active = list_quest_summaries()
+    assert all(isinstance(q, QuestSummary) for q in active)
+    assert [(q.id, q.title, q.difficulty, q.due_date) for q in active] == \
+        [(q["id"], q["title"], q["difficulty"], q["due_date"]) for q in list_quests()]
+    history = get_quest_history_summaries_page(limit=1)
+    assert [(q.id, q.status) for q in history.items] == [(ids[0], "completed")]
+    assert history.items[0].xp_earned > 0 and history.items[0].completed_at
+    assert history.next_cursor is None
+
+
 def test_cannot_complete_already_completed_quest():
     from synthevix.quest.models import add_quest, complete_quest
 